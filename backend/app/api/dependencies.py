@@ -11,12 +11,23 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.repositories.project_repository import ProjectRepository
+from app.repositories.question_repository import QuestionRepository
 from app.models.project import Project
 
 
+def get_project_repo(db: AsyncSession = Depends(get_db)) -> ProjectRepository:
+    """Provide a ProjectRepository bound to the request's session."""
+    return ProjectRepository(db)
+
+
+def get_question_repo(db: AsyncSession = Depends(get_db)) -> QuestionRepository:
+    """Provide a QuestionRepository bound to the request's session."""
+    return QuestionRepository(db)
+
+
 async def get_project_or_404(
     project_id: Annotated[str, Path(description="The project ID")],
-    db: AsyncSession = Depends(get_db),
+    repo: ProjectRepository = Depends(get_project_repo),
 ) -> Project:
     """
     Get a project by ID or raise 404.
@@ -30,7 +41,6 @@ async def get_project_or_404(
             # project is guaranteed to exist
             ...
     """
-    repo = ProjectRepository(db)
     project = await repo.get_by_id(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -6,6 +6,7 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
+from openai import AsyncOpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
@@ -24,7 +25,9 @@ from app.schemas.feature import (
     FeatureBatchCreateResponse,
 )
 from app.config import settings
+from app.core.ai.client import openai_client_dependency
 from app.services.github.client import GitHubClient
+from app.utils.repository_formatting import get_formatted_sections
 
 logger = logging.getLogger(__name__)
 
@@ -174,18 +177,15 @@ async def generate_feature(
     project_id: str,
     request: FeatureGenerateRequest,
     db: AsyncSession = Depends(get_db),
+    client: AsyncOpenAI = Depends(openai_client_dependency),
 ):
     """Generate a feature specification using AI."""
-    from openai import AsyncOpenAI
-
     await verify_project_exists(project_id, db)
 
     # Get project context
     project_repo = ProjectRepository(db)
     project = await project_repo.get_by_id(project_id)
 
-    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
     prompt = f"""Generate a structured feature specification from this description:
 {request.description}
 
@@ -209,7 +209,6 @@ Return ONLY valid JSON, no markdown or explanation."""
         response_format={"type": "json_object"},
     )
 
-    import json
     feature_data = json.loads(response.choices[0].message.content)
 
     # Create the feature
@@ -342,6 +341,9 @@ async def discover_features_from_github(
             elif f.get("path") == "requirements.txt":
                 repo_analysis["requirements_txt"] = f.get("content")
 
+        # Format the prompt sections once here instead of in every agent
+        get_formatted_sections(repo_analysis)
+
         # Close client after successful fetch
         await github_client.close()
 
@@ -381,6 +383,7 @@ async def discover_features_from_github(
                 user_context=request.user_context,
                 max_features=request.max_features,
                 include_tech_debt=request.include_tech_debt,
+                use_cache=request.use_cache,
             ):
                 yield f"data: {json.dumps(event)}\n\n"
         except Exception as e:
@@ -513,6 +516,9 @@ async def extract_features_from_github(
             elif f.get("path") == "requirements.txt":
                 repo_analysis["requirements_txt"] = f.get("content")
 
+        # Format the prompt sections once here instead of in every agent
+        get_formatted_sections(repo_analysis)
+
         # Close client after successful fetch
         await github_client.close()
 
@@ -574,7 +580,7 @@ async def batch_create_features(
     await verify_project_exists(project_id, db)
 
     repo = FeatureRepository(db)
-    created_features = []
+    rows = []
 
     for candidate in request.features:
         # Map priority string to enum
@@ -583,7 +589,7 @@ async def batch_create_features(
         except ValueError:
             priority = FeaturePriority.MEDIUM
 
-        feature = await repo.create(
+        rows.append(dict(
             project_id=project_id,
             title=candidate.title,
             problem=candidate.problem,
@@ -593,8 +599,9 @@ async def batch_create_features(
             technical_notes=candidate.technical_notes,
             priority=priority,
             tags=candidate.tags,
-        )
-        created_features.append(feature)
+        ))
+
+    created_features = await repo.create_many(rows)
 
     return FeatureBatchCreateResponse(
         created=created_features,
@@ -21,6 +21,7 @@ from app.schemas.kpi import (
     KPIBatchCreateResponse,
 )
 from app.services.github.client import GitHubClient
+from app.utils.repository_formatting import get_formatted_sections
 
 logger = logging.getLogger(__name__)
 
@@ -283,6 +284,9 @@ async def discover_kpis_from_github(
             elif f.get("path") == "requirements.txt":
                 repo_analysis["requirements_txt"] = f.get("content")
 
+        # Format the prompt sections once here instead of in every agent
+        get_formatted_sections(repo_analysis)
+
         # Close client after successful fetch
         await github_client.close()
 
@@ -352,7 +356,7 @@ async def batch_create_kpis(
     await verify_project_exists(project_id, db)
 
     repo = KPIRepository(db)
-    created_kpis = []
+    rows = []
 
     for candidate in request.kpis:
         # Map category string to enum
@@ -367,7 +371,7 @@ async def batch_create_kpis(
         except ValueError:
             priority = KPIPriority.MEDIUM
 
-        kpi = await repo.create(
+        rows.append(dict(
             project_id=project_id,
             name=candidate.name,
             definition=candidate.definition,
@@ -380,8 +384,9 @@ async def batch_create_kpis(
             business_value=candidate.business_value,
             impact_areas=candidate.impact_areas,
             priority=priority,
-        )
-        created_kpis.append(kpi)
+        ))
+
+    created_kpis = await repo.create_many(rows)
 
     return KPIBatchCreateResponse(
         created=created_kpis,
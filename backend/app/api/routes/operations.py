@@ -9,7 +9,7 @@ Uses Multi-Agent architecture for high-quality diagram generation:
 
 import logging
 from fastapi import APIRouter, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 import json
@@ -48,6 +48,18 @@ DIAGRAM_CONFIG = ModuleConfig(
 )
 
 
+def _operation_json(result: dict) -> Response:
+    """
+    Validate a pipeline's final_response once and serialize it with
+    pydantic's Rust encoder, instead of letting FastAPI re-validate the
+    model and encode it again through jsonable_encoder and stdlib json.
+    """
+    return Response(
+        content=OperationResponse.model_validate(result).model_dump_json(),
+        media_type="application/json",
+    )
+
+
 @router.post(
     "/operations",
     response_model=OperationResponse,
@@ -106,7 +118,7 @@ async def execute_operation(request: Request, body: OperationRequest) -> Operati
             max_review_iterations=settings.MAX_REVIEW_ITERATIONS
         )
 
-        return OperationResponse(**result)
+        return _operation_json(result)
 
     # Fallback to LangGraph if available
     if is_langgraph_enabled():
@@ -120,7 +132,7 @@ async def execute_operation(request: Request, body: OperationRequest) -> Operati
             max_attempts=settings.DEFAULT_MAX_ATTEMPTS
         )
 
-        return OperationResponse(**result)
+        return _operation_json(result)
 
     # Final fallback to original single-shot method
     logger.info("[Diagrams] Using single-shot fallback")
@@ -1,9 +1,8 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
-from app.db.session import get_db
+from app.api.dependencies import get_project_repo
 from app.repositories.project_repository import ProjectRepository
 from app.schemas.project import (
     ProjectCreate,
@@ -21,10 +20,9 @@ router = APIRouter(prefix="/projects", tags=["Projects"])
 @router.post("/", response_model=ProjectResponse, status_code=201)
 async def create_project(
     project: ProjectCreate,
-    db: AsyncSession = Depends(get_db),
+    repo: ProjectRepository = Depends(get_project_repo),
 ):
     """Create a new project."""
-    repo = ProjectRepository(db)
     return await repo.create(**project.model_dump())
 
 
@@ -34,10 +32,9 @@ async def list_projects(
     page_size: int = Query(20, ge=1, le=100),
     status: Optional[ProjectStatus] = None,
     search: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    repo: ProjectRepository = Depends(get_project_repo),
 ):
     """List all projects with pagination and filtering."""
-    repo = ProjectRepository(db)
     skip = (page - 1) * page_size
 
     filters = {}
@@ -89,10 +86,9 @@ async def list_projects(
 @router.get("/{project_id}", response_model=ProjectDetailResponse)
 async def get_project(
     project_id: str,
-    db: AsyncSession = Depends(get_db),
+    repo: ProjectRepository = Depends(get_project_repo),
 ):
     """Get project details."""
-    repo = ProjectRepository(db)
     result = await repo.get_with_counts(project_id)
 
     if not result:
@@ -120,10 +116,9 @@ async def get_project(
 async def update_project(
     project_id: str,
     updates: ProjectUpdate,
-    db: AsyncSession = Depends(get_db),
+    repo: ProjectRepository = Depends(get_project_repo),
 ):
     """Update a project."""
-    repo = ProjectRepository(db)
     project = await repo.update(project_id, **updates.model_dump(exclude_unset=True))
 
     if not project:
@@ -132,14 +127,15 @@ async def update_project(
     return project
 
 
-@router.delete("/{project_id}", status_code=204)
+@router.delete("/{project_id}", status_code=204, response_class=Response)
 async def delete_project(
     project_id: str,
-    db: AsyncSession = Depends(get_db),
+    repo: ProjectRepository = Depends(get_project_repo),
 ):
     """Delete a project and all related entities."""
-    repo = ProjectRepository(db)
     deleted = await repo.delete(project_id)
 
     if not deleted:
         raise HTTPException(status_code=404, detail="Project not found")
+
+    return Response(status_code=204)
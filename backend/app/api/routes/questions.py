@@ -2,10 +2,9 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
-from app.db.session import get_db
+from app.api.dependencies import get_project_repo, get_question_repo
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.question_repository import QuestionRepository
 from app.models.question import QuestionStatus
@@ -20,11 +19,10 @@ router = APIRouter(tags=["Questions"])
 
 async def verify_project_exists(
     project_id: str,
-    db: AsyncSession,
+    project_repo: ProjectRepository,
 ) -> None:
     """Verify that the project exists."""
-    repo = ProjectRepository(db)
-    project = await repo.get_by_id(project_id)
+    project = await project_repo.get_by_id(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
@@ -38,12 +36,12 @@ async def list_questions(
     status: Optional[QuestionStatus] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    db: AsyncSession = Depends(get_db),
+    project_repo: ProjectRepository = Depends(get_project_repo),
+    repo: QuestionRepository = Depends(get_question_repo),
 ):
     """List all questions in a project."""
-    await verify_project_exists(project_id, db)
+    await verify_project_exists(project_id, project_repo)
 
-    repo = QuestionRepository(db)
     questions = await repo.get_by_project(
         project_id,
         status=status,
@@ -60,12 +58,12 @@ async def list_questions(
 async def get_question(
     project_id: str,
     question_id: str,
-    db: AsyncSession = Depends(get_db),
+    project_repo: ProjectRepository = Depends(get_project_repo),
+    repo: QuestionRepository = Depends(get_question_repo),
 ):
     """Get a specific question."""
-    await verify_project_exists(project_id, db)
+    await verify_project_exists(project_id, project_repo)
 
-    repo = QuestionRepository(db)
     question = await repo.get_by_id(question_id)
 
     if not question or question.project_id != project_id:
@@ -82,12 +80,12 @@ async def get_question(
 async def create_question(
     project_id: str,
     question: QuestionCreate,
-    db: AsyncSession = Depends(get_db),
+    project_repo: ProjectRepository = Depends(get_project_repo),
+    repo: QuestionRepository = Depends(get_question_repo),
 ):
     """Create a new question in a project."""
-    await verify_project_exists(project_id, db)
+    await verify_project_exists(project_id, project_repo)
 
-    repo = QuestionRepository(db)
     return await repo.create(
         project_id=project_id,
         question=question.question,
@@ -104,12 +102,12 @@ async def update_question(
     project_id: str,
     question_id: str,
     question_update: QuestionUpdate,
-    db: AsyncSession = Depends(get_db),
+    project_repo: ProjectRepository = Depends(get_project_repo),
+    repo: QuestionRepository = Depends(get_question_repo),
 ):
     """Update a question."""
-    await verify_project_exists(project_id, db)
+    await verify_project_exists(project_id, project_repo)
 
-    repo = QuestionRepository(db)
     question = await repo.get_by_id(question_id)
 
     if not question or question.project_id != project_id:
@@ -127,16 +125,17 @@ async def update_question(
 @router.delete(
     "/projects/{project_id}/questions/{question_id}",
     status_code=204,
+    response_class=Response,
 )
 async def delete_question(
     project_id: str,
     question_id: str,
-    db: AsyncSession = Depends(get_db),
+    project_repo: ProjectRepository = Depends(get_project_repo),
+    repo: QuestionRepository = Depends(get_question_repo),
 ):
     """Delete a question."""
-    await verify_project_exists(project_id, db)
+    await verify_project_exists(project_id, project_repo)
 
-    repo = QuestionRepository(db)
     question = await repo.get_by_id(question_id)
 
     if not question or question.project_id != project_id:
@@ -144,6 +143,8 @@ async def delete_question(
 
     await repo.delete(question_id)
 
+    return Response(status_code=204)
+
 
 @router.post(
     "/projects/{project_id}/questions/{question_id}/answer",
@@ -154,12 +155,12 @@ async def answer_question(
     question_id: str,
     answer: str,
     answered_by: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    project_repo: ProjectRepository = Depends(get_project_repo),
+    repo: QuestionRepository = Depends(get_question_repo),
 ):
     """Mark a question as answered."""
-    await verify_project_exists(project_id, db)
+    await verify_project_exists(project_id, project_repo)
 
-    repo = QuestionRepository(db)
     question = await repo.get_by_id(question_id)
 
     if not question or question.project_id != project_id:
@@ -1,15 +1,26 @@
 """WebSocket endpoint for Realtime API voice mode with multi-tool support"""
 
-import json
 import asyncio
 import logging
+import ssl
+from functools import lru_cache
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import orjson
+from pydantic import TypeAdapter
 import websockets
 
 from app.config import settings
 from app.services.realtime_session import get_session_config_with_context
 from app.services.operation_handler import operation_handler
-from app.models.operations import DiagramContext, ContextNode, ContextEdge
+from app.models.operations import (
+    DiagramContext,
+    ContextNode,
+    ContextEdge,
+    NodeModification,
+    EdgeModification,
+    GroupCreation,
+)
+from app.models.responses import PositionedNode, PositionedEdge
 from app.utils.prompts import build_context_prompt
 
 router = APIRouter()
@@ -17,11 +28,110 @@ logger = logging.getLogger(__name__)
 
 OPENAI_REALTIME_URL = "wss://api.openai.com/v1/realtime?model=gpt-4o-realtime-preview"
 
+# Shared across connections so the CA bundle is loaded once per worker
+# instead of on every websockets.connect()
+_OPENAI_SSL_CONTEXT = ssl.create_default_context()
+
+# Serializers for merge payload collections, built once per process
+_NODES_ADAPTER = TypeAdapter(list[PositionedNode])
+_NODE_MODS_ADAPTER = TypeAdapter(list[NodeModification])
+_EDGES_ADAPTER = TypeAdapter(list[PositionedEdge])
+_EDGE_MODS_ADAPTER = TypeAdapter(list[EdgeModification])
+_GROUPS_ADAPTER = TypeAdapter(list[GroupCreation])
+
+# Outgoing client frames are queued so consecutive audio deltas can be
+# coalesced into a single frame. Both limits keep memory bounded.
+CLIENT_QUEUE_SIZE = 256
+AUDIO_BATCH_MAX = 32
+
+# Inbound audio is queued for a dedicated uploader so a slow OpenAI write
+# never stops us from draining the client socket.
+UPLOAD_QUEUE_SIZE = 64
+
+
+def _dumps(payload: dict) -> str:
+    """Serialize a payload to a JSON text frame using orjson."""
+    return orjson.dumps(payload).decode()
+
+
+@lru_cache(maxsize=64)
+def _session_update_frame(context_prompt: str) -> str:
+    """Serialized session.update frame, memoized per context prompt."""
+    session_config = get_session_config_with_context(context_prompt)
+    return _dumps({"type": "session.update", "session": session_config})
+
+
+# Most connections start without diagram context; build that frame once
+_EMPTY_CONTEXT_SESSION_FRAME = _session_update_frame("")
+
+# Constant control frames, encoded once. Client frames are bytes (sent as-is
+# to binary clients); OpenAI frames are text.
+_READY_FRAME = orjson.dumps({"type": "ready"})
+_AUDIO_DONE_FRAME = orjson.dumps({"type": "audio_done"})
+_RESPONSE_DONE_FRAME = orjson.dumps({"type": "response_done"})
+_COMMIT_FRAME = _dumps({"type": "input_audio_buffer.commit"})
+_RESPONSE_CREATE_FRAME = _dumps({"type": "response.create"})
+
+_EVENT_TYPE_PREFIX = '{"type":"'
+_EVENT_TYPE_PREFIX_BYTES = _EVENT_TYPE_PREFIX.encode()
+
+
+def _peek_event_type(message: str | bytes) -> str | None:
+    """
+    Read an OpenAI event's type from the frame prefix without parsing it.
+
+    OpenAI frames start with the type field; returns None when the frame
+    doesn't, so callers fall back to a full parse.
+    """
+    prefix = _EVENT_TYPE_PREFIX if isinstance(message, str) else _EVENT_TYPE_PREFIX_BYTES
+    if not message.startswith(prefix):
+        return None
+    end = message.find(prefix[-1], len(prefix))
+    if end == -1:
+        return None
+    event_type = message[len(prefix):end]
+    return event_type if isinstance(event_type, str) else event_type.decode()
+
+
+async def _receive_client(websocket: WebSocket) -> tuple[dict, bool]:
+    """
+    Receive one JSON message from the client, bypassing Starlette's stdlib json.
+
+    Accepts both binary and text frames.
+
+    Returns:
+        The decoded message and whether it arrived as a binary frame
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+
+    raw = message.get("bytes")
+    if raw is not None:
+        return orjson.loads(raw), True
+    return orjson.loads(message.get("text") or "{}"), False
+
+
+async def _send_client(
+    websocket: WebSocket, payload: dict | bytes, binary: bool = False
+) -> None:
+    """Send a JSON frame (dict or pre-encoded bytes) to the client via orjson."""
+    data = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+    if binary:
+        await websocket.send_bytes(data)
+    else:
+        await websocket.send_text(data.decode())
+
 
 def parse_context_from_message(data: dict) -> DiagramContext:
-    """Parse diagram context from WebSocket message."""
+    """
+    Parse diagram context from WebSocket message.
+
+    The context is read-only downstream, so models are built with
+    model_construct() to skip per-field validation on large diagrams.
+    """
     nodes = [
-        ContextNode(
+        ContextNode.model_construct(
             id=n.get("id", ""),
             label=n.get("label", ""),
             nodeType=n.get("nodeType", "server"),
@@ -32,7 +142,7 @@ def parse_context_from_message(data: dict) -> DiagramContext:
         for n in data.get("nodes", [])
     ]
     edges = [
-        ContextEdge(
+        ContextEdge.model_construct(
             id=e.get("id", ""),
             source=e.get("source", ""),
             target=e.get("target", ""),
@@ -40,7 +150,7 @@ def parse_context_from_message(data: dict) -> DiagramContext:
         )
         for e in data.get("edges", [])
     ]
-    return DiagramContext(nodes=nodes, edges=edges)
+    return DiagramContext.model_construct(nodes=nodes, edges=edges)
 
 
 @router.websocket("/ws/realtime")
@@ -54,10 +164,15 @@ async def realtime_websocket(websocket: WebSocket):
     - Client sends: { type: "commit" } to finalize audio input
     - Server sends: { type: "ready" } when session is configured
     - Server sends: { type: "audio", data: "<base64 pcm16>" } for audio responses
+    - Server sends: { type: "audio_batch", data: ["<base64 pcm16>", ...] } when
+      several audio chunks were ready at once
     - Server sends: { type: "diagram", data: {...} } for full diagram generation
     - Server sends: { type: "merge", data: {...} } for incremental operations
     - Server sends: { type: "transcription", text: "..." } for real-time transcription
     - Server sends: { type: "error", message: "..." } on errors
+
+    Messages are JSON in either text or binary frames; server frames mirror
+    the frame type of the client's latest message.
     """
     await websocket.accept()
     logger.info("Client connected to realtime WebSocket")
@@ -65,6 +180,18 @@ async def realtime_websocket(websocket: WebSocket):
     # Store diagram context
     diagram_context: DiagramContext | None = None
 
+    # Frames bound for OpenAI: ("audio", base64 chunk) or ("frame", serialized)
+    upload_q: asyncio.Queue[tuple[str, str]] = asyncio.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+
+    # Set when the OpenAI stream ends so the remaining tasks can be cancelled
+    stop = asyncio.Event()
+
+    # Mirror the client's frame type (binary skips UTF-8 decoding on both ends)
+    client_binary = False
+
+    # Outgoing client frames: str items are audio deltas, dicts/bytes are sent as-is
+    out_q: asyncio.Queue[str | dict | bytes] = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+
     try:
         # Connect to OpenAI Realtime API
         async with websockets.connect(
@@ -73,38 +200,46 @@ async def realtime_websocket(websocket: WebSocket):
                 "Authorization": f"Bearer {settings.OPENAI_API_KEY}",
                 "OpenAI-Beta": "realtime=v1",
             },
+            ssl=_OPENAI_SSL_CONTEXT,
+            # Base64 PCM barely compresses; deflate only costs CPU per frame
+            compression=None,
+            max_size=2**24,
+            write_limit=2**20,
+            ping_interval=20,
+            ping_timeout=20,
         ) as openai_ws:
             logger.info("Connected to OpenAI Realtime API")
 
-            # Track current function call
-            current_arguments = ""
+            # Track current function call (argument deltas, joined on done)
+            current_arguments: list[str] = []
             session_configured = False
 
+            # Tool outputs are not auto-answered by OpenAI, but one
+            # response.create per response covers all of its tool calls
+            response_create_pending = False
+
             async def configure_session(context: DiagramContext | None = None):
                 """Configure the OpenAI session with optional diagram context."""
                 nonlocal session_configured
 
                 # Build context prompt
-                context_prompt = ""
                 if context and (context.nodes or context.edges):
                     context_prompt = build_context_prompt(context)
                     logger.info(f"Session configured with context: {len(context.nodes)} nodes")
+                    await upload_q.put(("frame", _session_update_frame(context_prompt)))
+                else:
+                    await upload_q.put(("frame", _EMPTY_CONTEXT_SESSION_FRAME))
 
-                # Get session config with context
-                session_config = get_session_config_with_context(context_prompt)
-
-                await openai_ws.send(
-                    json.dumps({"type": "session.update", "session": session_config})
-                )
                 session_configured = True
                 logger.info("Session configured with all 8 tools")
 
             async def forward_to_openai():
                 """Forward audio from client to OpenAI"""
-                nonlocal diagram_context, session_configured
+                nonlocal diagram_context, session_configured, client_binary
+                dropping_audio = False
                 try:
                     while True:
-                        message = await websocket.receive_json()
+                        message, client_binary = await _receive_client(websocket)
                         msg_type = message.get("type")
 
                         if msg_type == "context":
@@ -112,196 +247,289 @@ async def realtime_websocket(websocket: WebSocket):
                             diagram_context = parse_context_from_message(message.get("data", {}))
                             await configure_session(diagram_context)
                             # Notify client we're ready after context is set
-                            await websocket.send_json({"type": "ready"})
+                            await out_q.put(_READY_FRAME)
 
                         elif msg_type == "audio":
                             # Configure session if not done yet (no context case)
                             if not session_configured:
                                 await configure_session(None)
-                                await websocket.send_json({"type": "ready"})
-
-                            # Forward audio to OpenAI
-                            await openai_ws.send(
-                                json.dumps(
-                                    {
-                                        "type": "input_audio_buffer.append",
-                                        "audio": message.get("data", ""),
-                                    }
-                                )
-                            )
+                                await out_q.put(_READY_FRAME)
+
+                            # Queue audio for the uploader; drop on overflow
+                            try:
+                                upload_q.put_nowait(("audio", message.get("data", "")))
+                                dropping_audio = False
+                            except asyncio.QueueFull:
+                                if not dropping_audio:
+                                    logger.warning("OpenAI upload queue full, dropping audio")
+                                    await out_q.put({"type": "error", "message": "backpressure"})
+                                dropping_audio = True
+
                         elif msg_type == "commit":
                             # Commit audio buffer (manual turn detection)
-                            await openai_ws.send(
-                                json.dumps({"type": "input_audio_buffer.commit"})
-                            )
-                            await openai_ws.send(
-                                json.dumps({"type": "response.create"})
-                            )
+                            await upload_q.put(("frame", _COMMIT_FRAME))
+                            await upload_q.put(("frame", _RESPONSE_CREATE_FRAME))
 
                 except WebSocketDisconnect:
                     logger.info("Client disconnected")
                     raise
 
-            async def forward_to_client():
-                """Forward responses from OpenAI to client"""
-                nonlocal current_arguments
+            async def upload_to_openai():
+                """Drain queued frames to OpenAI, coalescing audio appends"""
+                while True:
+                    kind, data = await upload_q.get()
+                    pending: str | None = None
+
+                    if kind == "audio":
+                        # Base64 chunks concatenate cleanly unless a chunk is padded
+                        chunks = [data]
+                        while (
+                            len(chunks) < AUDIO_BATCH_MAX
+                            and not chunks[-1].endswith("=")
+                            and not upload_q.empty()
+                        ):
+                            next_kind, next_data = upload_q.get_nowait()
+                            if next_kind != "audio":
+                                pending = next_data
+                                break
+                            chunks.append(next_data)
+
+                        await openai_ws.send(
+                            _dumps(
+                                {
+                                    "type": "input_audio_buffer.append",
+                                    "audio": "".join(chunks),
+                                }
+                            )
+                        )
+                    else:
+                        pending = data
 
-                try:
-                    async for message in openai_ws:
-                        event = json.loads(message)
-                        event_type = event.get("type", "")
+                    if pending is not None:
+                        await openai_ws.send(pending)
 
-                        # Audio response - stream to client
-                        if event_type == "response.audio.delta":
-                            await websocket.send_json(
-                                {"type": "audio", "data": event.get("delta", "")}
-                            )
+            async def on_audio_delta(event: dict):
+                """Audio response - stream to client"""
+                await out_q.put(event.get("delta", ""))
 
-                        # Audio response complete
-                        elif event_type == "response.audio.done":
-                            await websocket.send_json({"type": "audio_done"})
+            async def on_audio_done(event: dict):
+                """Audio response complete"""
+                await out_q.put(_AUDIO_DONE_FRAME)
 
-                        # Real-time transcription of user speech
-                        elif event_type == "conversation.item.input_audio_transcription.completed":
-                            transcript = event.get("transcript", "")
-                            if transcript:
-                                await websocket.send_json(
-                                    {"type": "transcription", "text": transcript}
-                                )
+            async def on_transcription(event: dict):
+                """Real-time transcription of user speech"""
+                transcript = event.get("transcript", "")
+                if transcript:
+                    await out_q.put({"type": "transcription", "text": transcript})
 
-                        # Function call argument streaming
-                        elif event_type == "response.function_call_arguments.delta":
-                            current_arguments += event.get("delta", "")
+            async def on_arguments_delta(event: dict):
+                """Function call argument streaming"""
+                current_arguments.append(event.get("delta", ""))
 
-                        # Function call complete
-                        elif event_type == "response.function_call_arguments.done":
-                            call_id = event.get("call_id", "")
-                            name = event.get("name", "")
-                            arguments = event.get("arguments", current_arguments)
+            async def on_arguments_done(event: dict):
+                """Function call complete"""
+                nonlocal response_create_pending
+                call_id = event.get("call_id", "")
+                name = event.get("name", "")
+                arguments = event.get("arguments") or "".join(current_arguments)
 
-                            logger.info(f"Function call: {name} with call_id: {call_id}")
+                logger.info(f"Function call: {name} with call_id: {call_id}")
 
-                            try:
-                                args = json.loads(arguments)
-
-                                # Use the operation handler to process the tool call
-                                result = operation_handler.handle_tool_call(
-                                    tool_name=name,
-                                    arguments=args,
-                                    context=diagram_context
-                                )
-
-                                if result.success:
-                                    # Determine response type
-                                    if result.is_full_generation():
-                                        # Full diagram replacement
-                                        await websocket.send_json({
-                                            "type": "diagram",
-                                            "data": result.diagram.model_dump() if result.diagram else {}
-                                        })
-                                        tool_output = {
-                                            "success": True,
-                                            "operation": "generate",
-                                            "node_count": len(result.diagram.nodes) if result.diagram else 0
-                                        }
-                                    else:
-                                        # Incremental merge operation
-                                        await websocket.send_json({
-                                            "type": "merge",
-                                            "data": {
-                                                "operation_type": result.operation_type,
-                                                "nodes_to_add": [n.model_dump() for n in result.nodes_to_add],
-                                                "nodes_to_modify": [m.model_dump() for m in result.nodes_to_modify],
-                                                "nodes_to_delete": result.nodes_to_delete,
-                                                "edges_to_add": [e.model_dump() for e in result.edges_to_add],
-                                                "edges_to_modify": [m.model_dump() for m in result.edges_to_modify],
-                                                "edges_to_delete": result.edges_to_delete,
-                                                "groups_to_create": [g.model_dump() for g in result.groups_to_create],
-                                                "message": result.message
-                                            }
-                                        })
-                                        tool_output = {
-                                            "success": True,
-                                            "operation": result.operation_type,
-                                            "message": result.message
-                                        }
-
-                                    # Return success to OpenAI so it can respond
-                                    await openai_ws.send(
-                                        json.dumps({
-                                            "type": "conversation.item.create",
-                                            "item": {
-                                                "type": "function_call_output",
-                                                "call_id": call_id,
-                                                "output": json.dumps(tool_output)
-                                            }
-                                        })
-                                    )
-                                else:
-                                    # Operation failed
-                                    await openai_ws.send(
-                                        json.dumps({
-                                            "type": "conversation.item.create",
-                                            "item": {
-                                                "type": "function_call_output",
-                                                "call_id": call_id,
-                                                "output": json.dumps({
-                                                    "success": False,
-                                                    "error": result.message
-                                                })
-                                            }
-                                        })
-                                    )
-
-                                # Trigger response generation
-                                await openai_ws.send(
-                                    json.dumps({"type": "response.create"})
-                                )
-
-                            except json.JSONDecodeError as e:
-                                logger.error(f"Failed to parse function args: {e}", exc_info=True)
-                                await openai_ws.send(
-                                    json.dumps({
-                                        "type": "conversation.item.create",
-                                        "item": {
-                                            "type": "function_call_output",
-                                            "call_id": call_id,
-                                            "output": json.dumps({"error": "Invalid arguments"})
-                                        }
+                try:
+                    args = orjson.loads(arguments)
+
+                    # Process the tool call off the event loop so audio
+                    # forwarding isn't stalled by diagram building
+                    result = await asyncio.to_thread(
+                        operation_handler.handle_tool_call,
+                        tool_name=name,
+                        arguments=args,
+                        context=diagram_context
+                    )
+
+                    if result.success:
+                        # Determine response type
+                        if result.is_full_generation():
+                            # Full diagram replacement
+                            await out_q.put({
+                                "type": "diagram",
+                                "data": result.diagram.model_dump() if result.diagram else {}
+                            })
+                            tool_output = {
+                                "success": True,
+                                "operation": "generate",
+                                "node_count": len(result.diagram.nodes) if result.diagram else 0
+                            }
+                        else:
+                            # Incremental merge operation
+                            await out_q.put({
+                                "type": "merge",
+                                "data": {
+                                    "operation_type": result.operation_type,
+                                    "nodes_to_add": _NODES_ADAPTER.dump_python(result.nodes_to_add),
+                                    "nodes_to_modify": _NODE_MODS_ADAPTER.dump_python(result.nodes_to_modify),
+                                    "nodes_to_delete": result.nodes_to_delete,
+                                    "edges_to_add": _EDGES_ADAPTER.dump_python(result.edges_to_add),
+                                    "edges_to_modify": _EDGE_MODS_ADAPTER.dump_python(result.edges_to_modify),
+                                    "edges_to_delete": result.edges_to_delete,
+                                    "groups_to_create": _GROUPS_ADAPTER.dump_python(result.groups_to_create),
+                                    "message": result.message
+                                }
+                            })
+                            tool_output = {
+                                "success": True,
+                                "operation": result.operation_type,
+                                "message": result.message
+                            }
+
+                        # Return success to OpenAI so it can respond
+                        await openai_ws.send(
+                            _dumps({
+                                "type": "conversation.item.create",
+                                "item": {
+                                    "type": "function_call_output",
+                                    "call_id": call_id,
+                                    "output": _dumps(tool_output)
+                                }
+                            })
+                        )
+                    else:
+                        # Operation failed
+                        await openai_ws.send(
+                            _dumps({
+                                "type": "conversation.item.create",
+                                "item": {
+                                    "type": "function_call_output",
+                                    "call_id": call_id,
+                                    "output": _dumps({
+                                        "success": False,
+                                        "error": result.message
                                     })
-                                )
-                                await openai_ws.send(
-                                    json.dumps({"type": "response.create"})
-                                )
-
-                            # Reset for next call
-                            current_arguments = ""
-
-                        # Response completed
-                        elif event_type == "response.done":
-                            await websocket.send_json({"type": "response_done"})
-
-                        # Error handling
-                        elif event_type == "error":
-                            error = event.get("error", {})
-                            logger.error(f"OpenAI error: {error}")
-                            await websocket.send_json({
-                                "type": "error",
-                                "message": error.get("message", "Unknown error")
+                                }
                             })
+                        )
+
+                    # Trigger response generation once the current response is done
+                    response_create_pending = True
+
+                except orjson.JSONDecodeError as e:
+                    logger.error(f"Failed to parse function args: {e}", exc_info=True)
+                    await openai_ws.send(
+                        _dumps({
+                            "type": "conversation.item.create",
+                            "item": {
+                                "type": "function_call_output",
+                                "call_id": call_id,
+                                "output": _dumps({"error": "Invalid arguments"})
+                            }
+                        })
+                    )
+                    response_create_pending = True
+
+                # Reset for next call
+                current_arguments.clear()
+
+            async def on_response_done(event: dict):
+                """Response completed"""
+                nonlocal response_create_pending
+                await out_q.put(_RESPONSE_DONE_FRAME)
+
+                if response_create_pending:
+                    response_create_pending = False
+                    await openai_ws.send(_RESPONSE_CREATE_FRAME)
+
+            async def on_error(event: dict):
+                """Error handling"""
+                error = event.get("error", {})
+                logger.error(f"OpenAI error: {error}")
+                await out_q.put({
+                    "type": "error",
+                    "message": error.get("message", "Unknown error")
+                })
+
+            # Event types we act on; everything else is skipped
+            event_handlers = {
+                "response.audio.delta": on_audio_delta,
+                "response.audio.done": on_audio_done,
+                "conversation.item.input_audio_transcription.completed": on_transcription,
+                "response.function_call_arguments.delta": on_arguments_delta,
+                "response.function_call_arguments.done": on_arguments_done,
+                "response.done": on_response_done,
+                "error": on_error,
+            }
+
+            async def forward_to_client():
+                """Forward responses from OpenAI to client"""
+                try:
+                    async for message in openai_ws:
+                        # Skip the full parse for events nobody handles
+                        event_type = _peek_event_type(message)
+                        if event_type is not None and event_type not in event_handlers:
+                            continue
+
+                        event = orjson.loads(message)
+                        handler = event_handlers.get(event.get("type", ""))
+                        if handler is not None:
+                            await handler(event)
 
                 except websockets.exceptions.ConnectionClosed:
                     logger.info("OpenAI connection closed")
                     raise
-
-            # Run both tasks concurrently
-            await asyncio.gather(forward_to_openai(), forward_to_client())
-
-    except WebSocketDisconnect:
+                finally:
+                    # A clean upstream close ends the iterator without raising
+                    stop.set()
+
+            async def send_to_client():
+                """Drain queued frames to the client, coalescing audio deltas"""
+                while True:
+                    item = await out_q.get()
+                    pending: dict | bytes | None = None
+
+                    if isinstance(item, str):
+                        batch = [item]
+                        while len(batch) < AUDIO_BATCH_MAX and not out_q.empty():
+                            next_item = out_q.get_nowait()
+                            if not isinstance(next_item, str):
+                                pending = next_item
+                                break
+                            batch.append(next_item)
+
+                        if len(batch) == 1:
+                            await _send_client(
+                                websocket, {"type": "audio", "data": batch[0]}, client_binary
+                            )
+                        else:
+                            await _send_client(
+                                websocket, {"type": "audio_batch", "data": batch}, client_binary
+                            )
+                    else:
+                        pending = item
+
+                    if pending is not None:
+                        await _send_client(websocket, pending, client_binary)
+
+            # Run the proxy loops, the uploader and the client sender concurrently.
+            # The first failure (e.g. client disconnect) cancels the siblings;
+            # a clean OpenAI close sets `stop` and cancels them explicitly.
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(forward_to_openai()),
+                    tg.create_task(upload_to_openai()),
+                    tg.create_task(forward_to_client()),
+                    tg.create_task(send_to_client()),
+                ]
+                await stop.wait()
+                for task in tasks:
+                    task.cancel()
+
+    except* WebSocketDisconnect:
         logger.info("WebSocket disconnected")
-    except Exception as e:
-        logger.error(f"Realtime WebSocket error: {e}", exc_info=True)
+    except* Exception as eg:
+        e = eg.exceptions[0]
+        logger.error(f"Realtime WebSocket error: {e}", exc_info=e)
         try:
-            await websocket.send_json({"type": "error", "message": str(e)})
+            await _send_client(
+                websocket, {"type": "error", "message": str(e)}, client_binary
+            )
         except Exception:
             pass  # Client already disconnected, nothing we can do
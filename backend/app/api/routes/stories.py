@@ -3,6 +3,8 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
@@ -17,6 +19,9 @@ from app.schemas.story import (
 
 router = APIRouter(tags=["Stories"])
 
+# Validates ORM rows and dumps them in one pass for ORJSONResponse
+_STORY_LIST_ADAPTER = TypeAdapter(List[StoryResponse])
+
 
 async def verify_project_exists(
     project_id: str,
@@ -32,6 +37,7 @@ async def verify_project_exists(
 @router.get(
     "/projects/{project_id}/stories",
     response_model=List[StoryResponse],
+    response_class=ORJSONResponse,
 )
 async def list_stories(
     project_id: str,
@@ -52,7 +58,8 @@ async def list_stories(
         skip=skip,
         limit=limit,
     )
-    return stories
+    items = _STORY_LIST_ADAPTER.validate_python(stories, from_attributes=True)
+    return ORJSONResponse(_STORY_LIST_ADAPTER.dump_python(items, mode="json"))
 
 
 @router.get(
@@ -65,12 +72,10 @@ async def get_story(
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific story."""
-    await verify_project_exists(project_id, db)
-
     repo = StoryRepository(db)
-    story = await repo.get_by_id(story_id)
+    story = await repo.get_by_id_with_project(story_id, project_id)
 
-    if not story or story.project_id != project_id:
+    if not story:
         raise HTTPException(status_code=404, detail="Story not found")
 
     return story
@@ -116,12 +121,10 @@ async def update_story(
     db: AsyncSession = Depends(get_db),
 ):
     """Update a story."""
-    await verify_project_exists(project_id, db)
-
     repo = StoryRepository(db)
-    story = await repo.get_by_id(story_id)
+    story = await repo.get_by_id_with_project(story_id, project_id)
 
-    if not story or story.project_id != project_id:
+    if not story:
         raise HTTPException(status_code=404, detail="Story not found")
 
     update_data = story_update.model_dump(exclude_unset=True)
@@ -143,12 +146,10 @@ async def delete_story(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a story."""
-    await verify_project_exists(project_id, db)
-
     repo = StoryRepository(db)
-    story = await repo.get_by_id(story_id)
+    story = await repo.get_by_id_with_project(story_id, project_id)
 
-    if not story or story.project_id != project_id:
+    if not story:
         raise HTTPException(status_code=404, detail="Story not found")
 
     await repo.delete(story_id)
@@ -165,9 +166,7 @@ async def bulk_update_status(
     db: AsyncSession = Depends(get_db),
 ):
     """Update status for multiple stories."""
-    await verify_project_exists(project_id, db)
-
     repo = StoryRepository(db)
-    count = await repo.bulk_update_status(story_ids, status)
+    count = await repo.bulk_update_status(story_ids, status, project_id=project_id)
 
     return {"updated": count}
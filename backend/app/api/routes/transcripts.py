@@ -1,10 +1,14 @@
 """API routes for Transcripts."""
 
+from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.db.session import get_db
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.transcript_repository import TranscriptRepository
@@ -18,6 +22,9 @@ from app.schemas.transcript import (
 
 router = APIRouter(tags=["Transcripts"])
 
+# Validates ORM rows and dumps them in one pass for ORJSONResponse
+_TRANSCRIPT_LIST_ADAPTER = TypeAdapter(List[TranscriptListResponse])
+
 
 async def verify_project_exists(
     project_id: str,
@@ -33,6 +40,7 @@ async def verify_project_exists(
 @router.get(
     "/projects/{project_id}/transcripts",
     response_model=List[TranscriptListResponse],
+    response_class=ORJSONResponse,
 )
 async def list_transcripts(
     project_id: str,
@@ -53,7 +61,8 @@ async def list_transcripts(
         skip=skip,
         limit=limit,
     )
-    return transcripts
+    items = _TRANSCRIPT_LIST_ADAPTER.validate_python(transcripts, from_attributes=True)
+    return ORJSONResponse(_TRANSCRIPT_LIST_ADAPTER.dump_python(items, mode="json"))
 
 
 @router.get(
@@ -66,12 +75,10 @@ async def get_transcript(
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific transcript with full content."""
-    await verify_project_exists(project_id, db)
-
     repo = TranscriptRepository(db)
-    transcript = await repo.get_by_id(transcript_id)
+    transcript = await repo.get_by_id_with_project(transcript_id, project_id)
 
-    if not transcript or transcript.project_id != project_id:
+    if not transcript:
         raise HTTPException(status_code=404, detail="Transcript not found")
 
     return transcript
@@ -87,7 +94,17 @@ async def create_transcript(
     transcript: TranscriptCreate,
     db: AsyncSession = Depends(get_db),
 ):
-    """Upload a new transcript to a project."""
+    """
+    Upload a new transcript to a project.
+
+    Large transcripts must use the streaming upload endpoint instead.
+    """
+    if len(transcript.raw_content.encode("utf-8")) > settings.TRANSCRIPT_JSON_MAX_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail="Transcript too large, use /transcripts/upload instead",
+        )
+
     await verify_project_exists(project_id, db)
 
     repo = TranscriptRepository(db)
@@ -103,6 +120,54 @@ async def create_transcript(
     )
 
 
+@router.post(
+    "/projects/{project_id}/transcripts/upload",
+    response_model=TranscriptResponse,
+    status_code=201,
+)
+async def upload_transcript(
+    project_id: str,
+    request: Request,
+    title: str = Query(..., min_length=1, max_length=255),
+    source: TranscriptSource = Query(...),
+    participants: List[str] = Query([]),
+    duration_seconds: Optional[int] = Query(None),
+    meeting_date: Optional[datetime] = Query(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Upload a transcript as a raw UTF-8 request body.
+
+    The body is streamed in chunks and decoded once, skipping JSON
+    parsing and string unescaping for multi-MB transcripts. Metadata is
+    passed as query parameters.
+    """
+    await verify_project_exists(project_id, db)
+
+    buffer = bytearray()
+    async for chunk in request.stream():
+        buffer.extend(chunk)
+        if len(buffer) > settings.TRANSCRIPT_UPLOAD_MAX_BYTES:
+            raise HTTPException(status_code=413, detail="Transcript too large")
+
+    try:
+        raw_content = buffer.decode("utf-8")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Transcript must be UTF-8 text")
+
+    repo = TranscriptRepository(db)
+    return await repo.create(
+        project_id=project_id,
+        title=title,
+        source=source,
+        raw_content=raw_content,
+        participants=participants,
+        duration_seconds=duration_seconds,
+        meeting_date=meeting_date,
+        processing_status=ProcessingStatus.PENDING,
+    )
+
+
 @router.patch(
     "/projects/{project_id}/transcripts/{transcript_id}",
     response_model=TranscriptResponse,
@@ -114,12 +179,10 @@ async def update_transcript(
     db: AsyncSession = Depends(get_db),
 ):
     """Update a transcript."""
-    await verify_project_exists(project_id, db)
-
     repo = TranscriptRepository(db)
-    transcript = await repo.get_by_id(transcript_id)
+    transcript = await repo.get_by_id_with_project(transcript_id, project_id)
 
-    if not transcript or transcript.project_id != project_id:
+    if not transcript:
         raise HTTPException(status_code=404, detail="Transcript not found")
 
     update_data = transcript_update.model_dump(exclude_unset=True)
@@ -141,12 +204,10 @@ async def delete_transcript(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a transcript."""
-    await verify_project_exists(project_id, db)
-
     repo = TranscriptRepository(db)
-    transcript = await repo.get_by_id(transcript_id)
+    transcript = await repo.get_by_id_with_project(transcript_id, project_id)
 
-    if not transcript or transcript.project_id != project_id:
+    if not transcript:
         raise HTTPException(status_code=404, detail="Transcript not found")
 
     await repo.delete(transcript_id)
@@ -162,12 +223,10 @@ async def trigger_processing(
     db: AsyncSession = Depends(get_db),
 ):
     """Trigger AI processing for a transcript."""
-    await verify_project_exists(project_id, db)
-
     repo = TranscriptRepository(db)
-    transcript = await repo.get_by_id(transcript_id)
+    transcript = await repo.get_by_id_with_project(transcript_id, project_id)
 
-    if not transcript or transcript.project_id != project_id:
+    if not transcript:
         raise HTTPException(status_code=404, detail="Transcript not found")
 
     # Mark as processing
@@ -1,12 +1,20 @@
 """API routes for User Journeys."""
 
-from typing import List, Optional
-import uuid
+import logging
+import secrets
+from typing import List, Optional, Tuple
 
+import ijson
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from openai import AsyncOpenAI
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, async_session_maker
+from app.repositories.base import is_foreign_key_violation
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.user_journey_repository import UserJourneyRepository
 from app.models.user_journey import JourneyStatus
@@ -18,9 +26,41 @@ from app.schemas.user_journey import (
     UserJourneyGenerateResponse,
 )
 from app.config import settings
+from app.core.ai.client import coalesce, openai_client_dependency
+from app.core.ai.response_cache import get_response_cache, make_cache_key
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["User Journeys"])
 
+# Validates ORM rows and dumps them in one pass for ORJSONResponse
+_JOURNEY_LIST_ADAPTER = TypeAdapter(List[UserJourneyResponse])
+
+JOURNEY_SYSTEM_PROMPT = """You generate detailed user journey maps.
+
+Return a JSON object with:
+- title: journey title
+- persona: the persona name
+- description: brief description of this journey
+- phases: array of phases, each with:
+  - id: unique id like "phase_1"
+  - name: phase name (e.g., "Discovery", "Consideration", "Action", "Retention")
+  - order: numeric order starting from 0
+- steps: array of steps, each with:
+  - id: unique id like "step_1"
+  - phase_id: reference to parent phase id
+  - action: what the user does
+  - touchpoint: channel (web, mobile, email, support, etc.)
+  - emotion: satisfaction level 1-5 (1=frustrated, 5=delighted)
+  - thought: what the user thinks
+  - pain_point: frustration if any (null if none)
+  - opportunity: improvement opportunity if any (null if none)
+  - order: numeric order within phase
+- tags: relevant tags
+
+Create 4-6 phases with 1-3 steps each. Be specific and realistic.
+Return ONLY valid JSON, no markdown or explanation."""
+
 
 async def verify_project_exists(
     project_id: str,
@@ -28,14 +68,14 @@ async def verify_project_exists(
 ) -> None:
     """Verify that the project exists."""
     repo = ProjectRepository(db)
-    project = await repo.get_by_id(project_id)
-    if not project:
+    if not await repo.exists(project_id):
         raise HTTPException(status_code=404, detail="Project not found")
 
 
 @router.get(
     "/projects/{project_id}/journeys",
     response_model=List[UserJourneyResponse],
+    response_class=ORJSONResponse,
 )
 async def list_journeys(
     project_id: str,
@@ -54,7 +94,8 @@ async def list_journeys(
         skip=skip,
         limit=limit,
     )
-    return journeys
+    items = _JOURNEY_LIST_ADAPTER.validate_python(journeys, from_attributes=True)
+    return ORJSONResponse(_JOURNEY_LIST_ADAPTER.dump_python(items, mode="json"))
 
 
 @router.get(
@@ -67,12 +108,10 @@ async def get_journey(
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific user journey."""
-    await verify_project_exists(project_id, db)
-
     repo = UserJourneyRepository(db)
-    journey = await repo.get_by_id(journey_id)
+    journey = await repo.get_by_id_with_project(journey_id, project_id)
 
-    if not journey or journey.project_id != project_id:
+    if not journey:
         raise HTTPException(status_code=404, detail="User journey not found")
 
     return journey
@@ -89,22 +128,27 @@ async def create_journey(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new user journey in a project."""
-    await verify_project_exists(project_id, db)
-
     # Convert Pydantic models to dicts for JSONB storage
     phases_data = [p.model_dump() for p in journey.phases]
     steps_data = [s.model_dump() for s in journey.steps]
 
+    # The project_id foreign key doubles as the existence check
     repo = UserJourneyRepository(db)
-    return await repo.create(
-        project_id=project_id,
-        title=journey.title,
-        persona=journey.persona,
-        description=journey.description,
-        phases=phases_data,
-        steps=steps_data,
-        tags=journey.tags,
-    )
+    try:
+        return await repo.create(
+            project_id=project_id,
+            title=journey.title,
+            persona=journey.persona,
+            description=journey.description,
+            phases=phases_data,
+            steps=steps_data,
+            tags=journey.tags,
+        )
+    except IntegrityError as e:
+        # Postgres' default name for the project_id foreign key
+        if is_foreign_key_violation(e, "user_journeys_project_id_fkey"):
+            raise HTTPException(status_code=404, detail="Project not found")
+        raise
 
 
 @router.patch(
@@ -118,22 +162,15 @@ async def update_journey(
     db: AsyncSession = Depends(get_db),
 ):
     """Update a user journey."""
-    await verify_project_exists(project_id, db)
-
     repo = UserJourneyRepository(db)
-    journey = await repo.get_by_id(journey_id)
+    journey = await repo.get_by_id_with_project(journey_id, project_id)
 
-    if not journey or journey.project_id != project_id:
+    if not journey:
         raise HTTPException(status_code=404, detail="User journey not found")
 
+    # model_dump() recursively dumps nested phases/steps to plain dicts
     update_data = journey_update.model_dump(exclude_unset=True)
 
-    # Convert Pydantic models to dicts if present
-    if "phases" in update_data and update_data["phases"]:
-        update_data["phases"] = [p.model_dump() if hasattr(p, "model_dump") else p for p in update_data["phases"]]
-    if "steps" in update_data and update_data["steps"]:
-        update_data["steps"] = [s.model_dump() if hasattr(s, "model_dump") else s for s in update_data["steps"]]
-
     updated = await repo.update(journey_id, **update_data)
 
     if not updated:
@@ -152,17 +189,85 @@ async def delete_journey(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a user journey."""
-    await verify_project_exists(project_id, db)
-
     repo = UserJourneyRepository(db)
-    journey = await repo.get_by_id(journey_id)
+    journey = await repo.get_by_id_with_project(journey_id, project_id)
 
-    if not journey or journey.project_id != project_id:
+    if not journey:
         raise HTTPException(status_code=404, detail="User journey not found")
 
     await repo.delete(journey_id)
 
 
+def _build_journey_prompt(project, request: UserJourneyGenerateRequest) -> str:
+    """Build the short per-request user prompt for journey generation."""
+    return f"""Generate a detailed user journey map for:
+Persona: {request.persona}
+Goal: {request.goal}
+Project context: {project.name} - {project.description or 'No description'}"""
+
+
+def _normalize_phase(phase: dict, index: int) -> dict:
+    """Ensure a generated phase has an ID and order."""
+    if "id" not in phase:
+        phase["id"] = f"phase_{secrets.token_hex(4)}"
+    if "order" not in phase:
+        phase["order"] = index
+    return phase
+
+
+def _normalize_step(step: dict, index: int) -> dict:
+    """Ensure a generated step has an ID and order."""
+    if "id" not in step:
+        step["id"] = f"step_{secrets.token_hex(4)}"
+    if "order" not in step:
+        step["order"] = index
+    return step
+
+
+def _journey_fields(
+    journey_data: dict,
+    request: UserJourneyGenerateRequest,
+    phases: List[dict],
+    steps: List[dict],
+) -> dict:
+    """Map generated journey JSON to repository create() fields."""
+    return {
+        "title": journey_data.get("title", f"Journey: {request.persona}"),
+        "persona": journey_data.get("persona", request.persona),
+        "description": journey_data.get("description"),
+        "phases": phases,
+        "steps": steps,
+        "tags": journey_data.get("tags", []),
+    }
+
+
+class _JourneyItemParser:
+    """
+    Incremental parser for streamed journey JSON.
+
+    Feeds model output into ijson push parsers and returns each phase and
+    step object as soon as it is complete, before the full document has
+    arrived.
+    """
+
+    def __init__(self):
+        self._phases = ijson.sendable_list()
+        self._steps = ijson.sendable_list()
+        self._phase_coro = ijson.items_coro(self._phases, "phases.item", use_float=True)
+        self._step_coro = ijson.items_coro(self._steps, "steps.item", use_float=True)
+
+    def feed(self, text: str) -> List[Tuple[str, dict]]:
+        """Feed a chunk of output, returning newly completed (kind, item) pairs."""
+        data = text.encode()
+        self._phase_coro.send(data)
+        self._step_coro.send(data)
+
+        items = [("phase", p) for p in self._phases] + [("step", s) for s in self._steps]
+        del self._phases[:]
+        del self._steps[:]
+        return items
+
+
 @router.post(
     "/projects/{project_id}/journeys/generate",
     response_model=UserJourneyGenerateResponse,
@@ -171,78 +276,178 @@ async def generate_journey(
     project_id: str,
     request: UserJourneyGenerateRequest,
     db: AsyncSession = Depends(get_db),
+    client: AsyncOpenAI = Depends(openai_client_dependency),
 ):
     """Generate a user journey using AI."""
-    from openai import AsyncOpenAI
-
-    await verify_project_exists(project_id, db)
-
-    # Get project context
+    # Get project context (also serves as the existence check)
     project_repo = ProjectRepository(db)
     project = await project_repo.get_by_id(project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
 
-    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
-    prompt = f"""Generate a detailed user journey map for:
-Persona: {request.persona}
-Goal: {request.goal}
-Project context: {project.name} - {project.description or 'No description'}
-
-Return a JSON object with:
-- title: journey title
-- persona: the persona name
-- description: brief description of this journey
-- phases: array of phases, each with:
-  - id: unique id like "phase_1"
-  - name: phase name (e.g., "Discovery", "Consideration", "Action", "Retention")
-  - order: numeric order starting from 0
-- steps: array of steps, each with:
-  - id: unique id like "step_1"
-  - phase_id: reference to parent phase id
-  - action: what the user does
-  - touchpoint: channel (web, mobile, email, support, etc.)
-  - emotion: satisfaction level 1-5 (1=frustrated, 5=delighted)
-  - thought: what the user thinks
-  - pain_point: frustration if any (null if none)
-  - opportunity: improvement opportunity if any (null if none)
-  - order: numeric order within phase
-- tags: relevant tags
-
-Create 4-6 phases with 1-3 steps each. Be specific and realistic.
-Return ONLY valid JSON, no markdown or explanation."""
+    # Static instructions go first (system) so OpenAI's prefix cache can reuse
+    # them; only the short per-request context varies.
+    user_prompt = _build_journey_prompt(project, request)
 
-    response = await client.chat.completions.create(
-        model=settings.MODEL_CODE_ANALYZER,
-        messages=[{"role": "user", "content": prompt}],
-        response_format={"type": "json_object"},
+    # Identical prompts return the cached journey instead of a new LLM call,
+    # unless the client asks to regenerate
+    cache = get_response_cache()
+    cache_key = make_cache_key(
+        settings.MODEL_CODE_ANALYZER, JOURNEY_SYSTEM_PROMPT, user_prompt
     )
-
-    import json
-    journey_data = json.loads(response.choices[0].message.content)
+    content = await cache.get(cache_key) if request.use_cache else None
+
+    async def generate() -> str:
+        response = await client.chat.completions.create(
+            model=settings.MODEL_CODE_ANALYZER,
+            messages=[
+                {"role": "system", "content": JOURNEY_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            response_format={"type": "json_object"},
+            extra_body={"prompt_cache_key": "user-journey-generate"},
+        )
+        content = response.choices[0].message.content
+        if request.use_cache:
+            await cache.set(cache_key, content)
+        return content
+
+    if not request.use_cache:
+        content = await generate()
+    elif content is None:
+        # Duplicate submissions in flight share one call
+        content = await coalesce(cache_key, generate)
+
+    journey_data = orjson.loads(content)
 
     # Ensure all phases and steps have proper IDs
-    for i, phase in enumerate(journey_data.get("phases", [])):
-        if "id" not in phase:
-            phase["id"] = f"phase_{uuid.uuid4().hex[:8]}"
-        if "order" not in phase:
-            phase["order"] = i
-
-    for i, step in enumerate(journey_data.get("steps", [])):
-        if "id" not in step:
-            step["id"] = f"step_{uuid.uuid4().hex[:8]}"
-        if "order" not in step:
-            step["order"] = i
+    phases = [_normalize_phase(p, i) for i, p in enumerate(journey_data.get("phases", []))]
+    steps = [_normalize_step(s, i) for i, s in enumerate(journey_data.get("steps", []))]
 
     # Create the journey
     repo = UserJourneyRepository(db)
     journey = await repo.create(
         project_id=project_id,
-        title=journey_data.get("title", f"Journey: {request.persona}"),
-        persona=journey_data.get("persona", request.persona),
-        description=journey_data.get("description"),
-        phases=journey_data.get("phases", []),
-        steps=journey_data.get("steps", []),
-        tags=journey_data.get("tags", []),
+        **_journey_fields(journey_data, request, phases, steps),
     )
 
     return UserJourneyGenerateResponse(journey=journey)
+
+
+@router.post(
+    "/projects/{project_id}/journeys/generate/stream",
+)
+async def generate_journey_stream(
+    project_id: str,
+    request: UserJourneyGenerateRequest,
+    db: AsyncSession = Depends(get_db),
+    client: AsyncOpenAI = Depends(openai_client_dependency),
+):
+    """
+    Generate a user journey using AI, streaming it as it is produced.
+
+    Returns a Server-Sent Events (SSE) stream with a "phase" or "step"
+    event for each item as soon as it is parsed, then a "complete" event
+    carrying the persisted journey.
+    """
+    project_repo = ProjectRepository(db)
+    project = await project_repo.get_by_id(project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    user_prompt = _build_journey_prompt(project, request)
+    cache = get_response_cache()
+    cache_key = make_cache_key(
+        settings.MODEL_CODE_ANALYZER, JOURNEY_SYSTEM_PROMPT, user_prompt
+    )
+
+    def sse(event: dict) -> str:
+        return f"data: {orjson.dumps(event).decode()}\n\n"
+
+    async def event_generator():
+        phases: List[dict] = []
+        steps: List[dict] = []
+
+        def emit(kind: str, item: dict) -> str:
+            if kind == "phase":
+                phases.append(_normalize_phase(item, len(phases)))
+                return sse({"type": "phase", "phase": item})
+            steps.append(_normalize_step(item, len(steps)))
+            return sse({"type": "step", "step": item})
+
+        try:
+            content = await cache.get(cache_key) if request.use_cache else None
+
+            if content is None:
+                parser = _JourneyItemParser()
+                parts: List[str] = []
+
+                stream = await client.chat.completions.create(
+                    model=settings.MODEL_CODE_ANALYZER,
+                    messages=[
+                        {"role": "system", "content": JOURNEY_SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    response_format={"type": "json_object"},
+                    extra_body={"prompt_cache_key": "user-journey-generate"},
+                    stream=True,
+                )
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    parts.append(delta)
+
+                    if parser is not None:
+                        try:
+                            items = parser.feed(delta)
+                        except ijson.JSONError as e:
+                            # The rest is emitted from the full document at the end
+                            logger.warning(f"Incremental journey parse failed: {e}")
+                            parser = None
+                            continue
+                        for kind, item in items:
+                            yield emit(kind, item)
+
+                content = "".join(parts)
+                if request.use_cache:
+                    await cache.set(cache_key, content)
+
+            journey_data = orjson.loads(content)
+
+            # Items not already streamed (cache hit, or the incremental parse
+            # stopped early); the parser emits in document order, so the
+            # first len(phases) phases and len(steps) steps were already sent
+            for phase in journey_data.get("phases", [])[len(phases):]:
+                yield emit("phase", phase)
+            for step in journey_data.get("steps", [])[len(steps):]:
+                yield emit("step", step)
+
+            # The request session is closed once streaming starts, so persist
+            # with a dedicated one.
+            async with async_session_maker() as session:
+                repo = UserJourneyRepository(session)
+                journey = await repo.create(
+                    project_id=project_id,
+                    **_journey_fields(journey_data, request, phases, steps),
+                )
+                await session.commit()
+
+            journey_out = UserJourneyResponse.model_validate(journey).model_dump(mode="json")
+            yield sse({"type": "complete", "journey": journey_out})
+
+        except Exception as e:
+            logger.error(f"Journey generation error: {e}", exc_info=True)
+            yield sse({"type": "error", "message": str(e)})
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        }
+    )
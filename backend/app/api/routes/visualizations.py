@@ -1,10 +1,14 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.repositories.project_repository import ProjectRepository
+from app.repositories.base import is_foreign_key_violation
 from app.repositories.diagram_repository import DiagramRepository
 from app.schemas.diagram import (
     DiagramCreate,
@@ -16,6 +20,9 @@ from app.models.diagram_entity import DiagramType
 
 router = APIRouter(prefix="/projects/{project_id}", tags=["Visualizations"])
 
+# Validates summary rows and dumps them in one pass for ORJSONResponse
+_DIAGRAM_LIST_ADAPTER = TypeAdapter(List[DiagramListResponse])
+
 
 async def verify_project_exists(
     project_id: str,
@@ -23,8 +30,7 @@ async def verify_project_exists(
 ) -> None:
     """Verify that the project exists."""
     repo = ProjectRepository(db)
-    project = await repo.get_by_id(project_id)
-    if not project:
+    if not await repo.exists(project_id):
         raise HTTPException(status_code=404, detail="Project not found")
 
 
@@ -35,16 +41,25 @@ async def create_diagram(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new diagram within a project."""
-    await verify_project_exists(project_id, db)
-
+    # The project_id foreign key doubles as the existence check
     repo = DiagramRepository(db)
-    return await repo.create(
-        project_id=project_id,
-        **diagram.model_dump(),
-    )
+    try:
+        return await repo.create(
+            project_id=project_id,
+            **diagram.model_dump(),
+        )
+    except IntegrityError as e:
+        # Postgres' default name for the project_id foreign key
+        if is_foreign_key_violation(e, "diagrams_project_id_fkey"):
+            raise HTTPException(status_code=404, detail="Project not found")
+        raise
 
 
-@router.get("/diagrams", response_model=List[DiagramListResponse])
+@router.get(
+    "/diagrams",
+    response_model=List[DiagramListResponse],
+    response_class=ORJSONResponse,
+)
 async def list_diagrams(
     project_id: str,
     diagram_type: Optional[DiagramType] = None,
@@ -56,26 +71,15 @@ async def list_diagrams(
     await verify_project_exists(project_id, db)
 
     repo = DiagramRepository(db)
-    diagrams = await repo.get_by_project(
+    rows = await repo.get_summaries_by_project(
         project_id,
         diagram_type=diagram_type,
         skip=skip,
         limit=limit,
     )
 
-    return [
-        DiagramListResponse(
-            id=d.id,
-            name=d.name,
-            description=d.description,
-            diagram_type=d.diagram_type,
-            thumbnail=d.thumbnail,
-            version=d.version,
-            created_at=d.created_at,
-            updated_at=d.updated_at,
-        )
-        for d in diagrams
-    ]
+    items = _DIAGRAM_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return ORJSONResponse(_DIAGRAM_LIST_ADAPTER.dump_python(items, mode="json"))
 
 
 @router.get("/diagrams/{diagram_id}", response_model=DiagramResponse)
@@ -134,7 +138,11 @@ async def delete_diagram(
     await repo.delete(diagram_id)
 
 
-@router.get("/diagrams/{diagram_id}/versions", response_model=List[DiagramListResponse])
+@router.get(
+    "/diagrams/{diagram_id}/versions",
+    response_model=List[DiagramListResponse],
+    response_class=ORJSONResponse,
+)
 async def get_diagram_versions(
     project_id: str,
     diagram_id: str,
@@ -148,18 +156,7 @@ async def get_diagram_versions(
     if not diagram or diagram.project_id != project_id:
         raise HTTPException(status_code=404, detail="Diagram not found")
 
-    versions = await repo.get_version_history(diagram_id, limit=limit)
-
-    return [
-        DiagramListResponse(
-            id=d.id,
-            name=d.name,
-            description=d.description,
-            diagram_type=d.diagram_type,
-            thumbnail=d.thumbnail,
-            version=d.version,
-            created_at=d.created_at,
-            updated_at=d.updated_at,
-        )
-        for d in versions
-    ]
+    rows = await repo.get_version_history(diagram_id, limit=limit)
+
+    items = _DIAGRAM_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return ORJSONResponse(_DIAGRAM_LIST_ADAPTER.dump_python(items, mode="json"))
@@ -4,7 +4,7 @@ Provides JWT-based authentication and authorization.
 """
 
 from .jwt import create_access_token, create_refresh_token, verify_token, TokenData
-from .middleware import get_current_user, get_current_user_optional, require_auth
+from .middleware import get_current_user, get_current_user_optional, require_auth, invalidate_cached_user
 from .models import User, UserCreate, UserLogin, UserResponse, TokenResponse
 
 __all__ = [
@@ -17,6 +17,7 @@ __all__ = [
     "get_current_user",
     "get_current_user_optional",
     "require_auth",
+    "invalidate_cached_user",
     # Models
     "User",
     "UserCreate",
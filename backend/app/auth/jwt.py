@@ -2,12 +2,19 @@
 JWT token generation and validation.
 """
 
+import asyncio
+import hashlib
+import hmac
 import os
 import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
 
@@ -19,8 +26,50 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Decode settings built once instead of per verify
+_SECRET_KEY_BYTES = SECRET_KEY.encode()
+_REFRESH_SECRET_KEY_BYTES = REFRESH_SECRET_KEY.encode()
+_ALGORITHMS = [ALGORITHM]
+_DECODE_OPTIONS = {"require": ["exp", "sub", "type"]}
+
+# Password hashing: argon2id for new hashes, bcrypt still verifies legacy
+# hashes and is flagged for rehash on the next successful login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
+
+# Passlib resolves hash backends lazily; do it at import, not on first login
+pwd_context.hash("warmup")
+
+# Successful verifications, keyed by an HMAC of (password, stored hash) under a
+# per-process key so neither the plaintext nor a plain digest is retained.
+# The stored hash is part of the key, so a password change never hits stale
+# entries.
+_VERIFIED_CACHE_SIZE = 4096
+_VERIFIED_CACHE_KEY = secrets.token_bytes(32)
+_verified_cache: "OrderedDict[bytes, None]" = OrderedDict()
+_verified_cache_lock = threading.Lock()
+
+# Recently verified tokens, so a burst of requests with the same bearer token
+# decodes it once. Entries live at most _TOKEN_CACHE_TTL seconds (and never
+# past the token's own exp), which bounds how long a token is still accepted
+# from the cache after it would otherwise be rejected.
+_TOKEN_CACHE_SIZE = 10_000
+_TOKEN_CACHE_TTL = 60
+_token_cache: "OrderedDict[tuple[str, str], tuple[float, TokenData]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+# Dedicated pool so password hashing (argon2id, or bcrypt for legacy hashes)
+# doesn't starve Starlette's default threadpool
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password-hash",
+)
 
 
 class TokenData(BaseModel):
@@ -32,9 +81,34 @@ class TokenData(BaseModel):
     exp: Optional[datetime] = None
 
 
+def _verification_key(plain_password: str, hashed_password: str) -> bytes:
+    """Derive the verification cache key for a password/hash pair."""
+    message = plain_password.encode() + b"\0" + hashed_password.encode()
+    return hmac.new(_VERIFIED_CACHE_KEY, message, hashlib.sha256).digest()
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """
+    Verify a password against its hash.
+
+    Successful verifications are remembered in a bounded LRU so repeated
+    logins skip the KDF (argon2id, or bcrypt for legacy hashes). Failures
+    are never cached.
+    """
+    key = _verification_key(plain_password, hashed_password)
+    with _verified_cache_lock:
+        if key in _verified_cache:
+            _verified_cache.move_to_end(key)
+            return True
+
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False
+
+    with _verified_cache_lock:
+        _verified_cache[key] = None
+        if len(_verified_cache) > _VERIFIED_CACHE_SIZE:
+            _verified_cache.popitem(last=False)
+    return True
 
 
 def get_password_hash(password: str) -> str:
@@ -42,6 +116,25 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash uses a deprecated scheme or parameters."""
+    return pwd_context.needs_update(hashed_password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def aget_password_hash(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, get_password_hash, password)
+
+
 def create_access_token(
     user_id: int,
     email: str,
@@ -49,10 +142,8 @@ def create_access_token(
     expires_delta: Optional[timedelta] = None
 ) -> str:
     """Create a new access token."""
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
 
     to_encode = {
         "sub": str(user_id),
@@ -60,10 +151,10 @@ def create_access_token(
         "username": username,
         "type": "access",
         "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "iat": now,
     }
 
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _SECRET_KEY_BYTES, algorithm=ALGORITHM)
 
 
 def create_refresh_token(
@@ -73,10 +164,8 @@ def create_refresh_token(
     expires_delta: Optional[timedelta] = None
 ) -> str:
     """Create a new refresh token."""
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS))
 
     to_encode = {
         "sub": str(user_id),
@@ -84,16 +173,19 @@ def create_refresh_token(
         "username": username,
         "type": "refresh",
         "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "iat": now,
     }
 
-    return jwt.encode(to_encode, REFRESH_SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _REFRESH_SECRET_KEY_BYTES, algorithm=ALGORITHM)
 
 
 def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
     """
     Verify and decode a JWT token.
 
+    Valid tokens are cached for up to _TOKEN_CACHE_TTL seconds; invalid
+    tokens are never cached.
+
     Args:
         token: The JWT token to verify
         token_type: Expected token type ("access" or "refresh")
@@ -101,9 +193,39 @@ def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
     Returns:
         TokenData if valid, None otherwise
     """
+    key = (token_type, token)
+    now = time.monotonic()
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is not None:
+            expires_at, token_data = entry
+            if expires_at > now:
+                _token_cache.move_to_end(key)
+                return token_data
+            del _token_cache[key]
+
+    token_data = _decode_token(token, token_type)
+    if token_data is None:
+        return None
+
+    ttl = _TOKEN_CACHE_TTL
+    if token_data.exp is not None:
+        remaining = (token_data.exp - datetime.now(timezone.utc)).total_seconds()
+        ttl = min(ttl, remaining)
+    if ttl > 0:
+        with _token_cache_lock:
+            _token_cache[key] = (now + ttl, token_data)
+            if len(_token_cache) > _TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)
+
+    return token_data
+
+
+def _decode_token(token: str, token_type: str) -> Optional[TokenData]:
+    """Decode and validate a JWT token without consulting the cache."""
     try:
-        secret = SECRET_KEY if token_type == "access" else REFRESH_SECRET_KEY
-        payload = jwt.decode(token, secret, algorithms=[ALGORITHM])
+        secret = _SECRET_KEY_BYTES if token_type == "access" else _REFRESH_SECRET_KEY_BYTES
+        payload = jwt.decode(token, secret, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
 
         # Verify token type
         if payload.get("type") != token_type:
@@ -116,13 +238,16 @@ def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
         if user_id is None or email is None:
             return None
 
+        exp = payload.get("exp")
+
         return TokenData(
             user_id=int(user_id),
             email=email,
             username=username,
             token_type=token_type,
+            exp=datetime.fromtimestamp(exp, timezone.utc) if exp is not None else None,
         )
-    except JWTError:
+    except (jwt.PyJWTError, ValueError):
         return None
 
 
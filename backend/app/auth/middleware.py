@@ -2,7 +2,10 @@
 Authentication middleware for FastAPI.
 """
 
+import time
+from collections import OrderedDict
 from typing import Optional
+
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +18,48 @@ from .models import User
 # HTTP Bearer token scheme
 security = HTTPBearer(auto_error=False)
 
+# Recently loaded users by id, so a burst of authenticated requests skips the
+# users SELECT. Entries are detached snapshots merged into each request's
+# session without a query. Changes to a user (disable, profile update) become
+# visible within _USER_CACHE_TTL seconds, or immediately via
+# invalidate_cached_user().
+_USER_CACHE_SIZE = 10_000
+_USER_CACHE_TTL = 30
+_user_cache: "OrderedDict[int, tuple[float, User]]" = OrderedDict()
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop a user from the auth cache after it is modified."""
+    _user_cache.pop(user_id, None)
+
+
+async def _load_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    """
+    Load a user by id, serving from the auth cache when fresh.
+
+    Returns an instance attached to db either way.
+    """
+    now = time.monotonic()
+    entry = _user_cache.get(user_id)
+    if entry is not None:
+        expires_at, cached = entry
+        if expires_at > now:
+            _user_cache.move_to_end(user_id)
+            return await db.merge(cached, load=False)
+        del _user_cache[user_id]
+
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
+    if user is None:
+        return None
+
+    # Cache a detached snapshot; hand the request its own attached copy
+    db.expunge(user)
+    _user_cache[user_id] = (now + _USER_CACHE_TTL, user)
+    if len(_user_cache) > _USER_CACHE_SIZE:
+        _user_cache.popitem(last=False)
+    return await db.merge(user, load=False)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -39,11 +84,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Fetch user from database
-    result = await db.execute(
-        select(User).where(User.id == token_data.user_id)
-    )
-    user = result.scalar_one_or_none()
+    # Fetch user (cached for a short TTL)
+    user = await _load_user(db, token_data.user_id)
 
     if user is None:
         raise HTTPException(
@@ -76,10 +118,7 @@ async def get_current_user_optional(
     if token_data is None:
         return None
 
-    result = await db.execute(
-        select(User).where(User.id == token_data.user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = await _load_user(db, token_data.user_id)
 
     if user is None or not user.is_active:
         return None
@@ -121,10 +160,7 @@ async def verify_websocket_token(
     if token_data is None:
         return None
 
-    result = await db.execute(
-        select(User).where(User.id == token_data.user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = await _load_user(db, token_data.user_id)
 
     if user is None or not user.is_active:
         return None
@@ -4,7 +4,7 @@ Authentication routes for user registration, login, and token management.
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, select
 
 from app.db.session import get_db
 from app.auth.models import (
@@ -18,12 +18,16 @@ from app.auth.models import (
 from app.auth.jwt import (
     create_access_token,
     create_refresh_token,
-    verify_password,
-    get_password_hash,
+    averify_password,
+    aget_password_hash,
+    password_needs_rehash,
     verify_token,
     get_token_expiry_seconds,
 )
+from app.auth.middleware import invalidate_cached_user
 
+# Routes stay async: the only blocking work (password hashing) runs on a
+# dedicated executor through averify_password/aget_password_hash.
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
@@ -32,24 +36,29 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     Register a new user.
     """
-    # Check if email already exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    if result.scalar_one_or_none():
+    # Check email and username availability in one round trip
+    result = await db.execute(
+        select(
+            exists().where(User.email == user_data.email),
+            exists().where(User.username == user_data.username),
+        )
+    )
+    email_taken, username_taken = result.one()
+
+    if email_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
-    # Check if username already exists
-    result = await db.execute(select(User).where(User.username == user_data.username))
-    if result.scalar_one_or_none():
+    if username_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
         )
 
     # Create user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await aget_password_hash(user_data.password)
     new_user = User(
         email=user_data.email,
         username=user_data.username,
@@ -71,7 +80,7 @@ async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == user_data.email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(user_data.password, user.hashed_password):
+    if not user or not await averify_password(user_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -84,6 +93,11 @@ async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
             detail="Account is disabled"
         )
 
+    # Upgrade legacy bcrypt hashes to argon2id while we have the plaintext
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await aget_password_hash(user_data.password)
+        invalidate_cached_user(user.id)
+
     # Create tokens
     access_token = create_access_token(user.id, user.email, user.username)
     refresh_token = create_refresh_token(user.id, user.email, user.username)
@@ -108,9 +122,12 @@ async def refresh_token(request: TokenRefreshRequest, db: AsyncSession = Depends
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Verify user still exists and is active
-    result = await db.execute(select(User).where(User.id == token_data.user_id))
-    user = result.scalar_one_or_none()
+    # Verify user still exists and is active. Claims come from the current
+    # row, not the old token, so renamed users get their new email/username.
+    result = await db.execute(
+        select(User.email, User.username, User.is_active).where(User.id == token_data.user_id)
+    )
+    user = result.one_or_none()
 
     if not user or not user.is_active:
         raise HTTPException(
@@ -119,8 +136,8 @@ async def refresh_token(request: TokenRefreshRequest, db: AsyncSession = Depends
         )
 
     # Create new tokens
-    access_token = create_access_token(user.id, user.email, user.username)
-    refresh_token = create_refresh_token(user.id, user.email, user.username)
+    access_token = create_access_token(token_data.user_id, user.email, user.username)
+    refresh_token = create_refresh_token(token_data.user_id, user.email, user.username)
 
     return TokenResponse(
         access_token=access_token,
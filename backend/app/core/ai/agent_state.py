@@ -6,15 +6,21 @@ in the multi-agent diagram generation workflow.
 """
 
 from typing import TypedDict, Annotated, List, Optional, Literal, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 import operator
+import sys
 
 
 # =============================================================================
 # AGENT OUTPUT MODELS
 # =============================================================================
 
-class ArchitecturePlan(BaseModel):
+class AgentOutput(BaseModel):
+    """Base for agent outputs: immutable once parsed"""
+    model_config = ConfigDict(frozen=True)
+
+
+class ArchitecturePlan(AgentOutput):
     """Output from the Architect Agent"""
     analysis: str = Field(description="Understanding of the architecture requirements")
     component_categories: List[str] = Field(
@@ -32,13 +38,13 @@ class ArchitecturePlan(BaseModel):
     )
 
 
-class VolumeMount(BaseModel):
+class VolumeMount(AgentOutput):
     """Volume mount configuration"""
     name: str
     mountPath: str
 
 
-class ComponentSpec(BaseModel):
+class ComponentSpec(AgentOutput):
     """Output from the Component Specialist Agent"""
     id: str = Field(description="Unique node ID (node_0, node_1, etc.)")
     nodeType: str = Field(description="One of the 39 available node types")
@@ -57,8 +63,14 @@ class ComponentSpec(BaseModel):
         description="Logical layer: 0=external, 1=frontend, 2=integration, 3=services, 4=data, 5=observability"
     )
 
+    @field_validator("nodeType")
+    @classmethod
+    def intern_node_type(cls, v: str) -> str:
+        """Intern node types (a small fixed set) so repeats share one object"""
+        return sys.intern(v)
+
 
-class ConnectionSpec(BaseModel):
+class ConnectionSpec(AgentOutput):
     """Output from the Connection Expert Agent"""
     id: str = Field(description="Unique edge ID (edge_0, edge_1, etc.)")
     source: str = Field(description="Source node ID")
@@ -66,8 +78,14 @@ class ConnectionSpec(BaseModel):
     label: str = Field(description="Protocol label (REST, gRPC, Kafka, PostgreSQL, etc.)")
     rationale: str = Field(description="Why this connection exists")
 
+    @field_validator("label")
+    @classmethod
+    def intern_label(cls, v: str) -> str:
+        """Protocol labels repeat across edges; intern them like nodeType"""
+        return sys.intern(v)
 
-class GroupSpec(BaseModel):
+
+class GroupSpec(AgentOutput):
     """Output from the Grouping Strategist Agent"""
     id: str = Field(description="Unique group ID (group_0, group_1, etc.)")
     label: str = Field(description="Display name (e.g., 'K8s Cluster', 'VPC')")
@@ -76,7 +94,7 @@ class GroupSpec(BaseModel):
     rationale: str = Field(description="Why this grouping was created")
 
 
-class LayoutPosition(BaseModel):
+class LayoutPosition(AgentOutput):
     """Output from the Layout Optimizer Agent"""
     node_id: str = Field(description="The node ID to position")
     layer: int = Field(ge=0, le=5, description="Logical layer 0-5")
@@ -85,7 +103,7 @@ class LayoutPosition(BaseModel):
     y: int = Field(description="Y coordinate (snapped to grid)")
 
 
-class QualityReview(BaseModel):
+class QualityReview(AgentOutput):
     """Output from the Quality Reviewer Agent"""
     overall_score: int = Field(
         ge=1, le=10,
@@ -117,6 +135,27 @@ class QualityReview(BaseModel):
 # MULTI-AGENT STATE
 # =============================================================================
 
+# Oldest agent messages are dropped past this many, so long retry/review
+# loops can't grow the state without bound
+MAX_STATE_MESSAGES = 200
+
+
+def append_messages(existing: List[dict], new: List[dict]) -> List[dict]:
+    """
+    Reducer for the messages channel.
+
+    Extends the channel's list in place instead of building left + right on
+    every agent return, and trims the oldest entries past MAX_STATE_MESSAGES.
+    Safe because the graph runs without a checkpointer, so no earlier
+    snapshot shares the list.
+    """
+    existing.extend(new)
+    overflow = len(existing) - MAX_STATE_MESSAGES
+    if overflow > 0:
+        del existing[:overflow]
+    return existing
+
+
 class MultiAgentState(TypedDict):
     """
     Shared state for the multi-agent diagram generation workflow.
@@ -140,9 +179,9 @@ class MultiAgentState(TypedDict):
     quality_review: Optional[QualityReview]
 
     # === Processing ===
-    messages: Annotated[List[dict], operator.add]
+    messages: Annotated[List[dict], append_messages]
     current_agent: str
-    agent_history: List[str]  # Track which agents have run
+    agent_history: Annotated[List[str], operator.add]  # Agents append their name
 
     # === Retry Control ===
     attempt_number: int
@@ -154,7 +193,7 @@ class MultiAgentState(TypedDict):
     final_diagram: Optional[dict]
     final_response: Optional[dict]
     status: Literal["pending", "in_progress", "success", "failed"]
-    warnings: List[str]
+    warnings: Annotated[List[str], operator.add]  # Parallel branches append
 
 
 def create_initial_multi_agent_state(
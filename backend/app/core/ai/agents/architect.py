@@ -10,12 +10,17 @@ from typing import Any, Dict
 
 from app.config import settings
 from app.core.ai.agent_state import MultiAgentState, ArchitecturePlan
-from app.core.ai.client import get_openai_client
-from app.core.ai.prompts.architect_prompt import get_architect_prompt
-from app.models.operations import DiagramContext
+from app.core.ai.client import coalesce, get_openai_client
+from app.core.ai.utils.agent_executor import stream_structured_completion
+from app.core.ai.prompts.architect_prompt import ARCHITECT_PROMPT, get_architect_context
+from app.core.ai.response_cache import get_response_cache, make_cache_key, normalize_prompt
+from app.models.operations import parse_diagram_context
 
 logger = logging.getLogger(__name__)
 
+# Plans for repeated requests are reused for an hour
+PLAN_CACHE_TTL_SECONDS = 3600
+
 
 async def architect_agent(state: MultiAgentState) -> Dict[str, Any]:
     """
@@ -35,36 +40,72 @@ async def architect_agent(state: MultiAgentState) -> Dict[str, Any]:
     context = state.get("context")
     conversation_history = state.get("conversation_history", [])
 
-    # Build context if available
-    diagram_context = None
-    if context:
-        try:
-            diagram_context = DiagramContext(**context)
-        except Exception:
-            pass
+    # The prompt only reads node/edge counts, and the context was validated
+    # with the incoming request, so skip re-validating every node
+    diagram_context = parse_diagram_context(context, validate=False)
 
-    # Get the specialized prompt
-    prompt = get_architect_prompt(
+    # Static prompt first as its own message so it stays a cacheable prefix;
+    # per-request context follows
+    messages = [{"role": "system", "content": ARCHITECT_PROMPT}]
+    dynamic_context = get_architect_context(
         context=diagram_context,
         conversation_history=conversation_history
     )
+    if dynamic_context:
+        messages.append({"role": "system", "content": dynamic_context})
+    messages.append({"role": "user", "content": user_request})
+
+    # Repeated requests (same module, context and normalized text) reuse the plan
+    model = settings.MODEL_ARCHITECT
+    cache = get_response_cache()
+    cache_key = make_cache_key(
+        model,
+        "architect",
+        state.get("module_type", ""),
+        dynamic_context,
+        normalize_prompt(user_request),
+    )
+    # Reviewer-requested re-runs must not get the same plan back
+    is_retry = state.get("review_iterations", 0) > 0
+    cached = None if is_retry else await cache.get(cache_key)
+    if cached is not None:
+        plan = ArchitecturePlan.model_validate_json(cached)
+        logger.info("[Architect] Reusing cached plan")
+        return {
+            "architecture_plan": plan,
+            "current_agent": "architect",
+            "agent_history": ["architect"],
+            "status": "in_progress",
+            "messages": [{
+                "role": "system",
+                "content": f"[Architect] Reused plan with {plan.estimated_nodes} expected nodes"
+            }]
+        }
 
     # Call GPT-5 for deep reasoning
     client = get_openai_client()
 
-    try:
+    async def create_plan() -> ArchitecturePlan:
         # Note: GPT-5 reasoning models don't support temperature parameter
-        response = await client.beta.chat.completions.parse(
-            model=settings.MODEL_ARCHITECT,
+        response = await stream_structured_completion(
+            client,
+            timeout=settings.AGENT_TIMEOUT_SECONDS,
+            model=model,
             reasoning_effort="medium",  # Balance speed vs quality for planning
-            messages=[
-                {"role": "system", "content": prompt},
-                {"role": "user", "content": user_request}
-            ],
+            messages=messages,
             response_format=ArchitecturePlan,
+            extra_body={"prompt_cache_key": "diagram-architect"},
         )
-
         plan = response.choices[0].message.parsed
+        if not is_retry:
+            await cache.set(cache_key, plan.model_dump_json(), PLAN_CACHE_TTL_SECONDS)
+        return plan
+
+    try:
+        # Identical requests in flight at the same time share one call. A
+        # retry runs on its own so it can't join the first run's call, and
+        # its plan doesn't replace the first run's cache entry.
+        plan = await create_plan() if is_retry else await coalesce(cache_key, create_plan)
 
         logger.info(
             f"[Architect] Plan created: {plan.complexity_score}/10 complexity, "
@@ -85,8 +126,9 @@ async def architect_agent(state: MultiAgentState) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"[Architect] Error: {e}", exc_info=True)
 
-        # Fallback: create a minimal plan
-        fallback_plan = ArchitecturePlan(
+        # Fallback: create a minimal plan from literal values, so
+        # model_construct() skips validation
+        fallback_plan = ArchitecturePlan.model_construct(
             analysis=f"Processing request: {user_request[:100]}...",
             component_categories=["applications", "data"],
             suggested_patterns=["simple"],
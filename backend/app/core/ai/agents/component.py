@@ -6,17 +6,23 @@ Uses GPT-5 for accurate component selection.
 """
 
 import logging
+from collections import Counter
 from typing import Any, Dict, List
 
 from pydantic import BaseModel
 
 from app.config import settings
-from app.core.ai.agent_state import MultiAgentState, ComponentSpec
-from app.core.ai.client import get_openai_client
-from app.core.ai.prompts.component_prompt import get_component_prompt
+from app.core.ai.agent_state import MultiAgentState, ComponentSpec, VolumeMount
+from app.core.ai.client import coalesce, get_openai_client
+from app.core.ai.utils.agent_executor import stream_structured_completion
+from app.core.ai.prompts.component_prompt import COMPONENT_PROMPT, get_component_context
+from app.core.ai.response_cache import get_response_cache, make_cache_key, normalize_prompt
 
 logger = logging.getLogger(__name__)
 
+# Component selections for a repeated plan + request are reused for an hour
+COMPONENT_CACHE_TTL_SECONDS = 3600
+
 
 class ComponentListResponse(BaseModel):
     """Wrapper for component list response"""
@@ -47,8 +53,8 @@ async def component_agent(state: MultiAgentState) -> Dict[str, Any]:
             "warnings": ["No architecture plan provided"]
         }
 
-    # Get the specialized prompt
-    prompt = get_component_prompt(architecture_plan)
+    # Static prompt (node type catalog) first so it stays a cacheable prefix
+    plan_context = get_component_context(architecture_plan)
 
     # Build user message with the original request for context
     user_message = f"""Based on the architecture plan above, select the specific components.
@@ -57,40 +63,73 @@ Original user request: {state['user_request']}
 
 Return a JSON object with a 'components' array."""
 
+    # Same plan and normalized request reuse the previous selection
+    model = settings.MODEL_COMPONENT
+    cache = get_response_cache()
+    cache_key = make_cache_key(
+        model,
+        "component",
+        architecture_plan.model_dump_json(),
+        normalize_prompt(state["user_request"]),
+    )
+    # Reviewer-requested re-runs must not get the same selection back
+    is_retry = state.get("review_iterations", 0) > 0
+    cached = None if is_retry else await cache.get(cache_key)
+    if cached is not None:
+        components = ComponentListResponse.model_validate_json(cached).components
+        logger.info(f"[Component] Reusing {len(components)} cached components")
+        return {
+            "components": components,
+            "current_agent": "component",
+            "agent_history": ["component"],
+            "messages": [{
+                "role": "system",
+                "content": f"[Component] Reused {len(components)} components"
+            }]
+        }
+
     # Call GPT-5 for deep reasoning
     client = get_openai_client()
 
-    try:
+    async def select_components() -> ComponentListResponse:
         # Note: GPT-5 reasoning models don't support temperature parameter
-        response = await client.beta.chat.completions.parse(
-            model=settings.MODEL_COMPONENT,
+        response = await stream_structured_completion(
+            client,
+            timeout=settings.AGENT_TIMEOUT_SECONDS,
+            model=model,
             reasoning_effort="low",  # Fast selection from known types
             messages=[
-                {"role": "system", "content": prompt},
+                {"role": "system", "content": COMPONENT_PROMPT},
+                {"role": "system", "content": plan_context},
                 {"role": "user", "content": user_message}
             ],
             response_format=ComponentListResponse,
+            extra_body={"prompt_cache_key": "diagram-component"},
         )
-
         result = response.choices[0].message.parsed
-        components = result.components
+        if not is_retry:
+            await cache.set(cache_key, result.model_dump_json(), COMPONENT_CACHE_TTL_SECONDS)
+        return result
+
+    try:
+        # Identical requests in flight at the same time share one call. A
+        # retry runs on its own so it can't join the first run's call, and
+        # its selection doesn't replace the first run's cache entry.
+        if is_retry:
+            components = (await select_components()).components
+        else:
+            components = (await coalesce(cache_key, select_components)).components
 
         logger.info(f"[Component] Selected {len(components)} components")
 
         # Log component breakdown
-        by_type = {}
-        for c in components:
-            by_type[c.nodeType] = by_type.get(c.nodeType, 0) + 1
+        by_type = Counter(c.nodeType for c in components)
         logger.info(f"[Component] Types: {by_type}")
 
-        # Update agent history
-        agent_history = state.get("agent_history", []).copy()
-        agent_history.append("component")
-
         return {
             "components": components,
             "current_agent": "component",
-            "agent_history": agent_history,
+            "agent_history": ["component"],
             "messages": [{
                 "role": "system",
                 "content": f"[Component] Selected {len(components)} components"
@@ -104,9 +143,10 @@ Return a JSON object with a 'components' array."""
         fallback_components = []
         estimated = architecture_plan.estimated_nodes
 
-        # Create basic components
+        # Create basic components. Inputs are literal constants, not model
+        # output, so model_construct() skips validation.
         if "applications" in architecture_plan.component_categories:
-            fallback_components.append(ComponentSpec(
+            fallback_components.append(ComponentSpec.model_construct(
                 id="node_0",
                 nodeType="webapp",
                 label="Frontend App",
@@ -116,12 +156,12 @@ Return a JSON object with a 'components' array."""
             ))
 
         if "data" in architecture_plan.component_categories:
-            fallback_components.append(ComponentSpec(
+            fallback_components.append(ComponentSpec.model_construct(
                 id=f"node_{len(fallback_components)}",
                 nodeType="sql",
                 label="Database",
                 tags=["PostgreSQL", "15"],
-                volumes=[{"name": "pg-data", "mountPath": "/var/lib/postgresql/data"}],
+                volumes=[VolumeMount.model_construct(name="pg-data", mountPath="/var/lib/postgresql/data")],
                 description="Primary database",
                 suggested_layer=4
             ))
@@ -129,7 +169,7 @@ Return a JSON object with a 'components' array."""
         return {
             "components": fallback_components,
             "current_agent": "component",
-            "agent_history": state.get("agent_history", []) + ["component"],
+            "agent_history": ["component"],
             "warnings": [f"Component fallback used: {str(e)}"],
             "messages": [{
                 "role": "system",
@@ -6,23 +6,88 @@ Uses GPT-5-mini for fast, pattern-based edge creation.
 """
 
 import logging
+from collections import Counter
 from typing import Any, Dict, List
 
 from pydantic import BaseModel
 
 from app.config import settings
-from app.core.ai.agent_state import MultiAgentState, ConnectionSpec
+from app.core.ai.agent_state import MultiAgentState, ComponentSpec, ConnectionSpec
 from app.core.ai.client import get_openai_client
-from app.core.ai.prompts.connection_prompt import get_connection_prompt
+from app.core.ai.utils.agent_executor import stream_structured_completion
+from app.core.ai.prompts.connection_prompt import CONNECTION_PROMPT, get_connection_context
 
 logger = logging.getLogger(__name__)
 
+# Node types wired together by the fallback connections
+FALLBACK_ROLES = {
+    "webapp": "frontend",
+    "mobile": "frontend",
+    "backend": "backend",
+    "api": "backend",
+    "gateway": "backend",
+    "sql": "database",
+    "nosql": "database",
+    "cache": "database",
+}
+
 
 class ConnectionListResponse(BaseModel):
     """Wrapper for connection list response"""
     connections: List[ConnectionSpec]
 
 
+def build_fallback_connections(components: List[ComponentSpec]) -> List[ConnectionSpec]:
+    """
+    Create basic frontend -> backend -> database connections by node type.
+
+    Used when the LLM call fails. IDs come from validated components and
+    labels are literals, so model_construct() skips validation.
+    """
+    fallback_connections = []
+
+    # Bucket components by role in one pass (keeps component order)
+    by_role: Dict[str, List[ComponentSpec]] = {
+        "frontend": [], "backend": [], "database": [],
+    }
+    for c in components:
+        role = FALLBACK_ROLES.get(c.nodeType)
+        if role:
+            by_role[role].append(c)
+
+    frontends = by_role["frontend"]
+    backends = by_role["backend"]
+    databases = by_role["database"]
+
+    edge_id = 0
+
+    # Connect frontends to backends
+    for frontend in frontends:
+        for backend in backends[:1]:  # Connect to first backend only
+            fallback_connections.append(ConnectionSpec.model_construct(
+                id=f"edge_{edge_id}",
+                source=frontend.id,
+                target=backend.id,
+                label="REST/JSON",
+                rationale="Frontend to backend connection"
+            ))
+            edge_id += 1
+
+    # Connect backends to databases
+    for backend in backends:
+        for db in databases[:1]:  # Connect to first database only
+            fallback_connections.append(ConnectionSpec.model_construct(
+                id=f"edge_{edge_id}",
+                source=backend.id,
+                target=db.id,
+                label="PostgreSQL" if db.nodeType == "sql" else "Redis",
+                rationale="Backend to database connection"
+            ))
+            edge_id += 1
+
+    return fallback_connections
+
+
 async def connection_agent(state: MultiAgentState) -> Dict[str, Any]:
     """
     Connection Expert: Defines edges with protocol labels.
@@ -46,8 +111,9 @@ async def connection_agent(state: MultiAgentState) -> Dict[str, Any]:
             "warnings": ["No components to connect"]
         }
 
-    # Get the specialized prompt
-    prompt = get_connection_prompt(components)
+    # Static prompt goes first as the system message so it stays a cacheable
+    # prefix; the per-request context rides in the user message
+    context = get_connection_context(components)
 
     # Build user message
     user_message = """Define the connections between these components.
@@ -60,14 +126,17 @@ Return a JSON object with a 'connections' array."""
 
     try:
         # Note: GPT-5-mini reasoning models don't support temperature parameter
-        response = await client.beta.chat.completions.parse(
+        response = await stream_structured_completion(
+            client,
+            timeout=settings.AGENT_FAST_TIMEOUT_SECONDS,
             model=settings.MODEL_CONNECTION,
             reasoning_effort="low",  # Fast pattern-based connections
             messages=[
-                {"role": "system", "content": prompt},
-                {"role": "user", "content": user_message}
+                {"role": "system", "content": CONNECTION_PROMPT},
+                {"role": "user", "content": f"{context}\n\n{user_message}"}
             ],
             response_format=ConnectionListResponse,
+            extra_body={"prompt_cache_key": "diagram-connection"},
         )
 
         result = response.choices[0].message.parsed
@@ -76,18 +145,14 @@ Return a JSON object with a 'connections' array."""
         logger.info(f"[Connection] Created {len(connections)} connections")
 
         # Log protocol breakdown
-        protocols = {}
-        for c in connections:
-            protocols[c.label] = protocols.get(c.label, 0) + 1
+        protocols = Counter(c.label for c in connections)
         logger.info(f"[Connection] Protocols: {protocols}")
 
-        # Update agent history
-        agent_history = state.get("agent_history", []).copy()
-        agent_history.append("connection")
-
         return {
             "connections": connections,
-            # Note: current_agent not updated here to avoid parallel write conflict
+            # Note: current_agent not updated here to avoid parallel write conflict;
+            # agent_history is append-reduced, so it is safe
+            "agent_history": ["connection"],
             "messages": [{
                 "role": "system",
                 "content": f"[Connection] Created {len(connections)} connections"
@@ -97,42 +162,8 @@ Return a JSON object with a 'connections' array."""
     except Exception as e:
         logger.error(f"[Connection] Error: {e}", exc_info=True)
 
-        # Fallback: create basic connections based on component types
-        fallback_connections = []
-
-        # Find frontend and backend components
-        frontends = [c for c in components if c.nodeType in ["webapp", "mobile"]]
-        backends = [c for c in components if c.nodeType in ["backend", "api", "gateway"]]
-        databases = [c for c in components if c.nodeType in ["sql", "nosql", "cache"]]
-
-        edge_id = 0
-
-        # Connect frontends to backends
-        for frontend in frontends:
-            for backend in backends[:1]:  # Connect to first backend only
-                fallback_connections.append(ConnectionSpec(
-                    id=f"edge_{edge_id}",
-                    source=frontend.id,
-                    target=backend.id,
-                    label="REST/JSON",
-                    rationale="Frontend to backend connection"
-                ))
-                edge_id += 1
-
-        # Connect backends to databases
-        for backend in backends:
-            for db in databases[:1]:  # Connect to first database only
-                fallback_connections.append(ConnectionSpec(
-                    id=f"edge_{edge_id}",
-                    source=backend.id,
-                    target=db.id,
-                    label="PostgreSQL" if db.nodeType == "sql" else "Redis",
-                    rationale="Backend to database connection"
-                ))
-                edge_id += 1
-
         return {
-            "connections": fallback_connections,
+            "connections": build_fallback_connections(components),
             "warnings": [f"Connection fallback used: {str(e)}"],
             "messages": [{
                 "role": "system",
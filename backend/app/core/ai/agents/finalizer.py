@@ -6,9 +6,7 @@ Uses GPT-4o for reliable JSON generation.
 """
 
 import logging
-from typing import Any, Dict, List
-
-from pydantic import BaseModel
+from typing import Any, Dict
 
 from app.config import settings
 from app.core.ai.agent_state import MultiAgentState
@@ -16,49 +14,8 @@ from app.core.ai.client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
-
-class NodePosition(BaseModel):
-    x: int
-    y: int
-
-
-class NodeData(BaseModel):
-    label: str
-    nodeType: str
-    tags: List[str]
-    volumes: List[dict] = []
-    isGroup: bool = False
-
-
-class FinalNode(BaseModel):
-    id: str
-    type: str
-    position: NodePosition
-    data: NodeData
-    parentId: str | None = None
-
-
-class FinalEdge(BaseModel):
-    id: str
-    source: str
-    target: str
-    label: str
-    type: str = "smoothstep"
-    animated: bool = True
-
-
-class FinalGroup(BaseModel):
-    id: str
-    type: str = "groupNode"
-    position: NodePosition
-    data: NodeData
-    style: dict
-
-
-class FinalDiagram(BaseModel):
-    nodes: List[FinalNode]
-    edges: List[FinalEdge]
-    groups: List[FinalGroup] = []
+# Padding around grouped nodes, also the child offset inside a group
+GROUP_PADDING = 48
 
 
 async def finalizer_agent(state: MultiAgentState) -> Dict[str, Any]:
@@ -84,121 +41,114 @@ async def finalizer_agent(state: MultiAgentState) -> Dict[str, Any]:
     # Create position lookup
     pos_lookup = {p.node_id: p for p in layout_positions}
 
-    # Build node-to-group lookup
-    node_to_group = {}
-    for group in groups:
-        for node_id in group.node_ids:
-            node_to_group[node_id] = group.id
+    # Build node-to-group lookup (later groups win, as before)
+    node_to_group = {
+        node_id: group.id for group in groups for node_id in group.node_ids
+    }
+    get_pos = pos_lookup.get
 
-    # Compile nodes
+    # Compile nodes. Inputs are already-validated agent outputs, so nodes,
+    # edges and groups are built directly as the plain dicts we return.
     final_nodes = []
     for comp in components:
-        pos = pos_lookup.get(comp.id)
-        x = pos.x if pos else 100
-        y = pos.y if pos else 100
-
-        final_nodes.append(FinalNode(
-            id=comp.id,
-            type="customNode",
-            position=NodePosition(x=x, y=y),
-            data=NodeData(
-                label=comp.label,
-                nodeType=comp.nodeType,
-                tags=comp.tags,
-                volumes=[v.model_dump() for v in comp.volumes] if comp.volumes else [],
-                isGroup=False
-            ),
-            parentId=node_to_group.get(comp.id)
-        ))
+        pos = get_pos(comp.id)
+        final_nodes.append({
+            "id": comp.id,
+            "type": "customNode",
+            "position": {"x": pos.x if pos else 100, "y": pos.y if pos else 100},
+            "data": {
+                "label": comp.label,
+                "nodeType": comp.nodeType,
+                "tags": comp.tags,
+                "volumes": [v.model_dump() for v in comp.volumes] if comp.volumes else [],
+                "isGroup": False,
+            },
+            "parentId": node_to_group.get(comp.id),
+        })
 
     # Compile edges
-    final_edges = []
-    for conn in connections:
-        final_edges.append(FinalEdge(
-            id=conn.id,
-            source=conn.source,
-            target=conn.target,
-            label=conn.label,
-            type="smoothstep",
-            animated=True
-        ))
+    final_edges = [
+        {
+            "id": conn.id,
+            "source": conn.source,
+            "target": conn.target,
+            "label": conn.label,
+            "type": "smoothstep",
+            "animated": True,
+        }
+        for conn in connections
+    ]
 
     # Compile groups
     final_groups = []
     for group in groups:
         # Calculate group bounds from contained nodes
-        contained_positions = [pos_lookup[nid] for nid in group.node_ids if nid in pos_lookup]
+        contained_positions = [p for p in map(get_pos, group.node_ids) if p is not None]
 
         if contained_positions:
-            min_x = min(p.x for p in contained_positions)
-            max_x = max(p.x for p in contained_positions)
-            min_y = min(p.y for p in contained_positions)
-            max_y = max(p.y for p in contained_positions)
+            # Single pass for all four bounds
+            first = contained_positions[0]
+            min_x = max_x = first.x
+            min_y = max_y = first.y
+            for p in contained_positions[1:]:
+                if p.x < min_x:
+                    min_x = p.x
+                elif p.x > max_x:
+                    max_x = p.x
+                if p.y < min_y:
+                    min_y = p.y
+                elif p.y > max_y:
+                    max_y = p.y
 
             # Add padding
-            padding = 48
             node_width = 180
             node_height = 100
 
-            width = (max_x - min_x) + node_width + (padding * 2)
-            height = (max_y - min_y) + node_height + (padding * 2)
-            pos_x = min_x - padding
-            pos_y = min_y - padding
+            width = (max_x - min_x) + node_width + (GROUP_PADDING * 2)
+            height = (max_y - min_y) + node_height + (GROUP_PADDING * 2)
+            pos_x = min_x - GROUP_PADDING
+            pos_y = min_y - GROUP_PADDING
         else:
             # Default size if no positions
             width, height = 400, 200
             pos_x, pos_y = 100, 100
 
-        final_groups.append(FinalGroup(
-            id=group.id,
-            type="groupNode",
-            position=NodePosition(x=pos_x, y=pos_y),
-            data=NodeData(
-                label=group.label,
-                nodeType="group",
-                tags=group.tags,
-                isGroup=True
-            ),
-            style={"width": width, "height": height}
-        ))
-
-    # Create final diagram
-    diagram = FinalDiagram(
-        nodes=final_nodes,
-        edges=final_edges,
-        groups=final_groups
-    )
+        final_groups.append({
+            "id": group.id,
+            "type": "groupNode",
+            "position": {"x": pos_x, "y": pos_y},
+            "data": {
+                "label": group.label,
+                "nodeType": "group",
+                "tags": group.tags,
+                "volumes": [],
+                "isGroup": True,
+            },
+            "style": {"width": width, "height": height},
+        })
 
     # Combine groups and nodes for ReactFlow
     # Groups must be in the nodes array and come BEFORE their children
-    all_nodes = []
+    all_nodes = list(final_groups)
 
     # Create group position lookup for relative positioning
-    group_positions = {g.id: g.position for g in final_groups}
-
-    # Add groups first (they must be defined before child nodes reference them)
-    for group in final_groups:
-        all_nodes.append({
-            "id": group.id,
-            "type": "groupNode",
-            "position": {"x": group.position.x, "y": group.position.y},
-            "data": group.data.model_dump(),
-            "style": group.style,
-        })
+    group_positions = {g["id"]: g["position"] for g in final_groups}
 
     # Add regular nodes (with parentId references to groups)
     for node in final_nodes:
-        node_dict = node.model_dump()
         # ReactFlow positions children relative to parent
-        parent_id = node_dict.get("parentId")
-        if parent_id and parent_id in group_positions:
-            # Convert absolute position to relative position
-            parent_pos = group_positions[parent_id]
-            # Add padding offset (groups have padding of 48)
-            padding = 48
-            node_dict["position"]["x"] = node_dict["position"]["x"] - parent_pos.x + padding
-            node_dict["position"]["y"] = node_dict["position"]["y"] - parent_pos.y + padding
-        all_nodes.append(node_dict)
+        parent_pos = group_positions.get(node["parentId"])
+        if parent_pos is not None:
+            # Convert absolute position to relative position (plus group padding);
+            # copy so final_diagram keeps absolute positions
+            node = {
+                **node,
+                "position": {
+                    "x": node["position"]["x"] - parent_pos["x"] + GROUP_PADDING,
+                    "y": node["position"]["y"] - parent_pos["y"] + GROUP_PADDING,
+                },
+            }
+        all_nodes.append(node)
 
     # Create response
     response = {
@@ -209,7 +159,7 @@ async def finalizer_agent(state: MultiAgentState) -> Dict[str, Any]:
             "version": "1.0",
             "name": "Generated Diagram",
             "nodes": all_nodes,
-            "edges": [e.model_dump() for e in final_edges],
+            "edges": final_edges,
         }
     }
 
@@ -221,15 +171,15 @@ async def finalizer_agent(state: MultiAgentState) -> Dict[str, Any]:
         f"{len(final_edges)} edges, {len(final_groups)} groups"
     )
 
-    # Update agent history
-    agent_history = state.get("agent_history", []).copy()
-    agent_history.append("finalizer")
-
     return {
-        "final_diagram": diagram.model_dump(),
+        "final_diagram": {
+            "nodes": final_nodes,
+            "edges": final_edges,
+            "groups": final_groups,
+        },
         "final_response": response,
         "current_agent": "finalizer",
-        "agent_history": agent_history,
+        "agent_history": ["finalizer"],
         "status": "success",
         "messages": [{
             "role": "system",
@@ -13,7 +13,16 @@ from pydantic import BaseModel
 from app.config import settings
 from app.core.ai.agent_state import MultiAgentState, GroupSpec
 from app.core.ai.client import get_openai_client
-from app.core.ai.prompts.grouping_prompt import get_grouping_prompt
+from app.core.ai.response_cache import get_response_cache
+from app.core.ai.structure_cache import (
+    STRUCTURE_CACHE_TTL_SECONDS,
+    dump_structural,
+    get_structural_order,
+    get_structure_key,
+    load_structural,
+)
+from app.core.ai.utils.agent_executor import stream_structured_completion
+from app.core.ai.prompts.grouping_prompt import GROUPING_PROMPT, get_grouping_context
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +32,19 @@ class GroupListResponse(BaseModel):
     groups: List[GroupSpec]
 
 
+# Below this many components a diagram gets no groups
+MIN_COMPONENTS_FOR_GROUPS = 5
+
+
+def get_grouping_effort(component_count: int) -> str:
+    """Scale reasoning effort with diagram size."""
+    if component_count < 10:
+        return "minimal"
+    if component_count < 25:
+        return "low"
+    return "medium"
+
+
 async def grouping_agent(state: MultiAgentState) -> Dict[str, Any]:
     """
     Grouping Strategist: Creates logical groups.
@@ -51,7 +73,7 @@ async def grouping_agent(state: MultiAgentState) -> Dict[str, Any]:
         }
 
     # Skip grouping for small diagrams
-    if len(components) < 5:
+    if len(components) < MIN_COMPONENTS_FOR_GROUPS:
         logger.info("[Grouping] Skipping groups for small diagram")
         return {
             "groups": [],
@@ -62,8 +84,9 @@ async def grouping_agent(state: MultiAgentState) -> Dict[str, Any]:
             }]
         }
 
-    # Get the specialized prompt
-    prompt = get_grouping_prompt(components, architecture_plan)
+    # Static prompt goes first as the system message so it stays a cacheable
+    # prefix; the per-request context rides in the user message
+    context = get_grouping_context(components, architecture_plan)
 
     # Build user message
     user_message = """Analyze the components and create logical groups if needed.
@@ -71,23 +94,55 @@ async def grouping_agent(state: MultiAgentState) -> Dict[str, Any]:
 Only create groups if they add organizational value.
 Return a JSON object with a 'groups' array (can be empty)."""
 
+    # Diagrams identical apart from component IDs reuse groups, remapped to these IDs.
+    # Reviewer-requested re-runs must not get the same groups back.
+    model = settings.MODEL_GROUPING
+    cache = get_response_cache()
+    cache_key = get_structure_key(model, "grouping", components, architecture_plan)
+    order = get_structural_order(components)
+    is_retry = state.get("review_iterations", 0) > 0
+    cached = None if is_retry else await cache.get(cache_key)
+    if cached is not None:
+        groups = GroupListResponse.model_validate(load_structural(cached, order)).groups
+        logger.info(f"[Grouping] Reusing {len(groups)} groups for identical structure")
+        return {
+            "groups": groups,
+            # Note: current_agent not updated here to avoid parallel write conflict
+            "agent_history": ["grouping"],
+            "messages": [{
+                "role": "system",
+                "content": f"[Grouping] Reused {len(groups)} groups"
+            }]
+        }
+
     # Call GPT-5-mini for fast reasoning
     client = get_openai_client()
 
+    effort = get_grouping_effort(len(components))
+    limits = {}
+    if effort == "minimal":
+        limits["max_completion_tokens"] = settings.MINIMAL_EFFORT_MAX_TOKENS
+
     try:
         # Note: GPT-5-mini reasoning models don't support temperature parameter
-        response = await client.beta.chat.completions.parse(
-            model=settings.MODEL_GROUPING,
-            reasoning_effort="low",  # Fast grouping decisions
+        response = await stream_structured_completion(
+            client,
+            timeout=settings.AGENT_FAST_TIMEOUT_SECONDS,
+            model=model,
+            reasoning_effort=effort,
             messages=[
-                {"role": "system", "content": prompt},
-                {"role": "user", "content": user_message}
+                {"role": "system", "content": GROUPING_PROMPT},
+                {"role": "user", "content": f"{context}\n\n{user_message}"}
             ],
             response_format=GroupListResponse,
+            extra_body={"prompt_cache_key": "diagram-grouping"},
+            **limits,
         )
 
         result = response.choices[0].message.parsed
         groups = result.groups
+        if not is_retry:
+            await cache.set(cache_key, dump_structural(result, order), STRUCTURE_CACHE_TTL_SECONDS)
 
         logger.info(f"[Grouping] Created {len(groups)} groups")
 
@@ -97,6 +152,7 @@ Return a JSON object with a 'groups' array (can be empty)."""
         return {
             "groups": groups,
             # Note: current_agent not updated here to avoid parallel write conflict
+            "agent_history": ["grouping"],
             "messages": [{
                 "role": "system",
                 "content": f"[Grouping] Created {len(groups)} groups"
@@ -2,8 +2,8 @@
 Layout Optimizer Agent
 
 Positions nodes using layer-based layout.
-Uses GPT-4o for reliable numerical calculations.
-Can also use deterministic layout engine as fallback.
+Uses the deterministic layout engine by default; GPT-4o layout can be
+enabled with LAYOUT_USE_LLM.
 """
 
 import logging
@@ -14,7 +14,8 @@ from pydantic import BaseModel
 from app.config import settings
 from app.core.ai.agent_state import MultiAgentState, LayoutPosition
 from app.core.ai.client import get_openai_client
-from app.core.ai.prompts.layout_prompt import get_layout_prompt
+from app.core.ai.utils.agent_executor import stream_structured_completion
+from app.core.ai.prompts.layout_prompt import LAYOUT_PROMPT, get_layout_context
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,11 @@ NODE_HEIGHT = 100
 HORIZONTAL_GAP = 72
 VERTICAL_GAP = 120
 START_X = 100
+# Distance between the left edges of neighbouring nodes in a layer
+STEP = NODE_WIDTH + HORIZONTAL_GAP
+# Space between group column bands; the finalizer pads each group box by
+# 48px on every side, so this leaves a clear gap between neighbouring boxes
+GROUP_GAP = 144
 LAYER_Y_POSITIONS = {
     0: 100,   # External
     1: 300,   # Frontend
@@ -49,44 +55,74 @@ def calculate_layout_deterministic(components: list, groups: list) -> List[Layou
     """
     Calculate layout positions deterministically.
 
-    This is a fallback when LLM layout fails.
+    Nodes keep their layer rows. When there are groups, each group gets its
+    own column band (ungrouped nodes last) and members of a group are laid
+    out inside it, so the finalizer's group boxes never overlap.
     """
     positions = []
 
-    # Group components by layer
-    by_layer = {}
+    # Column band per node: its group's index, ungrouped nodes after all
+    # groups (a node in several groups lands in the last one, like parentId)
+    ungrouped = len(groups)
+    band_of = {
+        node_id: index for index, group in enumerate(groups) for node_id in group.node_ids
+    }
+
+    # bands[band][layer] -> components, in component order
+    bands: Dict[int, Dict[int, list]] = {}
     for comp in components:
-        layer = comp.suggested_layer
-        if layer not in by_layer:
-            by_layer[layer] = []
-        by_layer[layer].append(comp)
-
-    # Calculate positions for each layer
-    for layer in sorted(by_layer.keys()):
-        nodes_in_layer = by_layer[layer]
-        node_count = len(nodes_in_layer)
-
-        # Calculate total width of this layer
-        total_width = (node_count * NODE_WIDTH) + ((node_count - 1) * HORIZONTAL_GAP)
-
-        # Center the layer (assuming 1200px canvas)
-        canvas_width = 1200
-        start_x = max(START_X, (canvas_width - total_width) // 2)
-
-        # Get Y position for this layer
-        y = LAYER_Y_POSITIONS.get(layer, 100 + layer * VERTICAL_GAP)
-
-        # Position each node
-        for order, comp in enumerate(nodes_in_layer):
-            x = start_x + (order * (NODE_WIDTH + HORIZONTAL_GAP))
-
-            positions.append(LayoutPosition(
-                node_id=comp.id,
-                layer=layer,
-                order=order,
-                x=snap_to_grid(x),
-                y=snap_to_grid(y)
-            ))
+        band = band_of.get(comp.id, ungrouped)
+        bands.setdefault(band, {}).setdefault(comp.suggested_layer, []).append(comp)
+
+    # Without distinct groups, center every layer on the canvas as a single row
+    centered = len(bands) == 1
+
+    band_x = START_X
+    next_order: Dict[int, int] = {}
+    for band in sorted(bands):
+        by_layer = bands[band]
+        widest = max(len(nodes) for nodes in by_layer.values())
+        band_width = widest * STEP - HORIZONTAL_GAP
+
+        for layer in sorted(by_layer):
+            nodes_in_layer = by_layer[layer]
+            node_count = len(nodes_in_layer)
+
+            # Calculate total width of this layer
+            total_width = node_count * STEP - HORIZONTAL_GAP
+
+            if centered:
+                # Center the layer (assuming 1200px canvas)
+                canvas_width = 1200
+                start_x = max(START_X, (canvas_width - total_width) // 2)
+            else:
+                # Center the layer within its band
+                start_x = band_x + (band_width - total_width) // 2
+
+            # Get Y position for this layer (shared by every node in it)
+            y = snap_to_grid(LAYER_Y_POSITIONS.get(layer, 100 + layer * VERTICAL_GAP))
+
+            # Position each node. Layers come from validated ComponentSpecs
+            # and coordinates are computed here, so model_construct() skips
+            # re-validating every position.
+            first_order = next_order.get(layer, 0)
+            positions.extend(
+                LayoutPosition.model_construct(
+                    node_id=comp.id,
+                    layer=layer,
+                    order=order,
+                    x=snap_to_grid(x),
+                    y=y
+                )
+                for order, x, comp in zip(
+                    range(first_order, first_order + node_count),
+                    range(start_x, start_x + node_count * STEP, STEP),
+                    nodes_in_layer,
+                )
+            )
+            next_order[layer] = first_order + node_count
+
+        band_x += band_width + GROUP_GAP
 
     return positions
 
@@ -95,8 +131,9 @@ async def layout_agent(state: MultiAgentState) -> Dict[str, Any]:
     """
     Layout Optimizer: Positions nodes by layers.
 
-    Uses GPT-4o for reliable numerical calculations.
-    Falls back to deterministic layout if LLM fails.
+    Uses the deterministic layout unless LAYOUT_USE_LLM is set, in which
+    case GPT-4o positions larger diagrams and the deterministic layout is
+    the fallback.
 
     Args:
         state: Current multi-agent state
@@ -120,13 +157,14 @@ async def layout_agent(state: MultiAgentState) -> Dict[str, Any]:
             }]
         }
 
-    # Try LLM-based layout first for complex diagrams
-    use_llm = len(components) > 3  # Use LLM for larger diagrams
+    # Deterministic layout is the default; the LLM path is opt-in
+    use_llm = settings.LAYOUT_USE_LLM and len(components) > 3
 
     if use_llm:
         try:
-            # Get the specialized prompt
-            prompt = get_layout_prompt(components, groups)
+            # Static prompt goes first as the system message so it stays a cacheable
+            # prefix; the per-request context rides in the user message
+            context = get_layout_context(components, groups)
 
             # Build user message
             user_message = """Calculate the optimal positions for all nodes.
@@ -137,13 +175,16 @@ Return a JSON object with a 'positions' array."""
             # Call GPT-4o for reliable calculations
             client = get_openai_client()
 
-            response = await client.beta.chat.completions.parse(
+            response = await stream_structured_completion(
+                client,
+                timeout=settings.AGENT_FAST_TIMEOUT_SECONDS,
                 model=settings.MODEL_LAYOUT,
                 messages=[
-                    {"role": "system", "content": prompt},
-                    {"role": "user", "content": user_message}
+                    {"role": "system", "content": LAYOUT_PROMPT},
+                    {"role": "user", "content": f"{context}\n\n{user_message}"}
                 ],
                 response_format=LayoutListResponse,
+                extra_body={"prompt_cache_key": "diagram-layout"},
                 temperature=0.2,  # GPT-4o supports temperature
             )
 
@@ -165,20 +206,15 @@ Return a JSON object with a 'positions' array."""
             logger.error(f"[Layout] LLM error, using deterministic: {e}", exc_info=True)
             positions = calculate_layout_deterministic(components, groups)
     else:
-        # Use deterministic layout for small diagrams
-        logger.info("[Layout] Using deterministic layout for small diagram")
+        logger.info("[Layout] Using deterministic layout")
         positions = calculate_layout_deterministic(components, groups)
 
     logger.info(f"[Layout] Final positions: {len(positions)} nodes")
 
-    # Update agent history
-    agent_history = state.get("agent_history", []).copy()
-    agent_history.append("layout")
-
     return {
         "layout_positions": positions,
         "current_agent": "layout",
-        "agent_history": agent_history,
+        "agent_history": ["layout"],
         "messages": [{
             "role": "system",
             "content": f"[Layout] Positioned {len(positions)} nodes"
@@ -5,16 +5,82 @@ Reviews the complete output and decides on routing.
 Uses GPT-5 for deep quality analysis.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict
+import re
+from typing import Any, Dict, List, Optional
 
 from app.config import settings
 from app.core.ai.agent_state import MultiAgentState, QualityReview
 from app.core.ai.client import get_openai_client
-from app.core.ai.prompts.reviewer_prompt import get_reviewer_prompt
+from app.core.ai.utils.agent_executor import get_response_format
+from app.core.ai.prompts.reviewer_prompt import REVIEWER_PROMPT, get_reviewer_context
 
 logger = logging.getLogger(__name__)
 
+# Tags too vague to identify a technology
+GENERIC_TAGS = frozenset({"Database", "Cache", "API", "Service", "Backend", "Frontend", "Server"})
+
+# Structured output emits fields in schema order, so overall_score and
+# decision arrive before the (long) issues and suggestions lists
+SCORE_PATTERN = re.compile(r'"overall_score"\s*:\s*(\d+)')
+DECISION_PATTERN = re.compile(r'"decision"\s*:\s*"(\w+)"')
+
+# Approvals at or above this score end the stream early
+EARLY_APPROVE_MIN_SCORE = 7
+
+
+def early_approval(content: str) -> Optional[QualityReview]:
+    """Return an approval as soon as the partial JSON settles on one."""
+    decision = DECISION_PATTERN.search(content)
+    if decision is None or decision.group(1) != "approve":
+        return None
+    score = SCORE_PATTERN.search(content)
+    if score is None or int(score.group(1)) < EARLY_APPROVE_MIN_SCORE:
+        return None
+    return QualityReview(
+        overall_score=int(score.group(1)),
+        decision="approve",
+        issues=[],
+        suggestions=[],
+        target_agent=None
+    )
+
+
+async def stream_review(
+    client: Any,
+    messages: List[Dict[str, str]],
+    reasoning_effort: str = "medium",
+) -> QualityReview:
+    """
+    Stream the review and stop once it is clearly an approval.
+
+    An approval doesn't need the issues and suggestions that follow the
+    decision, so the stream is closed as soon as the decision is known.
+    Other decisions are read to the end and validated as usual.
+    """
+    limits = {}
+    if reasoning_effort == "minimal":
+        limits["max_completion_tokens"] = settings.MINIMAL_EFFORT_MAX_TOKENS
+
+    async with client.beta.chat.completions.stream(
+        model=settings.MODEL_REVIEWER,
+        reasoning_effort=reasoning_effort,
+        messages=messages,
+        response_format=get_response_format(QualityReview),
+        extra_body={"prompt_cache_key": "diagram-reviewer"},
+        **limits,
+    ) as stream:
+        async for event in stream:
+            if event.type == "content.delta":
+                review = early_approval(event.snapshot)
+                if review is not None:
+                    logger.info("[Reviewer] Approval decided, closing stream early")
+                    return review
+        completion = await stream.get_final_completion()
+
+    return QualityReview.model_validate_json(completion.choices[0].message.content)
+
 
 async def reviewer_agent(state: MultiAgentState) -> Dict[str, Any]:
     """
@@ -61,33 +127,63 @@ async def reviewer_agent(state: MultiAgentState) -> Dict[str, Any]:
     # Quick validation before LLM call
     quick_issues = []
 
-    # Check for orphan nodes (non-actor nodes with no connections)
+    # One pass over the edges collects both the connected node IDs and the
+    # edges missing a protocol label
     connected_nodes = set()
+    unlabeled = []
     for conn in connections:
         connected_nodes.add(conn.source)
         connected_nodes.add(conn.target)
+        if not conn.label:
+            unlabeled.append(conn.id)
 
+    # Check for orphan nodes (non-actor nodes with no connections)
     orphans = [
         c.id for c in components
-        if c.id not in connected_nodes and c.nodeType != "actor"
+        if c.nodeType != "actor" and c.id not in connected_nodes
     ]
     if orphans:
         quick_issues.append(f"Orphan nodes: {orphans}")
 
-    # Check for generic tags
-    generic_tags = {"Database", "Cache", "API", "Service", "Backend", "Frontend", "Server"}
-    for comp in components:
-        if any(tag in generic_tags for tag in comp.tags):
-            quick_issues.append(f"Generic tags in {comp.id}: {comp.tags}")
-            break
+    # Check for generic tags (first offending component only)
+    generic = next((c for c in components if not GENERIC_TAGS.isdisjoint(c.tags)), None)
+    if generic is not None:
+        quick_issues.append(f"Generic tags in {generic.id}: {generic.tags}")
 
     # Check for unlabeled edges
-    unlabeled = [c.id for c in connections if not c.label]
     if unlabeled:
         quick_issues.append(f"Unlabeled edges: {unlabeled}")
 
-    # Get the specialized prompt
-    prompt = get_reviewer_prompt(
+    # Small diagrams that pass every quick check don't need the GPT-5 review.
+    # Empty diagrams and output from an agent's fallback path always get one.
+    if (
+        not quick_issues
+        and components
+        and not state.get("warnings")
+        and len(components) <= settings.REVIEWER_SKIP_MAX_COMPONENTS
+        and len(layout_positions) == len(components)
+    ):
+        logger.info("[Reviewer] Quick validation clean on small diagram, approving")
+        return {
+            "quality_review": QualityReview(
+                overall_score=9,
+                decision="approve",
+                issues=[],
+                suggestions=[],
+                target_agent=None
+            ),
+            "current_agent": "reviewer",
+            "agent_history": ["reviewer"],
+            "review_iterations": review_iterations + 1,
+            "messages": [{
+                "role": "system",
+                "content": "[Reviewer] Quick validation clean, approving"
+            }]
+        }
+
+    # Static prompt goes first as the system message so it stays a cacheable
+    # prefix; the per-request context rides in the user message
+    context = get_reviewer_context(
         architecture_plan=architecture_plan,
         components=components,
         connections=connections,
@@ -107,18 +203,16 @@ async def reviewer_agent(state: MultiAgentState) -> Dict[str, Any]:
 
     try:
         # Note: GPT-5 reasoning models don't support temperature parameter
-        response = await client.beta.chat.completions.parse(
-            model=settings.MODEL_REVIEWER,
-            reasoning_effort="medium",  # Thorough quality review
-            messages=[
-                {"role": "system", "content": prompt},
-                {"role": "user", "content": user_message}
-            ],
-            response_format=QualityReview,
+        # Thorough review when the quick checks found something, otherwise
+        # the model mostly confirms a clean diagram
+        review = await asyncio.wait_for(
+            stream_review(client, [
+                {"role": "system", "content": REVIEWER_PROMPT},
+                {"role": "user", "content": f"{context}\n\n{user_message}"}
+            ], reasoning_effort="medium" if quick_issues else "minimal"),
+            settings.AGENT_TIMEOUT_SECONDS,
         )
 
-        review = response.choices[0].message.parsed
-
         logger.info(
             f"[Reviewer] Score: {review.overall_score}/10, "
             f"Decision: {review.decision}, "
@@ -129,14 +223,10 @@ async def reviewer_agent(state: MultiAgentState) -> Dict[str, Any]:
             for issue in review.issues[:3]:  # Log first 3 issues
                 logger.info(f"[Reviewer] Issue: {issue}")
 
-        # Update agent history
-        agent_history = state.get("agent_history", []).copy()
-        agent_history.append("reviewer")
-
         return {
             "quality_review": review,
             "current_agent": "reviewer",
-            "agent_history": agent_history,
+            "agent_history": ["reviewer"],
             "review_iterations": review_iterations + 1,
             "messages": [{
                 "role": "system",
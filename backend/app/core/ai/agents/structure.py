@@ -0,0 +1,153 @@
+"""
+Structure Agent (Connection + Grouping)
+
+Defines edges and logical groups in a single GPT-5-mini call.
+Both steps read the same component list, so one combined call saves a
+round-trip and a second pass over the same prompt tokens.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+from app.config import settings
+from app.core.ai.agent_state import MultiAgentState, ConnectionSpec, GroupSpec
+from app.core.ai.client import get_openai_client
+from app.core.ai.response_cache import get_response_cache
+from app.core.ai.structure_cache import (
+    STRUCTURE_CACHE_TTL_SECONDS,
+    dump_structural,
+    get_structural_order,
+    get_structure_key,
+    load_structural,
+)
+from app.core.ai.utils.agent_executor import stream_structured_completion
+from app.core.ai.prompts.structure_prompt import STRUCTURE_PROMPT, get_structure_context
+from .connection import build_fallback_connections, connection_agent
+from .grouping import MIN_COMPONENTS_FOR_GROUPS, get_grouping_effort
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionsAndGroupsResponse(BaseModel):
+    """Wrapper for the combined connection and group response"""
+    connections: List[ConnectionSpec]
+    groups: List[GroupSpec]
+
+
+async def structure_agent(state: MultiAgentState) -> Dict[str, Any]:
+    """
+    Structure agent: Defines connections and groups together.
+
+    Small diagrams don't get groups, so they go straight to the
+    connection agent.
+
+    Args:
+        state: Current multi-agent state
+
+    Returns:
+        Dict with connections and groups lists and updated state fields
+    """
+    components = state.get("components", [])
+
+    if len(components) < MIN_COMPONENTS_FOR_GROUPS:
+        logger.info("[Structure] Small diagram, connections only")
+        result = await connection_agent(state)
+        result["groups"] = []
+        return result
+
+    logger.info("[Structure] Starting connection and group definition")
+
+    # Diagrams identical apart from component IDs reuse connections and
+    # groups, remapped to these component IDs
+    model = settings.MODEL_CONNECTION
+    cache = get_response_cache()
+    architecture_plan = state.get("architecture_plan")
+    cache_key = get_structure_key(model, "structure", components, architecture_plan)
+    order = get_structural_order(components)
+    is_retry = state.get("review_iterations", 0) > 0
+    cached = None if is_retry else await cache.get(cache_key)
+    if cached is not None:
+        result = ConnectionsAndGroupsResponse.model_validate(load_structural(cached, order))
+        logger.info("[Structure] Reusing connections and groups for identical structure")
+        return {
+            "connections": result.connections,
+            "groups": result.groups,
+            "current_agent": "structure",
+            "agent_history": ["connection", "grouping"],
+            "messages": [{
+                "role": "system",
+                "content": f"[Structure] Reused {len(result.connections)} connections and {len(result.groups)} groups"
+            }]
+        }
+
+    # Static prompt as the system message (cacheable prefix), per-request
+    # context in the user message
+    context = get_structure_context(components, architecture_plan)
+
+    user_message = """Define the connections between these components and create logical groups if needed.
+
+Every connection MUST have a protocol label.
+Only create groups if they add organizational value.
+Return a JSON object with a 'connections' array and a 'groups' array (can be empty)."""
+
+    # Call GPT-5-mini for fast reasoning
+    client = get_openai_client()
+
+    # Effort scales with size like grouping, but without grouping's token cap
+    # at "minimal": every connection carries a rationale, so a capped reply
+    # could be cut off and fall back to the basic connections
+    effort = get_grouping_effort(len(components))
+
+    try:
+        # Note: GPT-5-mini reasoning models don't support temperature parameter
+        response = await stream_structured_completion(
+            client,
+            timeout=settings.AGENT_FAST_TIMEOUT_SECONDS,
+            model=model,
+            reasoning_effort=effort,
+            messages=[
+                {"role": "system", "content": STRUCTURE_PROMPT},
+                {"role": "user", "content": f"{context}\n\n{user_message}"}
+            ],
+            response_format=ConnectionsAndGroupsResponse,
+            extra_body={"prompt_cache_key": "diagram-structure"},
+        )
+
+        result = response.choices[0].message.parsed
+        connections = result.connections
+        groups = result.groups
+        if not is_retry:
+            await cache.set(cache_key, dump_structural(result, order), STRUCTURE_CACHE_TTL_SECONDS)
+
+        logger.info(
+            f"[Structure] Created {len(connections)} connections, {len(groups)} groups"
+        )
+
+        return {
+            "connections": connections,
+            "groups": groups,
+            "current_agent": "structure",
+            "agent_history": ["connection", "grouping"],
+            "messages": [{
+                "role": "system",
+                "content": f"[Structure] Created {len(connections)} connections and {len(groups)} groups"
+            }]
+        }
+
+    except Exception as e:
+        logger.error(f"[Structure] Error: {e}", exc_info=True)
+
+        # Fallback: basic connections, no groups (same as the separate agents)
+        return {
+            "connections": build_fallback_connections(components),
+            "groups": [],
+            "current_agent": "structure",
+            "agent_history": ["connection", "grouping"],
+            "warnings": [f"Structure fallback used: {str(e)}"],
+            "messages": [{
+                "role": "system",
+                "content": "[Structure] Using fallback connections, no groups"
+            }]
+        }
@@ -1,31 +1,133 @@
 """
 Shared OpenAI Client
 
-Provides a singleton AsyncOpenAI client used by all agents.
-Eliminates duplicate client initialization code across agents.
+Provides a singleton AsyncOpenAI client used by all agents and routes.
+The client owns one pooled httpx connection pool (HTTP/2 when h2 is
+installed) so requests reuse warm keep-alive connections instead of
+paying a TCP+TLS handshake each time.
+
+Also provides single-flight coalescing so identical LLM calls made
+concurrently share one request.
 """
 
+import asyncio
+import importlib.util
+from typing import Any, Awaitable, Callable, Dict, List, TypeVar
+
+import httpx
 from openai import AsyncOpenAI
 
 from app.config import settings
 
+# Connection pool limits for the shared HTTP client
+MAX_CONNECTIONS = 200
+MAX_KEEPALIVE_CONNECTIONS = 100
+
+# Retries for connection errors, 429s and 5xx (the SDK default, made explicit)
+MAX_RETRIES = 2
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 # Lazy-loaded OpenAI client singleton
 _client = None
 
+# In-flight calls by key as [task, number of waiting callers] (see coalesce)
+_inflight: Dict[str, List[Any]] = {}
+
+T = TypeVar("T")
+
 
 def get_openai_client() -> AsyncOpenAI:
     """
     Get or create the shared OpenAI client singleton.
 
+    The app lifespan creates it at startup. Call this from the event loop
+    only: the lazy creation has no lock, so calls from threadpool workers
+    could race and build extra clients. Routes use
+    Depends(openai_client_dependency) instead.
+
     Returns:
         AsyncOpenAI client instance
     """
     global _client
     if _client is None:
-        _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(600.0, connect=5.0),
+        )
+        _client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=http_client,
+            max_retries=MAX_RETRIES,
+        )
     return _client
 
 
+async def openai_client_dependency() -> AsyncOpenAI:
+    """
+    FastAPI dependency for the shared client.
+
+    Async so FastAPI runs it on the event loop rather than in the threadpool.
+    """
+    return get_openai_client()
+
+
+async def close_client() -> None:
+    """Close the shared client's connection pool (called on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+async def coalesce(key: str, factory: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run factory once for concurrent callers with the same key.
+
+    The first caller starts factory as a separate task; every caller,
+    including the first, awaits that task, so cancelling one request
+    (e.g. a client disconnect) never cancels the call for the others. The
+    task is cancelled only once no caller is left waiting. Nothing is kept
+    once the call finishes, so this only dedups bursts; the response cache
+    covers repeats over time.
+
+    Args:
+        key: Hash of the model and prompt (e.g. from make_cache_key)
+        factory: Zero-argument coroutine function making the call
+
+    Returns:
+        The factory's result
+    """
+    entry = _inflight.get(key)
+    if entry is None:
+        # The call runs as its own task so no single caller owns it
+        entry = _inflight[key] = [asyncio.ensure_future(factory()), 0]
+
+        def forget(_: "asyncio.Future[Any]") -> None:
+            if _inflight.get(key) is entry:
+                del _inflight[key]
+
+        entry[0].add_done_callback(forget)
+
+    task = entry[0]
+    entry[1] += 1
+    try:
+        # shield: a cancelled caller must not cancel the shared call
+        return await asyncio.shield(task)
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0 and not task.done():
+            # Every caller has been cancelled, so nobody needs the result
+            if _inflight.get(key) is entry:
+                del _inflight[key]
+            task.cancel()
+
+
 def reset_client() -> None:
     """Reset the client singleton (useful for testing)."""
     global _client
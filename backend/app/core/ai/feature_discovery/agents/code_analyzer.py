@@ -5,25 +5,38 @@ Analyzes the repository structure, patterns, and existing features.
 Uses GPT-5.2 for deep reasoning about code architecture.
 """
 
+import json
 import logging
 from typing import Any, Dict
 
 from app.config import settings
-from app.core.ai.client import get_openai_client
+from app.core.ai.client import coalesce, get_openai_client
+from app.core.ai.utils.agent_executor import stream_structured_completion
 from app.core.ai.feature_discovery.state import FeatureDiscoveryState, CodeAnalysisResult
+from app.core.ai.response_cache import get_response_cache, make_completion_key
 from app.core.ai.prompts.feature_discovery.code_analyzer import (
     CODE_ANALYZER_SYSTEM,
     CODE_ANALYZER_PROMPT,
 )
 from app.utils.repository_formatting import (
-    format_file_tree,
+    KEY_FILES_TOTAL_TOKEN_BUDGET,
+    get_formatted_sections,
     format_key_files,
-    format_dependencies,
+    select_relevant_files,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def serialize_code_analysis(code_analysis: dict) -> str:
+    """
+    Serialize the analysis once for the downstream agent prompts.
+
+    Sorted keys keep the bytes identical across runs for the same analysis.
+    """
+    return json.dumps(code_analysis, indent=2, sort_keys=True)
+
+
 async def code_analyzer_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
     """
     Code Analyzer Agent: Analyzes repository structure and patterns.
@@ -46,6 +59,7 @@ async def code_analyzer_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
     if user_context:
         user_context_section = f"\n## User Guidance\n{user_context}\n"
 
+    sections = get_formatted_sections(repo_analysis)
     prompt = CODE_ANALYZER_PROMPT.format(
         owner=repo_analysis.get("owner", "unknown"),
         repo_name=repo_analysis.get("repo_name", "unknown"),
@@ -53,35 +67,75 @@ async def code_analyzer_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
         language=repo_analysis.get("language", "unknown"),
         description=repo_analysis.get("description", "(no description)"),
         topics=", ".join(repo_analysis.get("topics", [])) or "(none)",
-        file_tree=format_file_tree(repo_analysis.get("file_tree", [])),
+        file_tree=sections["file_tree"],
         readme_content=repo_analysis.get("readme_content", "(no README)") or "(no README)",
-        key_files_content=format_key_files(repo_analysis.get("key_files", [])),
-        dependencies=format_dependencies(repo_analysis),
+        key_files_content=format_key_files(select_relevant_files(
+            repo_analysis.get("key_files", []),
+            user_context or repo_analysis.get("description"),
+        ), total_tokens=KEY_FILES_TOTAL_TOKEN_BUDGET),
+        dependencies=sections["dependencies"],
         user_context_section=user_context_section,
     )
 
+    # The prompt embeds the file tree, key file contents and dependencies, so
+    # hashing it keys the analysis on the repository content at this commit.
+    # Same key as the streaming pipeline, so either path reuses the other's result.
+    model = settings.MODEL_FEATURE_CODE_ANALYZER
+    reasoning_effort = "medium"
+    messages = [
+        {"role": "system", "content": CODE_ANALYZER_SYSTEM},
+        {"role": "user", "content": prompt}
+    ]
+    use_cache = state.get("use_cache", True)
+    cache = get_response_cache()
+    cache_key = make_completion_key(model, CodeAnalysisResult.__name__, reasoning_effort, messages)
+    cached = await cache.get(cache_key) if use_cache else None
+    if cached is not None:
+        analysis = CodeAnalysisResult.model_validate_json(cached)
+        analysis_dict = analysis.model_dump()
+        logger.info("[CodeAnalyzer] Reusing cached analysis")
+        return {
+            "code_analysis": analysis_dict,
+            "code_analysis_json": serialize_code_analysis(analysis_dict),
+            "current_agent": "code_analyzer",
+            "agent_history": ["code_analyzer"],
+            "status": "in_progress",
+            "messages": [{
+                "role": "system",
+                "content": f"[CodeAnalyzer] Reused {analysis.architecture_type} analysis for unchanged repository"
+            }]
+        }
+
     client = get_openai_client()
 
-    try:
-        response = await client.beta.chat.completions.parse(
-            model=settings.MODEL_FEATURE_CODE_ANALYZER,
-            reasoning_effort="medium",
-            messages=[
-                {"role": "system", "content": CODE_ANALYZER_SYSTEM},
-                {"role": "user", "content": prompt}
-            ],
+    async def analyze() -> CodeAnalysisResult:
+        response = await stream_structured_completion(
+            client,
+            timeout=settings.AGENT_TIMEOUT_SECONDS,
+            model=model,
+            reasoning_effort=reasoning_effort,
+            messages=messages,
             response_format=CodeAnalysisResult,
         )
-
         analysis = response.choices[0].message.parsed
+        if use_cache:
+            await cache.set(cache_key, analysis.model_dump_json())
+        return analysis
+
+    try:
+        # Concurrent analyses of the same repository share one call; a
+        # forced re-run doesn't join a cached run in flight
+        analysis = await coalesce(cache_key, analyze) if use_cache else await analyze()
 
         logger.info(
             f"[CodeAnalyzer] Analysis complete: {analysis.architecture_type}, "
             f"{len(analysis.key_components)} components, {len(analysis.existing_features)} features"
         )
 
+        analysis_dict = analysis.model_dump()
         return {
-            "code_analysis": analysis.model_dump(),
+            "code_analysis": analysis_dict,
+            "code_analysis_json": serialize_code_analysis(analysis_dict),
             "current_agent": "code_analyzer",
             "agent_history": ["code_analyzer"],
             "status": "in_progress",
@@ -107,8 +161,10 @@ async def code_analyzer_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
             todo_comments=[],
         )
 
+        fallback_dict = fallback.model_dump()
         return {
-            "code_analysis": fallback.model_dump(),
+            "code_analysis": fallback_dict,
+            "code_analysis_json": serialize_code_analysis(fallback_dict),
             "current_agent": "code_analyzer",
             "agent_history": ["code_analyzer"],
             "status": "in_progress",
@@ -5,7 +5,6 @@ Identifies potential features from code analysis.
 Uses GPT-5.2 for feature identification.
 """
 
-import json
 import logging
 from typing import Any, Dict, List
 
@@ -13,6 +12,7 @@ from pydantic import BaseModel, Field
 
 from app.config import settings
 from app.core.ai.client import get_openai_client
+from app.core.ai.utils.agent_executor import cached_structured_completion
 from app.core.ai.feature_discovery.state import (
     FeatureDiscoveryState,
     DiscoveredFeature,
@@ -23,6 +23,7 @@ from app.core.ai.prompts.feature_discovery.feature_discoverer import (
     FEATURE_DISCOVERER_SYSTEM,
     FEATURE_DISCOVERER_PROMPT,
 )
+from .code_analyzer import serialize_code_analysis
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +64,7 @@ async def feature_discoverer_agent(state: FeatureDiscoveryState) -> Dict[str, An
         user_context_section = f"\n## User Guidance\n{user_context}\n"
 
     prompt = FEATURE_DISCOVERER_PROMPT.format(
-        code_analysis=json.dumps(code_analysis, indent=2),
+        code_analysis=state.get("code_analysis_json") or serialize_code_analysis(code_analysis),
         owner=repo_analysis.get("owner", "unknown"),
         repo_name=repo_analysis.get("repo_name", "unknown"),
         primary_domain=code_analysis.get("primary_domain", "software project"),
@@ -76,7 +77,10 @@ async def feature_discoverer_agent(state: FeatureDiscoveryState) -> Dict[str, An
     client = get_openai_client()
 
     try:
-        response = await client.beta.chat.completions.parse(
+        result = await cached_structured_completion(
+            client,
+            use_cache=state.get("use_cache", True),
+            timeout=settings.AGENT_TIMEOUT_SECONDS,
             model=settings.MODEL_FEATURE_DISCOVERER,
             reasoning_effort="medium",
             messages=[
@@ -84,9 +88,9 @@ async def feature_discoverer_agent(state: FeatureDiscoveryState) -> Dict[str, An
                 {"role": "user", "content": prompt}
             ],
             response_format=DiscoveredFeaturesResponse,
+            extra_body={"prompt_cache_key": "feature-discoverer"},
         )
 
-        result = response.choices[0].message.parsed
         features = [f.model_dump() for f in result.features]
 
         logger.info(f"[FeatureDiscoverer] Discovered {len(features)} features")
@@ -94,7 +98,7 @@ async def feature_discoverer_agent(state: FeatureDiscoveryState) -> Dict[str, An
         return {
             "discovered_features": features,
             "current_agent": "feature_discoverer",
-            "agent_history": state.get("agent_history", []) + ["feature_discoverer"],
+            "agent_history": ["feature_discoverer"],
             "messages": [{
                 "role": "system",
                 "content": f"[FeatureDiscoverer] Discovered {len(features)} potential features"
@@ -107,7 +111,7 @@ async def feature_discoverer_agent(state: FeatureDiscoveryState) -> Dict[str, An
         return {
             "discovered_features": [],
             "current_agent": "feature_discoverer",
-            "agent_history": state.get("agent_history", []) + ["feature_discoverer"],
+            "agent_history": ["feature_discoverer"],
             "error_message": str(e),
             "messages": [{
                 "role": "system",
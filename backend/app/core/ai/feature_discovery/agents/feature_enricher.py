@@ -13,6 +13,8 @@ from pydantic import BaseModel, Field
 
 from app.config import settings
 from app.core.ai.client import get_openai_client
+from app.core.ai.utils.agent_executor import cached_structured_completion
+from app.core.ai.feature_discovery.dedup import dedupe_similar_features
 from app.core.ai.feature_discovery.state import (
     FeatureDiscoveryState,
     EnrichedFeature,
@@ -40,12 +42,12 @@ def format_features_for_enrichment(features: List[dict], source_type: str) -> st
     parts = []
     for f in features:
         parts.append(f"- **{f.get('temp_id', 'unknown')}**: {f.get('title', 'Untitled')}")
-        if f.get("evidence"):
-            parts.append(f"  Evidence: {f.get('evidence')[:200]}")
-        if f.get("rationale"):
-            parts.append(f"  Rationale: {f.get('rationale')[:200]}")
-        if f.get("category"):
-            parts.append(f"  Category: {f.get('category')}")
+        if evidence := f.get("evidence"):
+            parts.append(f"  Evidence: {evidence[:200]}")
+        if rationale := f.get("rationale"):
+            parts.append(f"  Rationale: {rationale[:200]}")
+        if category := f.get("category"):
+            parts.append(f"  Category: {category}")
 
     return "\n".join(parts)
 
@@ -77,13 +79,20 @@ async def feature_enricher_agent(state: FeatureDiscoveryState) -> Dict[str, Any]
         return {
             "enriched_features": [],
             "current_agent": "feature_enricher",
-            "agent_history": state.get("agent_history", []) + ["feature_enricher"],
+            "agent_history": ["feature_enricher"],
             "messages": [{
                 "role": "system",
                 "content": "[FeatureEnricher] No features to enrich"
             }]
         }
 
+    client = get_openai_client()
+
+    # The upstream agents often find the same feature in different words
+    discovered_features, gap_features, tech_debt_features = await dedupe_similar_features(
+        client, [discovered_features, gap_features, tech_debt_features]
+    )
+
     user_context_section = ""
     if user_context:
         user_context_section = f"\n## User Guidance\n{user_context}\n"
@@ -98,10 +107,11 @@ async def feature_enricher_agent(state: FeatureDiscoveryState) -> Dict[str, Any]
         user_context_section=user_context_section,
     )
 
-    client = get_openai_client()
-
     try:
-        response = await client.beta.chat.completions.parse(
+        result = await cached_structured_completion(
+            client,
+            use_cache=state.get("use_cache", True),
+            timeout=settings.AGENT_TIMEOUT_SECONDS,
             model=settings.MODEL_FEATURE_ENRICHER,
             reasoning_effort="medium",
             messages=[
@@ -109,9 +119,9 @@ async def feature_enricher_agent(state: FeatureDiscoveryState) -> Dict[str, Any]
                 {"role": "user", "content": prompt}
             ],
             response_format=EnrichedFeaturesResponse,
+            extra_body={"prompt_cache_key": "feature-enricher"},
         )
 
-        result = response.choices[0].message.parsed
         features = [f.model_dump() for f in result.features]
 
         logger.info(f"[FeatureEnricher] Enriched {len(features)} features")
@@ -119,7 +129,7 @@ async def feature_enricher_agent(state: FeatureDiscoveryState) -> Dict[str, Any]
         return {
             "enriched_features": features,
             "current_agent": "feature_enricher",
-            "agent_history": state.get("agent_history", []) + ["feature_enricher"],
+            "agent_history": ["feature_enricher"],
             "messages": [{
                 "role": "system",
                 "content": f"[FeatureEnricher] Enriched {len(features)} features with full specifications"
@@ -148,7 +158,7 @@ async def feature_enricher_agent(state: FeatureDiscoveryState) -> Dict[str, Any]
         return {
             "enriched_features": fallback_enriched,
             "current_agent": "feature_enricher",
-            "agent_history": state.get("agent_history", []) + ["feature_enricher"],
+            "agent_history": ["feature_enricher"],
             "error_message": str(e),
             "messages": [{
                 "role": "system",
@@ -5,7 +5,6 @@ Identifies missing features by comparing to best practices.
 Uses GPT-5.2-mini for efficiency.
 """
 
-import json
 import logging
 from typing import Any, Dict, List
 
@@ -13,6 +12,7 @@ from pydantic import BaseModel, Field
 
 from app.config import settings
 from app.core.ai.client import get_openai_client
+from app.core.ai.utils.agent_executor import cached_structured_completion
 from app.core.ai.feature_discovery.state import (
     FeatureDiscoveryState,
     GapFeature,
@@ -22,6 +22,7 @@ from app.core.ai.prompts.feature_discovery.gap_analyst import (
     GAP_ANALYST_SYSTEM,
     GAP_ANALYST_PROMPT,
 )
+from .code_analyzer import serialize_code_analysis
 
 logger = logging.getLogger(__name__)
 
@@ -53,18 +54,25 @@ async def gap_analyst_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
     # Limit gap features to ~30% of max
     max_gap_features = max(3, max_features // 3)
 
-    # Format discovered features
-    discovered_str = "\n".join([
-        f"- {f.get('title', 'Untitled')}: {f.get('evidence', '')[:100]}"
-        for f in discovered_features
-    ]) if discovered_features else "(none discovered yet)"
+    # Format discovered features. Gap analysis runs alongside the feature
+    # discoverer, so without its output compare against the features the
+    # code analyzer already found in the code.
+    if discovered_features:
+        discovered_str = "\n".join([
+            f"- {f.get('title', 'Untitled')}: {f.get('evidence', '')[:100]}"
+            for f in discovered_features
+        ])
+    else:
+        discovered_str = "\n".join(
+            f"- {title}" for title in code_analysis.get("existing_features", [])
+        ) or "(none discovered yet)"
 
     user_context_section = ""
     if user_context:
         user_context_section = f"\n## User Guidance\n{user_context}\n"
 
     prompt = GAP_ANALYST_PROMPT.format(
-        code_analysis=json.dumps(code_analysis, indent=2),
+        code_analysis=state.get("code_analysis_json") or serialize_code_analysis(code_analysis),
         discovered_features=discovered_str,
         primary_domain=code_analysis.get("primary_domain", "software project"),
         architecture_type=code_analysis.get("architecture_type", "unknown"),
@@ -76,7 +84,10 @@ async def gap_analyst_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
     client = get_openai_client()
 
     try:
-        response = await client.beta.chat.completions.parse(
+        result = await cached_structured_completion(
+            client,
+            use_cache=state.get("use_cache", True),
+            timeout=settings.AGENT_TIMEOUT_SECONDS,
             model=settings.MODEL_FEATURE_GAP_ANALYST,
             reasoning_effort="low",
             messages=[
@@ -84,9 +95,9 @@ async def gap_analyst_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
                 {"role": "user", "content": prompt}
             ],
             response_format=GapFeaturesResponse,
+            extra_body={"prompt_cache_key": "feature-gap-analyst"},
         )
 
-        result = response.choices[0].message.parsed
         features = [f.model_dump() for f in result.features]
 
         logger.info(f"[GapAnalyst] Identified {len(features)} gap features")
@@ -94,7 +105,7 @@ async def gap_analyst_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
         return {
             "gap_features": features,
             "current_agent": "gap_analyst",
-            "agent_history": state.get("agent_history", []) + ["gap_analyst"],
+            "agent_history": ["gap_analyst"],
             "messages": [{
                 "role": "system",
                 "content": f"[GapAnalyst] Identified {len(features)} gap features"
@@ -107,7 +118,7 @@ async def gap_analyst_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
         return {
             "gap_features": [],
             "current_agent": "gap_analyst",
-            "agent_history": state.get("agent_history", []) + ["gap_analyst"],
+            "agent_history": ["gap_analyst"],
             "error_message": str(e),
             "messages": [{
                 "role": "system",
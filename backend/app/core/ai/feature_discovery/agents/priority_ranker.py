@@ -5,7 +5,6 @@ Scores and ranks features by impact, effort, and priority.
 Uses GPT-4o for fast prioritization.
 """
 
-import json
 import logging
 from typing import Any, Dict, List
 
@@ -13,6 +12,8 @@ from pydantic import BaseModel, Field
 
 from app.config import settings
 from app.core.ai.client import get_openai_client
+from app.core.ai.utils.agent_executor import stream_structured_completion
+from app.core.ai.feature_discovery.dedup import dedupe_features
 from app.core.ai.feature_discovery.state import (
     FeatureDiscoveryState,
     RankedFeature,
@@ -36,18 +37,20 @@ def format_enriched_features(features: List[dict]) -> str:
     if not features:
         return "(none)"
 
+    # One string per feature, joined once
     parts = []
     for f in features:
-        parts.append(f"### {f.get('temp_id', 'unknown')}: {f.get('title', 'Untitled')}")
-        parts.append(f"**Category**: {f.get('category', 'unknown')}")
-        parts.append(f"**Source**: {f.get('source', 'unknown')}")
-        parts.append(f"**Problem**: {f.get('problem', 'N/A')}")
-        parts.append(f"**Solution**: {f.get('solution', 'N/A')}")
-        parts.append(f"**Target Users**: {f.get('target_users', 'N/A')}")
-        parts.append(f"**Success Metrics**: {f.get('success_metrics', 'N/A')}")
-        if f.get("technical_notes"):
-            parts.append(f"**Technical Notes**: {f.get('technical_notes')}")
-        parts.append("")  # Empty line
+        notes = f.get("technical_notes")
+        parts.append(
+            f"### {f.get('temp_id', 'unknown')}: {f.get('title', 'Untitled')}\n"
+            f"**Category**: {f.get('category', 'unknown')}\n"
+            f"**Source**: {f.get('source', 'unknown')}\n"
+            f"**Problem**: {f.get('problem', 'N/A')}\n"
+            f"**Solution**: {f.get('solution', 'N/A')}\n"
+            f"**Target Users**: {f.get('target_users', 'N/A')}\n"
+            f"**Success Metrics**: {f.get('success_metrics', 'N/A')}\n"
+            + (f"**Technical Notes**: {notes}\n" if notes else "")
+        )
 
     return "\n".join(parts)
 
@@ -104,7 +107,7 @@ async def priority_ranker_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
     logger.info("[PriorityRanker] Starting priority ranking")
 
     code_analysis = state.get("code_analysis", {})
-    enriched_features = state.get("enriched_features", [])
+    enriched_features = dedupe_features(state.get("enriched_features", []))
     user_context = state.get("user_context")
 
     if not enriched_features:
@@ -113,7 +116,7 @@ async def priority_ranker_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
             "ranked_features": [],
             "candidate_features": [],
             "current_agent": "priority_ranker",
-            "agent_history": state.get("agent_history", []) + ["priority_ranker"],
+            "agent_history": ["priority_ranker"],
             "status": "success",
             "messages": [{
                 "role": "system",
@@ -135,19 +138,20 @@ async def priority_ranker_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
     client = get_openai_client()
 
     try:
-        response = await client.chat.completions.create(
+        response = await stream_structured_completion(
+            client,
+            timeout=settings.AGENT_FAST_TIMEOUT_SECONDS,
             model=settings.MODEL_FEATURE_RANKER,
             messages=[
                 {"role": "system", "content": PRIORITY_RANKER_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"},
+            response_format=RankedFeaturesResponse,
+            extra_body={"prompt_cache_key": "feature-priority-ranker"},
         )
 
-        # Parse response
-        content = response.choices[0].message.content
-        result = json.loads(content)
-        rankings = result.get("rankings", [])
+        result = response.choices[0].message.parsed
+        rankings = [r.model_dump() for r in result.rankings]
 
         # Merge with enriched features
         candidates = merge_ranking_with_enriched(enriched_features, rankings)
@@ -158,7 +162,7 @@ async def priority_ranker_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
             "ranked_features": rankings,
             "candidate_features": candidates,
             "current_agent": "priority_ranker",
-            "agent_history": state.get("agent_history", []) + ["priority_ranker"],
+            "agent_history": ["priority_ranker"],
             "status": "success",
             "messages": [{
                 "role": "system",
@@ -193,7 +197,7 @@ async def priority_ranker_agent(state: FeatureDiscoveryState) -> Dict[str, Any]:
             "ranked_features": [],
             "candidate_features": fallback_candidates,
             "current_agent": "priority_ranker",
-            "agent_history": state.get("agent_history", []) + ["priority_ranker"],
+            "agent_history": ["priority_ranker"],
             "status": "success",
             "error_message": str(e),
             "messages": [{
@@ -5,7 +5,6 @@ Identifies technical debt items as features.
 Uses GPT-5.2-mini for efficiency.
 """
 
-import json
 import logging
 from typing import Any, Dict, List
 
@@ -13,6 +12,7 @@ from pydantic import BaseModel, Field
 
 from app.config import settings
 from app.core.ai.client import get_openai_client
+from app.core.ai.utils.agent_executor import cached_structured_completion
 from app.core.ai.feature_discovery.state import (
     FeatureDiscoveryState,
     TechDebtFeature,
@@ -22,6 +22,7 @@ from app.core.ai.prompts.feature_discovery.tech_debt_analyst import (
     TECH_DEBT_ANALYST_SYSTEM,
     TECH_DEBT_ANALYST_PROMPT,
 )
+from .code_analyzer import serialize_code_analysis
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,7 @@ async def tech_debt_analyst_agent(state: FeatureDiscoveryState) -> Dict[str, Any
         return {
             "tech_debt_features": [],
             "current_agent": "tech_debt_analyst",
-            "agent_history": state.get("agent_history", []) + ["tech_debt_analyst"],
+            "agent_history": ["tech_debt_analyst"],
             "messages": [{
                 "role": "system",
                 "content": "[TechDebtAnalyst] Skipped (disabled by user)"
@@ -82,7 +83,7 @@ async def tech_debt_analyst_agent(state: FeatureDiscoveryState) -> Dict[str, Any
         user_context_section = f"\n## User Guidance\n{user_context}\n"
 
     prompt = TECH_DEBT_ANALYST_PROMPT.format(
-        code_analysis=json.dumps(code_analysis, indent=2),
+        code_analysis=state.get("code_analysis_json") or serialize_code_analysis(code_analysis),
         pain_points=pain_points_str,
         architecture_type=code_analysis.get("architecture_type", "unknown"),
         tech_stack_summary=code_analysis.get("tech_stack_summary", ""),
@@ -94,7 +95,10 @@ async def tech_debt_analyst_agent(state: FeatureDiscoveryState) -> Dict[str, Any
     client = get_openai_client()
 
     try:
-        response = await client.beta.chat.completions.parse(
+        result = await cached_structured_completion(
+            client,
+            use_cache=state.get("use_cache", True),
+            timeout=settings.AGENT_TIMEOUT_SECONDS,
             model=settings.MODEL_FEATURE_TECH_DEBT,
             reasoning_effort="low",
             messages=[
@@ -102,9 +106,9 @@ async def tech_debt_analyst_agent(state: FeatureDiscoveryState) -> Dict[str, Any
                 {"role": "user", "content": prompt}
             ],
             response_format=TechDebtFeaturesResponse,
+            extra_body={"prompt_cache_key": "feature-tech-debt"},
         )
 
-        result = response.choices[0].message.parsed
         features = [f.model_dump() for f in result.features]
 
         logger.info(f"[TechDebtAnalyst] Identified {len(features)} tech debt items")
@@ -112,7 +116,7 @@ async def tech_debt_analyst_agent(state: FeatureDiscoveryState) -> Dict[str, Any
         return {
             "tech_debt_features": features,
             "current_agent": "tech_debt_analyst",
-            "agent_history": state.get("agent_history", []) + ["tech_debt_analyst"],
+            "agent_history": ["tech_debt_analyst"],
             "messages": [{
                 "role": "system",
                 "content": f"[TechDebtAnalyst] Identified {len(features)} tech debt items"
@@ -125,7 +129,7 @@ async def tech_debt_analyst_agent(state: FeatureDiscoveryState) -> Dict[str, Any
         return {
             "tech_debt_features": [],
             "current_agent": "tech_debt_analyst",
-            "agent_history": state.get("agent_history", []) + ["tech_debt_analyst"],
+            "agent_history": ["tech_debt_analyst"],
             "error_message": str(e),
             "messages": [{
                 "role": "system",
@@ -0,0 +1,126 @@
+"""
+Feature Deduplication
+
+The feature discoverer, gap analyst and tech debt analyst work independently
+and often surface the same feature in different words. Merging those before
+enrichment keeps the enricher prompt (and the ranked output) free of repeats;
+exact repeats that survive enrichment are dropped again before ranking.
+"""
+
+import asyncio
+import logging
+from operator import mul
+from typing import List, Optional, Sequence
+
+from openai import AsyncOpenAI
+
+from app.config import settings
+from app.core.ai.response_cache import normalize_prompt
+
+logger = logging.getLogger(__name__)
+
+
+def dedupe_features(features: List[dict]) -> List[dict]:
+    """Drop enriched features whose title and problem repeat an earlier one."""
+    seen = set()
+    unique = []
+    for f in features:
+        key = (normalize_prompt(f.get("title") or ""), normalize_prompt(f.get("problem") or ""))
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(f)
+    return unique
+
+
+def feature_text(feature: dict) -> str:
+    """Text embedded for a feature: its title plus the start of its justification."""
+    detail = feature.get("evidence") or feature.get("rationale") or ""
+    return f"{feature.get('title', '')} {detail[:200]}"
+
+
+def find_cluster_leaders(vectors: List[List[float]], threshold: float) -> List[bool]:
+    """
+    Cluster vectors whose pairwise similarity reaches threshold.
+
+    Returns one flag per vector: True for the lowest index in its cluster,
+    i.e. the highest-priority member, which is the one to keep. CPU-bound
+    (pairs x dimensions); call it off the event loop.
+    """
+    # Union-find; the root is always the lowest index
+    parent = list(range(len(vectors)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(len(vectors)):
+        vector_i = vectors[i]
+        for j in range(i + 1, len(vectors)):
+            # OpenAI embeddings are unit length, so the dot product is the cosine
+            if sum(map(mul, vector_i, vectors[j])) >= threshold:
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    return [find(i) == i for i in range(len(vectors))]
+
+
+async def dedupe_similar_features(
+    client: AsyncOpenAI,
+    feature_lists: Sequence[List[dict]],
+    threshold: Optional[float] = None,
+) -> List[List[dict]]:
+    """
+    Merge near-duplicate features across the upstream agents' lists.
+
+    Features are embedded in one call, pairs at or above the similarity
+    threshold are clustered, and each cluster keeps its first member. Lists
+    are passed in priority order (discovered, gap, tech debt), so a feature
+    the discoverer found wins over the same gap or tech debt item.
+
+    Args:
+        client: OpenAI client
+        feature_lists: Feature lists in priority order
+        threshold: Cosine similarity to merge at (defaults to the setting)
+
+    Returns:
+        The lists in the same order with duplicates removed; unchanged if
+        embedding fails
+    """
+    features = [f for group in feature_lists for f in group]
+    if len(features) < 2:
+        return [list(group) for group in feature_lists]
+    threshold = settings.FEATURE_DEDUP_SIMILARITY if threshold is None else threshold
+
+    try:
+        response = await client.embeddings.create(
+            model=settings.MODEL_FEATURE_EMBEDDING,
+            input=[feature_text(f) for f in features],
+        )
+    except Exception as e:
+        logger.warning(f"[FeatureDedup] Embedding failed, keeping all features: {e}")
+        return [list(group) for group in feature_lists]
+
+    vectors = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    # The pairwise pass is pure Python over 1536-dim vectors; a thread keeps
+    # it from stalling SSE streams and other requests on the event loop
+    leaders = await asyncio.to_thread(find_cluster_leaders, vectors, threshold)
+
+    deduped: List[List[dict]] = []
+    index = 0
+    for group in feature_lists:
+        kept = []
+        for f in group:
+            if leaders[index]:
+                kept.append(f)
+            index += 1
+        deduped.append(kept)
+
+    removed = len(features) - sum(len(kept) for kept in deduped)
+    if removed:
+        logger.info(f"[FeatureDedup] Merged {removed} duplicate features")
+    return deduped
@@ -2,13 +2,14 @@
 Feature Discovery LangGraph Assembly
 
 Creates the StateGraph that orchestrates the multi-agent workflow:
-CodeAnalyzer → FeatureDiscoverer → [GapAnalyst ∥ TechDebtAnalyst] → FeatureEnricher → PriorityRanker
+CodeAnalyzer → [FeatureDiscoverer ∥ GapAnalyst ∥ TechDebtAnalyst] → FeatureEnricher → PriorityRanker
 
 No review loop - features go directly to user for review.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Any, Dict, Literal, Optional
 
 from langgraph.graph import StateGraph, START, END
 
@@ -24,10 +25,68 @@ from .agents import (
 
 logger = logging.getLogger(__name__)
 
-# Singleton graph instance
+# Singleton graph instance, compiled at import (see bottom of module)
 _feature_discovery_graph: Optional[StateGraph] = None
 
 
+async def discovery_fanout(state: FeatureDiscoveryState) -> Dict[str, Any]:
+    """
+    Run the feature discoverer, gap analyst and tech debt analyst together.
+
+    All three only need the code analysis, so their LLM calls run
+    concurrently and the step takes as long as the slowest one. Their
+    results are merged into one state update; the list fields that the
+    state appends to (agent_history, messages) are concatenated.
+    """
+    results = await asyncio.gather(
+        feature_discoverer_agent(state),
+        gap_analyst_agent(state),
+        tech_debt_analyst_agent(state),
+    )
+
+    merged: Dict[str, Any] = {"agent_history": [], "messages": []}
+    for result in results:
+        for key, value in result.items():
+            if key in ("agent_history", "messages"):
+                merged[key].extend(value)
+            elif key == "error_message" and merged.get(key):
+                merged[key] = f"{merged[key]}; {value}"
+            else:
+                merged[key] = value
+    merged["current_agent"] = "discovery_fanout"
+    return merged
+
+
+def no_features(state: FeatureDiscoveryState) -> Dict[str, Any]:
+    """Finish a run that produced no features without calling the later agents."""
+    logger.info("[Graph] No features to enrich or rank, finishing early")
+    return {
+        "enriched_features": [],
+        "ranked_features": [],
+        "candidate_features": [],
+        "current_agent": "no_features",
+        "status": "success",
+        "messages": [{
+            "role": "system",
+            "content": "[Graph] No features discovered, skipped enrichment and ranking"
+        }]
+    }
+
+
+def route_after_fanout(state: FeatureDiscoveryState) -> Literal["feature_enricher", "no_features"]:
+    """Skip enrichment when the discoverer, gap and tech debt agents found nothing."""
+    if state.get("discovered_features") or state.get("gap_features") or state.get("tech_debt_features"):
+        return "feature_enricher"
+    return "no_features"
+
+
+def route_after_enricher(state: FeatureDiscoveryState) -> Literal["priority_ranker", "no_features"]:
+    """Skip the ranker LLM call when there is nothing to rank."""
+    if state.get("enriched_features"):
+        return "priority_ranker"
+    return "no_features"
+
+
 def create_feature_discovery_graph() -> StateGraph:
     """
     Create the feature discovery LangGraph StateGraph.
@@ -41,21 +100,15 @@ def create_feature_discovery_graph() -> StateGraph:
                 │ Code Analyzer│ (GPT-5.2)
                 └──────┬───────┘
                        │
-                       ▼
-                ┌──────────────┐
-                │   Feature    │ (GPT-5.2)
-                │  Discoverer  │
-                └──────┬───────┘
-                       │
-            ┌──────────┴──────────┐
-            ▼                     ▼
-      ┌──────────┐         ┌──────────┐
-      │   Gap    │         │  Tech    │ (parallel)
-      │ Analyst  │         │  Debt    │
-      │(GPT-5.2) │         │(GPT-5.2) │
-      └────┬─────┘         └────┬─────┘
-            │                    │
-            └──────────┬─────────┘
+       ┌───────────────┼───────────────┐
+       ▼               ▼               ▼
+ ┌──────────┐    ┌──────────┐    ┌──────────┐
+ │ Feature  │    │   Gap    │    │  Tech    │ (concurrent,
+ │Discoverer│    │ Analyst  │    │  Debt    │  one node)
+ │(GPT-5.2) │    │(GPT-5.2) │    │(GPT-5.2) │
+ └────┬─────┘    └────┬─────┘    └────┬─────┘
+      │               │               │
+      └───────────────┼───────────────┘
                        ▼
                 ┌──────────────┐
                 │   Feature    │ (GPT-5.2)
@@ -72,6 +125,9 @@ def create_feature_discovery_graph() -> StateGraph:
                       END
     ```
 
+    When the fan-out or the enricher leaves no features, the run goes
+    straight to no_features → END instead of calling the later agents.
+
     Returns:
         Compiled StateGraph ready for execution
     """
@@ -81,27 +137,37 @@ def create_feature_discovery_graph() -> StateGraph:
 
     # Add all agent nodes
     builder.add_node("code_analyzer", code_analyzer_agent)
-    builder.add_node("feature_discoverer", feature_discoverer_agent)
-    builder.add_node("gap_analyst", gap_analyst_agent)
-    builder.add_node("tech_debt_analyst", tech_debt_analyst_agent)
+    builder.add_node("discovery_fanout", discovery_fanout)
     builder.add_node("feature_enricher", feature_enricher_agent)
     builder.add_node("priority_ranker", priority_ranker_agent)
+    builder.add_node("no_features", no_features)
 
-    # === Linear Flow: START → code_analyzer → feature_discoverer ===
+    # === Linear Flow: START → code_analyzer → discovery_fanout ===
     builder.add_edge(START, "code_analyzer")
-    builder.add_edge("code_analyzer", "feature_discoverer")
-
-    # === Parallel: feature_discoverer → gap_analyst AND tech_debt_analyst ===
-    builder.add_edge("feature_discoverer", "gap_analyst")
-    builder.add_edge("feature_discoverer", "tech_debt_analyst")
-
-    # === Converge: gap_analyst AND tech_debt_analyst → feature_enricher ===
-    builder.add_edge("gap_analyst", "feature_enricher")
-    builder.add_edge("tech_debt_analyst", "feature_enricher")
+    builder.add_edge("code_analyzer", "discovery_fanout")
+
+    # === discovery_fanout (discoverer ∥ gap ∥ tech debt) → feature_enricher ===
+    # Runs where every upstream agent came back empty end early
+    builder.add_conditional_edges(
+        "discovery_fanout",
+        route_after_fanout,
+        {
+            "feature_enricher": "feature_enricher",
+            "no_features": "no_features"
+        }
+    )
 
     # === feature_enricher → priority_ranker → END ===
-    builder.add_edge("feature_enricher", "priority_ranker")
+    builder.add_conditional_edges(
+        "feature_enricher",
+        route_after_enricher,
+        {
+            "priority_ranker": "priority_ranker",
+            "no_features": "no_features"
+        }
+    )
     builder.add_edge("priority_ranker", END)
+    builder.add_edge("no_features", END)
 
     # Compile the graph
     graph = builder.compile()
@@ -113,7 +179,10 @@ def create_feature_discovery_graph() -> StateGraph:
 
 def get_feature_discovery_graph() -> StateGraph:
     """
-    Get or create the singleton feature discovery graph.
+    Get the singleton feature discovery graph.
+
+    The graph is compiled when this module is imported, so requests never
+    pay for it; it is only rebuilt here after reset_feature_discovery_graph().
 
     Returns:
         Compiled StateGraph instance
@@ -128,3 +197,7 @@ def reset_feature_discovery_graph():
     """Reset the singleton graph (for testing)."""
     global _feature_discovery_graph
     _feature_discovery_graph = None
+
+
+# Compile once per process at startup rather than on the first request
+_feature_discovery_graph = create_feature_discovery_graph()
@@ -262,6 +262,7 @@ class FeatureDiscoveryState(TypedDict):
 
     # === Agent Outputs ===
     code_analysis: Optional[dict]  # CodeAnalysisResult
+    code_analysis_json: Optional[str]  # code_analysis serialized once for prompts
     discovered_features: List[dict]  # List[DiscoveredFeature]
     gap_features: List[dict]  # List[GapFeature]
     tech_debt_features: List[dict]  # List[TechDebtFeature]
@@ -271,11 +272,12 @@ class FeatureDiscoveryState(TypedDict):
     # === Processing ===
     messages: Annotated[List[dict], operator.add]
     current_agent: str
-    agent_history: List[str]
+    agent_history: Annotated[List[str], operator.add]  # Agents append their name
 
     # === Control ===
     max_features: int
     include_tech_debt: bool
+    use_cache: bool  # False re-runs every agent instead of reusing results
 
     # === Final Result ===
     candidate_features: List[dict]  # List[CandidateFeature]
@@ -290,6 +292,7 @@ def create_initial_discovery_state(
     user_context: Optional[str] = None,
     max_features: int = 15,
     include_tech_debt: bool = True,
+    use_cache: bool = True,
 ) -> FeatureDiscoveryState:
     """
     Create the initial state for a new feature discovery workflow.
@@ -301,6 +304,7 @@ def create_initial_discovery_state(
         user_context: Optional user guidance
         max_features: Maximum number of features to discover
         include_tech_debt: Whether to include tech debt features
+        use_cache: Whether agents may reuse cached results
 
     Returns:
         Initial FeatureDiscoveryState ready for graph execution
@@ -314,6 +318,7 @@ def create_initial_discovery_state(
 
         # Agent Outputs
         code_analysis=None,
+        code_analysis_json=None,
         discovered_features=[],
         gap_features=[],
         tech_debt_features=[],
@@ -328,6 +333,7 @@ def create_initial_discovery_state(
         # Control
         max_features=max_features,
         include_tech_debt=include_tech_debt,
+        use_cache=use_cache,
 
         # Result
         candidate_features=[],
@@ -5,8 +5,9 @@ Defines the shared state for the feature extraction workflow
 that extracts EXISTING features from a GitHub repository.
 """
 
-from typing import TypedDict, List, Optional, Literal
+from typing import TypedDict, Annotated, List, Optional, Literal
 from pydantic import BaseModel, Field
+import operator
 
 
 # =============================================================================
@@ -190,7 +191,7 @@ class FeatureExtractionState(TypedDict):
 
     # Processing
     current_agent: str
-    agent_history: List[str]
+    agent_history: Annotated[List[str], operator.add]  # Agents append their name
 
     # Control
     max_features: int
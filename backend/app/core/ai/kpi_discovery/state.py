@@ -230,7 +230,7 @@ class KPIDiscoveryState(TypedDict):
     # === Processing ===
     messages: Annotated[List[dict], operator.add]
     current_agent: str
-    agent_history: List[str]
+    agent_history: Annotated[List[str], operator.add]  # Agents append their name
 
     # === Control ===
     max_kpis: int
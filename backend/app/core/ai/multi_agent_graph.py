@@ -2,7 +2,7 @@
 Multi-Agent LangGraph Assembly
 
 Creates the StateGraph that orchestrates the multi-agent workflow:
-Architect → Component → [Connection ∥ Grouping] → Layout → Reviewer → Finalizer
+Architect → Component → Structure (Connection + Grouping) → Layout → Reviewer → Finalizer
 
 With quality review loop that can route back to specific agents.
 """
@@ -18,6 +18,7 @@ from .agents import (
     component_agent,
     connection_agent,
     grouping_agent,
+    structure_agent,
     layout_agent,
     reviewer_agent,
     finalizer_agent,
@@ -126,17 +127,15 @@ def create_multi_agent_graph() -> StateGraph:
                     │Component │ (GPT-5)
                     └────┬─────┘
                          │
-              ┌──────────┴──────────┐
-              ▼                     ▼
-        ┌──────────┐         ┌──────────┐
-        │Connection│         │ Grouping │ (parallel)
-        │(GPT-5-mini)        │(GPT-5-mini)
-        └────┬─────┘         └────┬─────┘
-              │                    │
-              └──────────┬─────────┘
                          ▼
                     ┌──────────┐
-                    │  Layout  │ (GPT-4o)
+                    │Structure │ (GPT-5-mini, one call)
+                    │Conn+Group│
+                    └────┬─────┘
+                         │
+                         ▼
+                    ┌──────────┐
+                    │  Layout  │ (deterministic)
                     └────┬─────┘
                          │
                          ▼
@@ -170,6 +169,7 @@ def create_multi_agent_graph() -> StateGraph:
     builder.add_node("component", component_agent)
     builder.add_node("connection", connection_agent)
     builder.add_node("grouping", grouping_agent)
+    builder.add_node("structure", structure_agent)
     builder.add_node("layout", layout_agent)
     builder.add_node("reviewer", reviewer_agent)
     builder.add_node("finalizer", finalizer_agent)
@@ -178,20 +178,19 @@ def create_multi_agent_graph() -> StateGraph:
     builder.add_edge(START, "architect")
     builder.add_edge("architect", "component")
 
-    # === Parallel: component → connection AND grouping ===
-    # Note: In LangGraph, we express parallel execution by having
-    # multiple edges from the same source
-    builder.add_edge("component", "connection")
-    builder.add_edge("component", "grouping")
-
-    # === Converge: connection AND grouping → layout ===
-    # LangGraph waits for both to complete before proceeding
-    builder.add_edge("connection", "layout")
-    builder.add_edge("grouping", "layout")
+    # === component → structure (connections + groups) → layout ===
+    # Layout is deterministic by default, so it costs nothing to wait for
+    # the groups it lays out around
+    builder.add_edge("component", "structure")
+    builder.add_edge("structure", "layout")
 
     # === Layout → Reviewer ===
     builder.add_edge("layout", "reviewer")
 
+    # === Reviewer fixes re-run connection or grouping on their own ===
+    builder.add_edge("connection", "layout")
+    builder.add_edge("grouping", "layout")
+
     # === Reviewer routes conditionally ===
     builder.add_conditional_edges(
         "reviewer",
@@ -9,24 +9,12 @@ import json
 import logging
 from typing import Any, Dict, List, Optional
 
-from openai import AsyncOpenAI
-
 from app.config import settings
+from app.core.ai.client import get_openai_client
 from ..graph_state import GraphState
 
 logger = logging.getLogger(__name__)
 
-# Lazy-loaded OpenAI client
-_client: Optional[AsyncOpenAI] = None
-
-
-def get_openai_client() -> AsyncOpenAI:
-    """Get or create OpenAI client singleton."""
-    global _client
-    if _client is None:
-        _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-    return _client
-
 
 def _get_tools_for_module(module_type: str) -> List[dict]:
     """Get the appropriate tools for the module type."""
@@ -8,24 +8,12 @@ for the next Generator attempt.
 import logging
 from typing import Any, Dict, List
 
-from openai import AsyncOpenAI
-
 from app.config import settings
+from app.core.ai.client import get_openai_client
 from ..graph_state import GraphState, ValidationError
 
 logger = logging.getLogger(__name__)
 
-# Lazy-loaded OpenAI client
-_client = None
-
-
-def get_openai_client() -> AsyncOpenAI:
-    """Get or create OpenAI client singleton."""
-    global _client
-    if _client is None:
-        _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-    return _client
-
 
 def _format_errors(errors: List[ValidationError]) -> str:
     """Format validation errors for the reflection prompt."""
@@ -5,16 +5,17 @@ Each prompt is focused on a single responsibility (~50 lines max)
 instead of the monolithic 276-line prompt.
 """
 
-from .architect_prompt import ARCHITECT_PROMPT, get_architect_prompt
-from .component_prompt import COMPONENT_PROMPT, get_component_prompt
-from .connection_prompt import CONNECTION_PROMPT, get_connection_prompt
-from .grouping_prompt import GROUPING_PROMPT, get_grouping_prompt
-from .layout_prompt import LAYOUT_PROMPT, get_layout_prompt
-from .reviewer_prompt import REVIEWER_PROMPT, get_reviewer_prompt
+from .architect_prompt import ARCHITECT_PROMPT, get_architect_prompt, get_architect_context
+from .component_prompt import COMPONENT_PROMPT, get_component_prompt, get_component_context
+from .connection_prompt import CONNECTION_PROMPT, get_connection_prompt, get_connection_context
+from .grouping_prompt import GROUPING_PROMPT, get_grouping_prompt, get_grouping_context
+from .structure_prompt import STRUCTURE_PROMPT, get_structure_prompt, get_structure_context
+from .layout_prompt import LAYOUT_PROMPT, get_layout_prompt, get_layout_context
+from .reviewer_prompt import REVIEWER_PROMPT, get_reviewer_prompt, get_reviewer_context
 from .finalizer_prompt import FINALIZER_PROMPT, get_finalizer_prompt
 
 # GitHub Import Prompts
-from .code_analyzer_prompt import CODE_ANALYZER_PROMPT, get_code_analyzer_prompt
+from .code_analyzer_prompt import CODE_ANALYZER_PROMPT, get_code_analyzer_prompt, get_code_analyzer_context
 from .diagram_planner_prompt import DIAGRAM_PLANNER_PROMPT, get_diagram_planner_prompt
 
 __all__ = [
@@ -23,6 +24,7 @@ __all__ = [
     "COMPONENT_PROMPT",
     "CONNECTION_PROMPT",
     "GROUPING_PROMPT",
+    "STRUCTURE_PROMPT",
     "LAYOUT_PROMPT",
     "REVIEWER_PROMPT",
     "FINALIZER_PROMPT",
@@ -30,12 +32,21 @@ __all__ = [
     "get_component_prompt",
     "get_connection_prompt",
     "get_grouping_prompt",
+    "get_structure_prompt",
     "get_layout_prompt",
     "get_reviewer_prompt",
     "get_finalizer_prompt",
+    "get_architect_context",
+    "get_component_context",
+    "get_connection_context",
+    "get_grouping_context",
+    "get_structure_context",
+    "get_layout_context",
+    "get_reviewer_context",
     # GitHub import prompts
     "CODE_ANALYZER_PROMPT",
     "DIAGRAM_PLANNER_PROMPT",
     "get_code_analyzer_prompt",
+    "get_code_analyzer_context",
     "get_diagram_planner_prompt",
 ]
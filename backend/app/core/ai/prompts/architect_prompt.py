@@ -53,38 +53,61 @@ Return a JSON object with:
 Be concise and precise. Focus on understanding the CORE architecture needs."""
 
 
-def get_architect_prompt(
+def get_architect_context(
     context: Optional[DiagramContext] = None,
     conversation_history: Optional[list] = None
 ) -> str:
     """
-    Build the complete architect prompt with optional context.
+    Build the per-request part of the architect prompt.
+
+    Kept separate from ARCHITECT_PROMPT so the static prompt can be sent as
+    its own leading message and stay a cacheable prefix across requests.
 
     Args:
         context: Existing diagram context (if modifying)
         conversation_history: Previous conversation for context
 
     Returns:
-        Complete prompt string
+        Context string (empty if there is nothing to add)
     """
-    prompt = ARCHITECT_PROMPT
+    sections = []
 
     # Add context if modifying existing diagram
     if context and context.nodes:
-        prompt += "\n\n## Existing Diagram Context\n"
-        prompt += "The user has an existing diagram. Your plan should account for:\n"
-        prompt += f"- {len(context.nodes)} existing nodes\n"
-        prompt += f"- {len(context.edges) if context.edges else 0} existing connections\n"
-        prompt += "\nConsider whether to extend or modify the existing architecture."
+        section = "## Existing Diagram Context\n"
+        section += "The user has an existing diagram. Your plan should account for:\n"
+        section += f"- {len(context.nodes)} existing nodes\n"
+        section += f"- {len(context.edges) if context.edges else 0} existing connections\n"
+        section += "\nConsider whether to extend or modify the existing architecture."
+        sections.append(section)
 
     # Add conversation context if available
     if conversation_history:
         recent = conversation_history[-3:]  # Last 3 messages
         if recent:
-            prompt += "\n\n## Recent Conversation\n"
+            section = "## Recent Conversation\n"
             for msg in recent:
                 role = msg.get("role", "user")
                 content = msg.get("content", "")[:200]
-                prompt += f"- {role}: {content}...\n"
+                section += f"- {role}: {content}...\n"
+            sections.append(section)
+
+    return "\n\n".join(sections)
+
+
+def get_architect_prompt(
+    context: Optional[DiagramContext] = None,
+    conversation_history: Optional[list] = None
+) -> str:
+    """
+    Build the complete architect prompt with optional context.
+
+    Args:
+        context: Existing diagram context (if modifying)
+        conversation_history: Previous conversation for context
 
-    return prompt
+    Returns:
+        Complete prompt string
+    """
+    dynamic = get_architect_context(context, conversation_history)
+    return f"{ARCHITECT_PROMPT}\n\n{dynamic}" if dynamic else ARCHITECT_PROMPT
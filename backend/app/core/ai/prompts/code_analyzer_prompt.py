@@ -132,21 +132,24 @@ Return a JSON object with:
 Be thorough but concise. Focus on information useful for diagram generation."""
 
 
-def get_code_analyzer_prompt(
+def get_code_analyzer_context(
     repo_analysis: Dict[str, Any],
     max_key_files: int = 10,
 ) -> str:
     """
-    Build the complete code analyzer prompt with repository data.
+    Build the per-request part of the code analyzer prompt.
+
+    Kept separate from CODE_ANALYZER_PROMPT so the static prompt can be sent as the
+    leading system message and stay a cacheable prefix across requests.
 
     Args:
         repo_analysis: RepoAnalysis dict with all parsed data
         max_key_files: Maximum number of key file contents to include
 
     Returns:
-        Complete prompt string with repository context
+        Context string
     """
-    prompt = CODE_ANALYZER_PROMPT
+    prompt = ""
 
     # Add repository metadata
     prompt += "\n\n## Repository Information\n"
@@ -251,4 +254,25 @@ def get_code_analyzer_prompt(
             prompt += "\n```\n"
             count += 1
 
-    return prompt
+    return prompt.lstrip()
+
+
+def get_code_analyzer_prompt(
+    repo_analysis: Dict[str, Any],
+    max_key_files: int = 10,
+) -> str:
+    """
+    Build the complete code analyzer prompt with repository data.
+
+    Args:
+        repo_analysis: RepoAnalysis dict with all parsed data
+        max_key_files: Maximum number of key file contents to include
+
+    Returns:
+        Complete prompt string with repository context
+    """
+    context = get_code_analyzer_context(
+        repo_analysis=repo_analysis,
+        max_key_files=max_key_files,
+    )
+    return f"{CODE_ANALYZER_PROMPT}\n\n{context}"
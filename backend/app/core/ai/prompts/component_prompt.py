@@ -114,26 +114,40 @@ Return a JSON array of components. Each component must have:
 - suggested_layer: 0-5"""
 
 
-def get_component_prompt(architecture_plan: ArchitecturePlan) -> str:
+def get_component_context(architecture_plan: ArchitecturePlan) -> str:
     """
-    Build the component prompt with the architecture plan.
+    Build the plan-specific part of the component prompt.
+
+    Kept separate from COMPONENT_PROMPT (and its node type catalog) so the
+    static prompt stays a cacheable prefix across requests.
 
     Args:
         architecture_plan: Output from the Architect agent
 
     Returns:
-        Complete prompt string
+        Architecture plan section
     """
-    prompt = COMPONENT_PROMPT
-
-    prompt += "\n\n## Architecture Plan\n"
-    prompt += f"**Analysis**: {architecture_plan.analysis}\n"
-    prompt += f"**Categories Needed**: {', '.join(architecture_plan.component_categories)}\n"
-    prompt += f"**Patterns**: {', '.join(architecture_plan.suggested_patterns)}\n"
-    prompt += f"**Complexity**: {architecture_plan.complexity_score}/10\n"
-    prompt += f"**Expected Nodes**: ~{architecture_plan.estimated_nodes}\n"
+    section = "## Architecture Plan\n"
+    section += f"**Analysis**: {architecture_plan.analysis}\n"
+    section += f"**Categories Needed**: {', '.join(architecture_plan.component_categories)}\n"
+    section += f"**Patterns**: {', '.join(architecture_plan.suggested_patterns)}\n"
+    section += f"**Complexity**: {architecture_plan.complexity_score}/10\n"
+    section += f"**Expected Nodes**: ~{architecture_plan.estimated_nodes}\n"
 
     if architecture_plan.special_requirements:
-        prompt += f"**Special Requirements**: {', '.join(architecture_plan.special_requirements)}\n"
+        section += f"**Special Requirements**: {', '.join(architecture_plan.special_requirements)}\n"
 
-    return prompt
+    return section
+
+
+def get_component_prompt(architecture_plan: ArchitecturePlan) -> str:
+    """
+    Build the component prompt with the architecture plan.
+
+    Args:
+        architecture_plan: Output from the Architect agent
+
+    Returns:
+        Complete prompt string
+    """
+    return f"{COMPONENT_PROMPT}\n\n{get_component_context(architecture_plan)}"
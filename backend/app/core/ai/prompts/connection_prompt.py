@@ -80,17 +80,20 @@ Return a JSON array of connections. Each connection must have:
 - rationale: Brief explanation of this connection"""
 
 
-def get_connection_prompt(components: List[ComponentSpec]) -> str:
+def get_connection_context(components: List[ComponentSpec]) -> str:
     """
-    Build the connection prompt with component list.
+    Build the per-request part of the connection prompt.
+
+    Kept separate from CONNECTION_PROMPT so the static prompt can be sent as the
+    leading system message and stay a cacheable prefix across requests.
 
     Args:
         components: List of components from Component Specialist
 
     Returns:
-        Complete prompt string
+        Context string
     """
-    prompt = CONNECTION_PROMPT
+    prompt = ""
 
     prompt += "\n\n## Components to Connect\n"
     prompt += "```json\n"
@@ -132,4 +135,17 @@ def get_connection_prompt(components: List[ComponentSpec]) -> str:
     if has_gateway:
         prompt += "- Route external traffic through the gateway first\n"
 
-    return prompt
+    return prompt.lstrip()
+
+
+def get_connection_prompt(components: List[ComponentSpec]) -> str:
+    """
+    Build the connection prompt with component list.
+
+    Args:
+        components: List of components from Component Specialist
+
+    Returns:
+        Complete prompt string
+    """
+    return f"{CONNECTION_PROMPT}\n\n{get_connection_context(components)}"
@@ -2,6 +2,10 @@
 Feature Discovery Prompts
 
 Prompts for each agent in the feature discovery pipeline.
+
+Each *_SYSTEM message holds all the static instructions and output format
+so it is an identical, cacheable prefix across runs; the *_PROMPT template
+holds only the per-request inputs.
 """
 
 from .code_analyzer import CODE_ANALYZER_PROMPT, CODE_ANALYZER_SYSTEM
@@ -14,24 +14,7 @@ You excel at:
 - Understanding user needs from existing functionality
 - Prioritizing high-value features
 
-Always suggest practical, implementable features."""
-
-FEATURE_DISCOVERER_PROMPT = """Based on the code analysis, identify potential features for this project.
-
-## Code Analysis Results
-```json
-{code_analysis}
-```
-
-## Repository Context
-- **Owner/Repo**: {owner}/{repo_name}
-- **Domain**: {primary_domain}
-- **Architecture**: {architecture_type}
-
-## Existing Features (already implemented)
-{existing_features}
-
-{user_context_section}
+Always suggest practical, implementable features.
 
 ## Discovery Guidelines
 
@@ -56,20 +39,37 @@ Look for features from:
 ## Output Format
 Return a JSON object:
 ```json
-{{
+{
     "features": [
-        {{
+        {
             "temp_id": "disc_0",
             "title": "Short feature title (max 80 chars)",
             "category": "user_facing|integration|performance|security|developer_experience|infrastructure|documentation|testing",
             "source": "code_pattern|readme|todo_comment|gap_analysis|tech_debt|architecture",
             "evidence": "What in the code suggests this feature",
             "confidence": 0.85
-        }}
+        }
     ]
-}}
+}
+```"""
+
+FEATURE_DISCOVERER_PROMPT = """Based on the code analysis, identify potential features for this project.
+
+## Code Analysis Results
+```json
+{code_analysis}
 ```
 
+## Repository Context
+- **Owner/Repo**: {owner}/{repo_name}
+- **Domain**: {primary_domain}
+- **Architecture**: {architecture_type}
+
+## Existing Features (already implemented)
+{existing_features}
+
+{user_context_section}
+
 Discover up to {max_features} high-value features. Focus on features that:
 - Solve real user problems
 - Are technically feasible
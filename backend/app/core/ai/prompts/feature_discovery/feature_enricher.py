@@ -14,27 +14,7 @@ You excel at:
 - Defining success metrics
 - Adding technical context
 
-Always write specifications that are actionable and measurable."""
-
-FEATURE_ENRICHER_PROMPT = """Expand these discovered features into full specifications.
-
-## Project Context
-- **Domain**: {primary_domain}
-- **Architecture**: {architecture_type}
-- **Tech Stack**: {tech_stack_summary}
-
-## Features to Enrich
-
-### Discovered Features
-{discovered_features}
-
-### Gap Features
-{gap_features}
-
-### Tech Debt Features
-{tech_debt_features}
-
-{user_context_section}
+Always write specifications that are actionable and measurable.
 
 ## Enrichment Guidelines
 
@@ -49,9 +29,9 @@ For each feature, provide:
 ## Output Format
 Return a JSON object:
 ```json
-{{
+{
     "features": [
-        {{
+        {
             "temp_id": "disc_0",
             "title": "Feature title",
             "problem": "Clear description of the problem (2-3 sentences)",
@@ -62,10 +42,30 @@ Return a JSON object:
             "category": "user_facing|integration|performance|security|developer_experience|infrastructure|documentation|testing",
             "source": "code_pattern|readme|todo_comment|gap_analysis|tech_debt|architecture",
             "tags": ["tag1", "tag2", "tag3"]
-        }}
+        }
     ]
-}}
-```
+}
+```"""
+
+FEATURE_ENRICHER_PROMPT = """Expand these discovered features into full specifications.
+
+## Project Context
+- **Domain**: {primary_domain}
+- **Architecture**: {architecture_type}
+- **Tech Stack**: {tech_stack_summary}
+
+## Features to Enrich
+
+### Discovered Features
+{discovered_features}
+
+### Gap Features
+{gap_features}
+
+### Tech Debt Features
+{tech_debt_features}
+
+{user_context_section}
 
 Enrich ALL provided features. Maintain the original temp_id for tracking.
 Write specifications that are:
@@ -14,24 +14,7 @@ You excel at:
 - Suggesting features that differentiate products
 - Recognizing competitive advantages
 
-Always suggest features based on real-world patterns and best practices."""
-
-GAP_ANALYST_PROMPT = """Analyze gaps in this project compared to best practices and similar projects.
-
-## Code Analysis
-```json
-{code_analysis}
-```
-
-## Already Discovered Features (from previous agent)
-{discovered_features}
-
-## Project Context
-- **Domain**: {primary_domain}
-- **Architecture**: {architecture_type}
-- **Tech Stack**: {tech_stack_summary}
-
-{user_context_section}
+Always suggest features based on real-world patterns and best practices.
 
 ## Gap Analysis Guidelines
 
@@ -50,18 +33,35 @@ Focus on features that:
 ## Output Format
 Return a JSON object:
 ```json
-{{
+{
     "features": [
-        {{
+        {
             "temp_id": "gap_0",
             "title": "Short feature title",
             "category": "user_facing|integration|performance|security|developer_experience|infrastructure|documentation|testing",
             "comparison_basis": "What best practice or similar project this is based on",
             "rationale": "Why this feature would benefit the project"
-        }}
+        }
     ]
-}}
+}
+```"""
+
+GAP_ANALYST_PROMPT = """Analyze gaps in this project compared to best practices and similar projects.
+
+## Code Analysis
+```json
+{code_analysis}
 ```
 
+## Already Discovered Features (from previous agent)
+{discovered_features}
+
+## Project Context
+- **Domain**: {primary_domain}
+- **Architecture**: {architecture_type}
+- **Tech Stack**: {tech_stack_summary}
+
+{user_context_section}
+
 Identify up to {max_gap_features} gap features that would significantly improve the project.
 Avoid duplicating features already discovered."""
@@ -14,18 +14,7 @@ You excel at:
 - Understanding business value
 - Making data-driven priority decisions
 
-Always provide clear rationale for prioritization decisions."""
-
-PRIORITY_RANKER_PROMPT = """Rank and score these features by priority.
-
-## Project Context
-- **Domain**: {primary_domain}
-- **Architecture**: {architecture_type}
-
-## Enriched Features to Rank
-{enriched_features}
-
-{user_context_section}
+Always provide clear rationale for prioritization decisions.
 
 ## Ranking Criteria
 
@@ -57,19 +46,30 @@ Consider:
 ## Output Format
 Return a JSON object:
 ```json
-{{
+{
     "rankings": [
-        {{
+        {
             "temp_id": "disc_0",
             "priority_score": 85,
             "priority": "critical|high|medium|low",
             "effort_estimate": "small|medium|large|xlarge",
             "impact_estimate": "high|medium|low",
             "ranking_rationale": "Brief explanation of the ranking"
-        }}
+        }
     ]
-}}
-```
+}
+```"""
+
+PRIORITY_RANKER_PROMPT = """Rank and score these features by priority.
+
+## Project Context
+- **Domain**: {primary_domain}
+- **Architecture**: {architecture_type}
+
+## Enriched Features to Rank
+{enriched_features}
+
+{user_context_section}
 
 Rank ALL provided features. Return them sorted by priority_score (highest first).
 Distribute priorities realistically - not everything is critical!"""
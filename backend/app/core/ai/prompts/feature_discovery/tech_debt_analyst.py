@@ -14,26 +14,7 @@ You excel at:
 - Spotting security vulnerabilities
 - Understanding documentation needs
 
-Always suggest actionable improvements with clear benefits."""
-
-TECH_DEBT_ANALYST_PROMPT = """Analyze this project for technical debt that should be addressed as feature work.
-
-## Code Analysis
-```json
-{code_analysis}
-```
-
-## Pain Points Identified
-{pain_points}
-
-## Project Context
-- **Architecture**: {architecture_type}
-- **Tech Stack**: {tech_stack_summary}
-
-## Key Files Examined
-{key_files_summary}
-
-{user_context_section}
+Always suggest actionable improvements with clear benefits.
 
 ## Tech Debt Categories
 
@@ -47,20 +28,39 @@ Analyze for:
 ## Output Format
 Return a JSON object:
 ```json
-{{
+{
     "features": [
-        {{
+        {
             "temp_id": "debt_0",
             "title": "Short improvement title",
             "category": "performance|security|developer_experience|testing|documentation",
             "debt_type": "refactoring|testing|performance|security|documentation",
             "affected_areas": ["file1.py", "module_name", "api_layer"],
             "rationale": "Why this improvement is needed and its benefits"
-        }}
+        }
     ]
-}}
+}
+```"""
+
+TECH_DEBT_ANALYST_PROMPT = """Analyze this project for technical debt that should be addressed as feature work.
+
+## Code Analysis
+```json
+{code_analysis}
 ```
 
+## Pain Points Identified
+{pain_points}
+
+## Project Context
+- **Architecture**: {architecture_type}
+- **Tech Stack**: {tech_stack_summary}
+
+## Key Files Examined
+{key_files_summary}
+
+{user_context_section}
+
 Identify up to {max_debt_features} significant tech debt items.
 Focus on improvements that:
 - Have high impact on code quality or reliability
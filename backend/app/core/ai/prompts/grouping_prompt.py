@@ -60,21 +60,24 @@ Each group must have:
 - rationale: Why this grouping was created"""
 
 
-def get_grouping_prompt(
+def get_grouping_context(
     components: List[ComponentSpec],
     architecture_plan: ArchitecturePlan
 ) -> str:
     """
-    Build the grouping prompt with components and plan.
+    Build the per-request part of the grouping prompt.
+
+    Kept separate from GROUPING_PROMPT so the static prompt can be sent as the
+    leading system message and stay a cacheable prefix across requests.
 
     Args:
         components: List of components from Component Specialist
         architecture_plan: Architecture plan from Architect
 
     Returns:
-        Complete prompt string
+        Context string
     """
-    prompt = GROUPING_PROMPT
+    prompt = ""
 
     prompt += "\n\n## Architecture Context\n"
     prompt += f"**Patterns**: {', '.join(architecture_plan.suggested_patterns)}\n"
@@ -119,4 +122,25 @@ def get_grouping_prompt(
     if len(components) <= 5:
         prompt += "- With few components, groups may not be necessary\n"
 
-    return prompt
+    return prompt.lstrip()
+
+
+def get_grouping_prompt(
+    components: List[ComponentSpec],
+    architecture_plan: ArchitecturePlan
+) -> str:
+    """
+    Build the grouping prompt with components and plan.
+
+    Args:
+        components: List of components from Component Specialist
+        architecture_plan: Architecture plan from Architect
+
+    Returns:
+        Complete prompt string
+    """
+    context = get_grouping_context(
+        components=components,
+        architecture_plan=architecture_plan,
+    )
+    return f"{GROUPING_PROMPT}\n\n{context}"
@@ -93,21 +93,24 @@ Do NOT use "nodes", "diagram", "layout", or any other key name.
 ⚠️ IMPORTANT: The root key MUST be "positions", not "nodes" or anything else."""
 
 
-def get_layout_prompt(
+def get_layout_context(
     components: List[ComponentSpec],
     groups: List[GroupSpec]
 ) -> str:
     """
-    Build the layout prompt with components and groups.
+    Build the per-request part of the layout prompt.
+
+    Kept separate from LAYOUT_PROMPT so the static prompt can be sent as the
+    leading system message and stay a cacheable prefix across requests.
 
     Args:
         components: List of components to position
         groups: List of groups (for container sizing)
 
     Returns:
-        Complete prompt string
+        Context string
     """
-    prompt = LAYOUT_PROMPT
+    prompt = ""
 
     prompt += "\n\n## Nodes to Position\n"
 
@@ -151,4 +154,25 @@ def get_layout_prompt(
     prompt += f"Return exactly {total_nodes} positions in a JSON object with key \"positions\".\n"
     prompt += f"Example: {{\"positions\": [{{\"node_id\": \"node_0\", \"layer\": 0, \"order\": 0, \"x\": 264, \"y\": 100}}, ...]}}\n"
 
-    return prompt
+    return prompt.lstrip()
+
+
+def get_layout_prompt(
+    components: List[ComponentSpec],
+    groups: List[GroupSpec]
+) -> str:
+    """
+    Build the layout prompt with components and groups.
+
+    Args:
+        components: List of components to position
+        groups: List of groups (for container sizing)
+
+    Returns:
+        Complete prompt string
+    """
+    context = get_layout_context(
+        components=components,
+        groups=groups,
+    )
+    return f"{LAYOUT_PROMPT}\n\n{context}"
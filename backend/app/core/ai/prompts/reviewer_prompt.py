@@ -75,7 +75,7 @@ Return a JSON object with:
 Be thorough but fair. Minor cosmetic issues shouldn't block approval."""
 
 
-def get_reviewer_prompt(
+def get_reviewer_context(
     architecture_plan: Optional[ArchitecturePlan],
     components: List[ComponentSpec],
     connections: List[ConnectionSpec],
@@ -84,7 +84,10 @@ def get_reviewer_prompt(
     review_iteration: int = 0
 ) -> str:
     """
-    Build the reviewer prompt with all agent outputs.
+    Build the per-request part of the reviewer prompt.
+
+    Kept separate from REVIEWER_PROMPT so the static prompt can be sent as the
+    leading system message and stay a cacheable prefix across requests.
 
     Args:
         architecture_plan: Original architecture plan
@@ -95,10 +98,10 @@ def get_reviewer_prompt(
         review_iteration: Current review iteration
 
     Returns:
-        Complete prompt string
+        Context string
     """
     import json
-    prompt = REVIEWER_PROMPT
+    prompt = ""
 
     if review_iteration > 0:
         prompt += f"\n\n## Review Iteration {review_iteration + 1}\n"
@@ -203,4 +206,37 @@ def get_reviewer_prompt(
     if unlabeled:
         prompt += f"- WARNING: Unlabeled edges: {', '.join(unlabeled)}\n"
 
-    return prompt
+    return prompt.lstrip()
+
+
+def get_reviewer_prompt(
+    architecture_plan: Optional[ArchitecturePlan],
+    components: List[ComponentSpec],
+    connections: List[ConnectionSpec],
+    groups: List[GroupSpec],
+    layout_positions: List[LayoutPosition],
+    review_iteration: int = 0
+) -> str:
+    """
+    Build the reviewer prompt with all agent outputs.
+
+    Args:
+        architecture_plan: Original architecture plan
+        components: Component list
+        connections: Connection list
+        groups: Group list
+        layout_positions: Layout positions
+        review_iteration: Current review iteration
+
+    Returns:
+        Complete prompt string
+    """
+    context = get_reviewer_context(
+        architecture_plan=architecture_plan,
+        components=components,
+        connections=connections,
+        groups=groups,
+        layout_positions=layout_positions,
+        review_iteration=review_iteration,
+    )
+    return f"{REVIEWER_PROMPT}\n\n{context}"
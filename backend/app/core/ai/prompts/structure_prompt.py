@@ -0,0 +1,66 @@
+"""
+Combined Connection + Grouping Prompt
+
+Connection and grouping both work from the same component list, so the
+graph asks for both in a single call. Each agent's rules are kept as their
+own labeled section.
+"""
+
+from typing import List
+
+from app.core.ai.agent_state import ComponentSpec, ArchitecturePlan
+
+from .connection_prompt import CONNECTION_PROMPT, get_connection_context
+from .grouping_prompt import GROUPING_PROMPT, get_grouping_context
+
+STRUCTURE_PROMPT = (
+    "You have two tasks for the same set of components: define the "
+    "connections (Part 1) and organize the components into groups "
+    "(Part 2). Follow each part's rules independently.\n\n"
+    "# Part 1: Connections\n\n"
+    f"{CONNECTION_PROMPT}\n\n"
+    "# Part 2: Groups\n\n"
+    f"{GROUPING_PROMPT}"
+)
+
+
+def get_structure_context(
+    components: List[ComponentSpec],
+    architecture_plan: ArchitecturePlan
+) -> str:
+    """
+    Build the per-request part of the combined prompt.
+
+    Kept separate from STRUCTURE_PROMPT so the static prompt can be sent as
+    the leading system message and stay a cacheable prefix across requests.
+
+    Args:
+        components: List of components from Component Specialist
+        architecture_plan: Architecture plan from Architect
+
+    Returns:
+        Context string
+    """
+    return (
+        "# Part 1: Connections\n\n"
+        f"{get_connection_context(components)}\n\n"
+        "# Part 2: Groups\n\n"
+        f"{get_grouping_context(components, architecture_plan)}"
+    )
+
+
+def get_structure_prompt(
+    components: List[ComponentSpec],
+    architecture_plan: ArchitecturePlan
+) -> str:
+    """
+    Build the combined connection and grouping prompt.
+
+    Args:
+        components: List of components from Component Specialist
+        architecture_plan: Architecture plan from Architect
+
+    Returns:
+        Complete prompt string
+    """
+    return f"{STRUCTURE_PROMPT}\n\n{get_structure_context(components, architecture_plan)}"
@@ -0,0 +1,157 @@
+"""
+LLM Response Cache
+
+Exact-match cache for LLM responses keyed by a hash of the model and prompt.
+Uses Redis when REDIS_URL is configured and the redis package is installed,
+otherwise a bounded in-process TTL cache. Cache failures never fail a request.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from app.config import settings
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # Optional dependency
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "llm:"
+
+
+def normalize_prompt(text: str) -> str:
+    """Normalize free-form user text so trivially different requests share a key."""
+    return " ".join(text.split()).lower()
+
+
+def make_cache_key(model: str, *parts: str) -> str:
+    """
+    Build a cache key from the model name and prompt parts.
+
+    Args:
+        model: Model the response was generated with
+        *parts: Prompt segments (system prompt, user prompt, ...)
+
+    Returns:
+        Hex digest key
+    """
+    digest = hashlib.sha256(model.encode())
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(part.encode())
+    return digest.hexdigest()
+
+
+def make_completion_key(
+    model: str,
+    response_model_name: str,
+    reasoning_effort: str,
+    messages: List[Dict[str, str]],
+) -> str:
+    """
+    Build the cache key for a structured completion.
+
+    Every structured-output path keys on the same inputs, so the streaming
+    and graph versions of an agent share results.
+
+    Args:
+        model: Model the response was generated with
+        response_model_name: Name of the Pydantic response model
+        reasoning_effort: Reasoning effort of the request
+        messages: Chat messages sent to the model
+
+    Returns:
+        Hex digest key
+    """
+    return make_cache_key(
+        model,
+        response_model_name,
+        reasoning_effort,
+        *(message["content"] for message in messages),
+    )
+
+
+class ResponseCache:
+    """Async get/set cache for serialized LLM responses."""
+
+    def __init__(
+        self,
+        redis_url: str = "",
+        ttl_seconds: int = 86400,
+        max_entries: int = 1024,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._redis = None
+
+        if redis_url:
+            if redis_asyncio is None:
+                logger.warning("REDIS_URL is set but redis is not installed, using in-process cache")
+            else:
+                self._redis = redis_asyncio.from_url(redis_url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None on miss."""
+        if self._redis is not None:
+            try:
+                return await self._redis.get(KEY_PREFIX + key)
+            except Exception as e:
+                logger.warning(f"Response cache read failed: {e}")
+                return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        """Store value under key for ttl_seconds (defaults to the cache TTL)."""
+        ttl = ttl_seconds or self.ttl_seconds
+
+        if self._redis is not None:
+            try:
+                await self._redis.setex(KEY_PREFIX + key, ttl, value)
+            except Exception as e:
+                logger.warning(f"Response cache write failed: {e}")
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all in-process entries (Redis entries expire on their own)."""
+        self._entries.clear()
+
+
+# Lazy-loaded cache singleton
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get or create the shared response cache singleton.
+
+    Returns:
+        ResponseCache instance
+    """
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(
+            redis_url=settings.REDIS_URL,
+            ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        )
+    return _cache
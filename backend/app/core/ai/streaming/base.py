@@ -272,36 +272,35 @@ async def merge_async_generators(
     Merge multiple async generators, yielding events as they arrive.
 
     Useful for running parallel agents and interleaving their outputs.
+    Each generator is drained by its own task; an exception in any of
+    them is re-raised here.
     """
-    queues: List[asyncio.Queue] = [asyncio.Queue() for _ in generators]
-    done_count = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    finished = object()
 
-    async def fill_queue(gen: AsyncGenerator, queue: asyncio.Queue) -> None:
-        nonlocal done_count
+    async def drain(gen: AsyncGenerator) -> None:
         try:
             async for item in gen:
                 await queue.put(item)
+        except Exception as e:
+            await queue.put(e)
         finally:
-            await queue.put(None)  # Signal completion
-            done_count += 1
+            await queue.put(finished)
 
     # Start all generators concurrently
-    tasks = [
-        asyncio.create_task(fill_queue(gen, queue))
-        for gen, queue in zip(generators, queues)
-    ]
+    tasks = [asyncio.create_task(drain(gen)) for gen in generators]
+    remaining = len(tasks)
 
-    # Yield items as they arrive
+    # Yield items as they arrive, without polling
     try:
-        while done_count < len(generators):
-            for queue in queues:
-                try:
-                    item = queue.get_nowait()
-                    if item is not None:
-                        yield item
-                except asyncio.QueueEmpty:
-                    pass
-            await asyncio.sleep(0.01)  # Small delay to prevent busy loop
+        while remaining:
+            item = await queue.get()
+            if item is finished:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
     finally:
         # Cancel any remaining tasks
         for task in tasks:
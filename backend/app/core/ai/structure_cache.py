@@ -0,0 +1,78 @@
+"""
+Structure Cache Helpers
+
+Connections and groups are keyed on everything the structure prompts see
+except the component IDs, so a renumbered copy of the same diagram reuses
+them. Cached payloads store canonical positions ("#0", "#1", ...) in place
+of node IDs and are mapped back onto the current IDs on load.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import orjson
+from pydantic import BaseModel
+
+from app.core.ai.agent_state import ArchitecturePlan, ComponentSpec
+from app.core.ai.response_cache import make_cache_key
+
+# Structurally identical diagrams reuse connections and groups for an hour
+STRUCTURE_CACHE_TTL_SECONDS = 3600
+
+
+def component_signature(component: ComponentSpec) -> str:
+    """Everything the structure prompts include about a component except its ID."""
+    return orjson.dumps(
+        component.model_dump(exclude={"id"}),
+        option=orjson.OPT_SORT_KEYS,
+    ).decode()
+
+
+def get_structural_order(components: List[ComponentSpec]) -> List[str]:
+    """
+    Component IDs in a canonical order that ignores the IDs themselves.
+
+    Diagrams whose components match field for field list them in the same
+    order, so position i means the same component.
+    """
+    signatures = [component_signature(c) for c in components]
+    ranked = sorted(range(len(components)), key=lambda i: (signatures[i], i))
+    return [components[i].id for i in ranked]
+
+
+def get_structure_key(
+    model: str,
+    kind: str,
+    components: List[ComponentSpec],
+    plan: Optional[ArchitecturePlan] = None,
+) -> str:
+    """
+    Cache key for a component list and plan, independent of node IDs.
+
+    Covers each component's type, label, tags, description, volumes and
+    layer, plus the whole architecture plan (analysis included), since all
+    of them shape the protocol labels and group names the model returns.
+    """
+    signature = "\n".join(sorted(component_signature(c) for c in components))
+    return make_cache_key(model, kind, signature, plan.model_dump_json() if plan else "")
+
+
+def remap_node_ids(data: Dict[str, Any], mapping: Dict[str, str]) -> Dict[str, Any]:
+    """Rewrite node references in dumped groups and connections through mapping."""
+    for group in data.get("groups", []):
+        group["node_ids"] = [mapping.get(node_id, node_id) for node_id in group["node_ids"]]
+    for connection in data.get("connections", []):
+        connection["source"] = mapping.get(connection["source"], connection["source"])
+        connection["target"] = mapping.get(connection["target"], connection["target"])
+    return data
+
+
+def dump_structural(result: BaseModel, order: List[str]) -> str:
+    """Serialize a response with node IDs replaced by canonical positions."""
+    to_position = {node_id: f"#{i}" for i, node_id in enumerate(order)}
+    return orjson.dumps(remap_node_ids(result.model_dump(), to_position)).decode()
+
+
+def load_structural(cached: str, order: List[str]) -> Dict[str, Any]:
+    """Load a dump_structural payload with positions mapped to these node IDs."""
+    from_position = {f"#{i}": node_id for i, node_id in enumerate(order)}
+    return remap_node_ids(orjson.loads(cached), from_position)
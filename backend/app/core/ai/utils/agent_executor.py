@@ -4,18 +4,141 @@ Agent Executor Utilities
 Provides common patterns for executing AI agents with structured output.
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Type, TypeVar
 
+from openai import AsyncOpenAI, pydantic_function_tool
 from pydantic import BaseModel
 
-from app.core.ai.client import get_openai_client
+from app.core.ai.client import coalesce, get_openai_client
+from app.core.ai.response_cache import get_response_cache, make_completion_key
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def get_response_format(response_model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build the strict json_schema response_format for a model once.
+
+    parse()/stream() re-derive the JSON schema from the class on every call;
+    passing this cached dict instead skips that work. The strict schema
+    comes from the SDK's public pydantic_function_tool helper.
+    """
+    function = pydantic_function_tool(response_model)["function"]
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": function["name"],
+            "schema": function["parameters"],
+            "strict": True,
+        },
+    }
+
+
+async def stream_structured_completion(
+    client: AsyncOpenAI,
+    timeout: Optional[float] = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Run a structured completion over a stream.
+
+    Drop-in replacement for client.beta.chat.completions.parse(**kwargs):
+    returns the same ParsedChatCompletion shape with message.parsed set.
+    The response is read as it streams, the schema for a Pydantic
+    response_format comes from get_response_format(), and the final content
+    is validated once with model_validate_json.
+
+    Args:
+        client: OpenAI client
+        timeout: Overall deadline in seconds. Raises asyncio.TimeoutError
+            when exceeded, without waiting out the client's retry chain.
+        **kwargs: Arguments for chat.completions (model, messages,
+            response_format, ...)
+
+    Returns:
+        Final parsed completion
+    """
+    response_model = kwargs.get("response_format")
+    if isinstance(response_model, type) and issubclass(response_model, BaseModel):
+        kwargs["response_format"] = get_response_format(response_model)
+    else:
+        response_model = None
+
+    async def _run() -> Any:
+        async with client.beta.chat.completions.stream(**kwargs) as stream:
+            completion = await stream.get_final_completion()
+        if response_model is not None:
+            for choice in completion.choices:
+                message = choice.message
+                if message.content and not message.refusal:
+                    message.parsed = response_model.model_validate_json(message.content)
+        return completion
+
+    if timeout is None:
+        return await _run()
+    return await asyncio.wait_for(_run(), timeout)
+
+
+async def cached_structured_completion(
+    client: AsyncOpenAI,
+    ttl_seconds: Optional[int] = None,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
+    **kwargs: Any,
+) -> BaseModel:
+    """
+    Run a structured completion through the shared response cache.
+
+    The key hashes the model, response model name, reasoning effort and
+    every message, so a re-run with identical inputs (retries, graph
+    re-runs, re-analysis of an unchanged repository) returns the stored
+    result. Prompts embed upstream agent output, so a changed repository
+    changes every downstream key. Concurrent identical calls share one
+    request.
+
+    Args:
+        client: OpenAI client
+        ttl_seconds: Cache lifetime (defaults to the cache TTL)
+        timeout: Overall deadline in seconds (see stream_structured_completion)
+        use_cache: False bypasses the cache and always calls the model
+        **kwargs: Arguments for chat.completions; response_format must be
+            a Pydantic model class
+
+    Returns:
+        Parsed response_format instance
+    """
+    if not use_cache:
+        response = await stream_structured_completion(client, timeout=timeout, **kwargs)
+        return response.choices[0].message.parsed
+
+    response_model = kwargs["response_format"]
+    cache = get_response_cache()
+    cache_key = make_completion_key(
+        kwargs["model"],
+        response_model.__name__,
+        kwargs.get("reasoning_effort", ""),
+        kwargs["messages"],
+    )
+
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return response_model.model_validate_json(cached)
+
+    async def complete() -> BaseModel:
+        response = await stream_structured_completion(client, timeout=timeout, **kwargs)
+        result = response.choices[0].message.parsed
+        await cache.set(cache_key, result.model_dump_json(), ttl_seconds)
+        return result
+
+    return await coalesce(cache_key, complete)
+
+
 async def execute_structured_completion(
     model: str,
     system_prompt: str,
@@ -50,7 +173,8 @@ async def execute_structured_completion(
         messages.extend(extra_messages)
     messages.append({"role": "user", "content": user_message})
 
-    response = await client.beta.chat.completions.parse(
+    response = await stream_structured_completion(
+        client,
         model=model,
         reasoning_effort=reasoning_effort,
         messages=messages,
@@ -81,12 +205,9 @@ def build_agent_response(
     Returns:
         Dict with updates and standard agent tracking fields
     """
-    agent_history = state.get("agent_history", []).copy()
-    agent_history.append(agent_name)
-
     response = {
         "current_agent": agent_name,
-        "agent_history": agent_history,
+        "agent_history": [agent_name],  # Appended by the state reducer
         **updates,
     }
 
@@ -121,12 +242,9 @@ def build_error_response(
     """
     logger.error(f"[{agent_name.capitalize()}] Error: {error}", exc_info=True)
 
-    agent_history = state.get("agent_history", []).copy()
-    agent_history.append(agent_name)
-
     response = {
         "current_agent": agent_name,
-        "agent_history": agent_history,
+        "agent_history": [agent_name],  # Appended by the state reducer
         "warnings": [f"{agent_name.capitalize()} error: {str(error)}"],
         "messages": [{
             "role": "system",
@@ -30,6 +30,8 @@ from app.auth.models import User as AuthUser
 from app.db.session import engine
 from app.db.base import Base
 
+from app.core.ai.client import close_client, get_openai_client
+
 # Configure logging to both console and file
 logging.basicConfig(
     level=logging.INFO,
@@ -64,12 +66,17 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables created/verified")
 
+    # Create the shared OpenAI client (and its connection pool) up front
+    get_openai_client()
+
     yield
 
     # Shutdown
     logger.info("ProductScope AI Backend shutting down")
     await engine.dispose()
     logger.info("Database connections closed")
+    await close_client()
+    logger.info("OpenAI client closed")
 
 
 # Create FastAPI app
@@ -1,6 +1,6 @@
 """Models for AI diagram operations (CRUD)"""
 
-from typing import List, Optional, Literal
+from typing import Any, List, Optional, Literal
 from pydantic import BaseModel, Field
 
 # AI execution mode
@@ -39,6 +39,36 @@ class DiagramContext(BaseModel):
     edges: List[ContextEdge] = []
 
 
+def parse_diagram_context(context: Any, validate: bool = True) -> Optional[DiagramContext]:
+    """
+    Build a DiagramContext from whatever form the context arrived in.
+
+    Instances pass through untouched, JSON str/bytes are validated straight
+    from the raw payload (no intermediate json.loads), and dicts go through
+    model_validate. Invalid or empty context yields None.
+
+    With validate=False, dicts are wrapped with model_construct() instead:
+    nodes and edges stay plain dicts. Only for contexts that were already
+    validated upstream (e.g. OperationRequest.context) by callers that read
+    no more than the node and edge counts.
+    """
+    if not context:
+        return None
+    if isinstance(context, DiagramContext):
+        return context
+    if not validate and isinstance(context, dict):
+        return DiagramContext.model_construct(
+            nodes=context.get("nodes") or [],
+            edges=context.get("edges") or [],
+        )
+    try:
+        if isinstance(context, (str, bytes)):
+            return DiagramContext.model_validate_json(context)
+        return DiagramContext.model_validate(context)
+    except ValueError:
+        return None
+
+
 # =============================================================================
 # Request Models
 # =============================================================================
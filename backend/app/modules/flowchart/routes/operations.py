@@ -12,9 +12,9 @@ from fastapi.responses import StreamingResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 import json
-from openai import OpenAI
 
 from app.config import settings
+from app.core.ai.client import get_openai_client
 from app.modules.flowchart.models import (
     FlowchartOperationRequest,
     FlowchartOperationResponse,
@@ -128,7 +128,7 @@ async def fix_flowchart_syntax(request: Request, body: FlowchartOperationRequest
     Takes the current (broken) Mermaid code and the error message,
     then uses AI to correct the syntax while preserving the intent.
     """
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    client = get_openai_client()
 
     # Get the current code and error from context
     current_code = body.context.mermaidCode if body.context else ""
@@ -184,7 +184,7 @@ ORIGINAL CODE:
 Return the corrected Mermaid code only."""
 
     try:
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": system_prompt},
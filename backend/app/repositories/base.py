@@ -1,12 +1,30 @@
 from typing import TypeVar, Generic, Type, List, Optional, Any
 
 from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# SQLSTATE for foreign_key_violation
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+def is_foreign_key_violation(error: IntegrityError, constraint_name: str) -> bool:
+    """
+    Check whether an IntegrityError is a foreign key violation on one constraint.
+
+    The asyncpg exception behind the DBAPI adapter error carries the
+    SQLSTATE and the violated constraint's name.
+    """
+    cause = error.orig.__cause__ if error.orig is not None else None
+    return (
+        getattr(cause, "sqlstate", None) == FOREIGN_KEY_VIOLATION
+        and getattr(cause, "constraint_name", None) == constraint_name
+    )
+
 
 class BaseRepository(Generic[ModelType]):
     """Generic repository with CRUD operations."""
@@ -23,6 +41,19 @@ class BaseRepository(Generic[ModelType]):
         await self.session.refresh(instance)
         return instance
 
+    async def create_many(self, rows: List[dict]) -> List[ModelType]:
+        """
+        Create several records in one flush.
+
+        SQLAlchemy batches the INSERTs into multi-row INSERT ... RETURNING
+        statements. Column defaults are Python-side, so no refresh is needed.
+        """
+        instances = [self.model(**row) for row in rows]
+        if instances:
+            self.session.add_all(instances)
+            await self.session.flush()
+        return instances
+
     async def get_by_id(self, id: str) -> Optional[ModelType]:
         """Get a record by ID."""
         result = await self.session.execute(
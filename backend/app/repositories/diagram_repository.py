@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base import BaseRepository
@@ -13,15 +13,32 @@ class DiagramRepository(BaseRepository[DiagramEntity]):
     def __init__(self, session: AsyncSession):
         super().__init__(DiagramEntity, session)
 
-    async def get_by_project(
+    # Columns served by list endpoints (everything except the JSONB payload)
+    _SUMMARY_COLUMNS = (
+        DiagramEntity.id,
+        DiagramEntity.name,
+        DiagramEntity.description,
+        DiagramEntity.diagram_type,
+        DiagramEntity.thumbnail,
+        DiagramEntity.version,
+        DiagramEntity.created_at,
+        DiagramEntity.updated_at,
+    )
+
+    async def get_summaries_by_project(
         self,
         project_id: str,
         diagram_type: Optional[DiagramType] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[DiagramEntity]:
-        """Get diagrams for a project, optionally filtered by type."""
-        query = select(DiagramEntity).where(DiagramEntity.project_id == project_id)
+    ) -> List[Row]:
+        """
+        Get listing rows for a project's diagrams.
+
+        Selects only the summary columns as plain rows, skipping ORM
+        hydration and the JSONB payload.
+        """
+        query = select(*self._SUMMARY_COLUMNS).where(DiagramEntity.project_id == project_id)
 
         if diagram_type:
             query = query.where(DiagramEntity.diagram_type == diagram_type)
@@ -30,7 +47,7 @@ class DiagramRepository(BaseRepository[DiagramEntity]):
         query = query.offset(skip).limit(limit)
 
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
 
     async def get_latest_version(self, id: str) -> Optional[DiagramEntity]:
         """Get the latest version of a diagram."""
@@ -74,11 +91,11 @@ class DiagramRepository(BaseRepository[DiagramEntity]):
         self,
         diagram_id: str,
         limit: int = 10,
-    ) -> List[DiagramEntity]:
-        """Get version history for a diagram."""
+    ) -> List[Row]:
+        """Get version history for a diagram as summary rows."""
         # Get all versions that share the same root
         result = await self.session.execute(
-            select(DiagramEntity)
+            select(*self._SUMMARY_COLUMNS)
             .where(
                 (DiagramEntity.id == diagram_id)
                 | (DiagramEntity.parent_version_id == diagram_id)
@@ -86,4 +103,4 @@ class DiagramRepository(BaseRepository[DiagramEntity]):
             .order_by(DiagramEntity.version.desc())
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return list(result.all())
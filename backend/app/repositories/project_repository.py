@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, exists, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -11,9 +11,23 @@ from app.models.project import Project, ProjectStatus
 class ProjectRepository(BaseRepository[Project]):
     """Repository for Project operations."""
 
+    # Built once per process so SQLAlchemy's compiled-statement cache
+    # always hits for the hottest lookup.
+    _SELECT_BY_ID = select(Project).where(Project.id == bindparam("pid"))
+
     def __init__(self, session: AsyncSession):
         super().__init__(Project, session)
 
+    async def get_by_id(self, id: str) -> Optional[Project]:
+        """Get a project by ID."""
+        result = await self.session.execute(self._SELECT_BY_ID, {"pid": id})
+        return result.scalar_one_or_none()
+
+    async def exists(self, id: str) -> bool:
+        """Check whether a project exists without loading the row."""
+        result = await self.session.execute(select(exists().where(Project.id == id)))
+        return bool(result.scalar())
+
     async def get_with_relations(self, id: str) -> Optional[Project]:
         """Get project with all related entities loaded."""
         result = await self.session.execute(
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base import BaseRepository
@@ -13,6 +13,20 @@ class StoryRepository(BaseRepository[Story]):
     def __init__(self, session: AsyncSession):
         super().__init__(Story, session)
 
+    async def get_by_id_with_project(
+        self,
+        story_id: str,
+        project_id: str,
+    ) -> Optional[Story]:
+        """Get a story by ID, scoped to its project, in a single query."""
+        result = await self.session.execute(
+            select(Story).where(
+                Story.id == story_id,
+                Story.project_id == project_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
     async def get_by_project(
         self,
         project_id: str,
@@ -63,11 +77,25 @@ class StoryRepository(BaseRepository[Story]):
         self,
         story_ids: List[str],
         status: StoryStatus,
+        project_id: Optional[str] = None,
     ) -> int:
-        """Update status for multiple stories."""
-        count = 0
-        for story_id in story_ids:
-            result = await self.update_status(story_id, status)
-            if result:
-                count += 1
-        return count
+        """
+        Update status for multiple stories in a single statement.
+
+        When project_id is given, only stories belonging to that project
+        are updated.
+        """
+        if not story_ids:
+            return 0
+
+        stmt = (
+            update(Story)
+            .where(Story.id.in_(story_ids))
+            .values(status=status)
+            .returning(Story.id)
+        )
+        if project_id is not None:
+            stmt = stmt.where(Story.project_id == project_id)
+
+        result = await self.session.execute(stmt)
+        return len(result.scalars().all())
@@ -13,6 +13,20 @@ class TranscriptRepository(BaseRepository[Transcript]):
     def __init__(self, session: AsyncSession):
         super().__init__(Transcript, session)
 
+    async def get_by_id_with_project(
+        self,
+        transcript_id: str,
+        project_id: str,
+    ) -> Optional[Transcript]:
+        """Get a transcript by ID, scoped to its project, in a single query."""
+        result = await self.session.execute(
+            select(Transcript).where(
+                Transcript.id == transcript_id,
+                Transcript.project_id == project_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
     async def get_by_project(
         self,
         project_id: str,
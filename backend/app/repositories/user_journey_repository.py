@@ -13,6 +13,20 @@ class UserJourneyRepository(BaseRepository[UserJourney]):
     def __init__(self, session: AsyncSession):
         super().__init__(UserJourney, session)
 
+    async def get_by_id_with_project(
+        self,
+        journey_id: str,
+        project_id: str,
+    ) -> Optional[UserJourney]:
+        """Get a journey by ID, scoped to its project, in a single query."""
+        result = await self.session.execute(
+            select(UserJourney).where(
+                UserJourney.id == journey_id,
+                UserJourney.project_id == project_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
     async def get_by_project(
         self,
         project_id: str,
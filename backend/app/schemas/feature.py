@@ -82,6 +82,10 @@ class FeatureDiscoveryRequest(BaseModel):
         default=None,
         description="GitHub OAuth token for private repositories"
     )
+    use_cache: bool = Field(
+        default=True,
+        description="Set to false to re-run the analysis instead of reusing cached results"
+    )
 
 
 class FeatureExtractionRequest(BaseModel):
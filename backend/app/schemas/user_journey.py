@@ -74,6 +74,10 @@ class UserJourneyGenerateRequest(BaseModel):
 
     persona: str = Field(..., min_length=1, max_length=255)
     goal: str = Field(..., min_length=10, max_length=2000)
+    use_cache: bool = Field(
+        default=True,
+        description="Set to false to generate a new journey instead of reusing a cached one"
+    )
 
 
 class UserJourneyGenerateResponse(BaseModel):
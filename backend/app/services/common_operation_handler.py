@@ -10,25 +10,13 @@ import logging
 from typing import Any, Callable, Protocol, TypeVar, List, Optional
 
 from fastapi import HTTPException
-from openai import AsyncOpenAI
 from pydantic import BaseModel
 
 from app.config import settings
+from app.core.ai.client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client (singleton)
-_client: Optional[AsyncOpenAI] = None
-
-
-def get_openai_client() -> AsyncOpenAI:
-    """Get or create OpenAI client singleton."""
-    global _client
-    if _client is None:
-        _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-    return _client
-
-
 # Type variable for response type
 ResponseT = TypeVar('ResponseT', bound=BaseModel)
 
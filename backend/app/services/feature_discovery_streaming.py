@@ -4,7 +4,7 @@ Feature Discovery Streaming Handler
 Orchestrates the feature discovery multi-agent pipeline with real-time streaming
 of reasoning tokens from each agent.
 
-The pipeline flows: CodeAnalyzer → FeatureDiscoverer → [GapAnalyst ∥ TechDebtAnalyst] → FeatureEnricher → PriorityRanker
+The pipeline flows: CodeAnalyzer → [FeatureDiscoverer ∥ GapAnalyst ∥ TechDebtAnalyst] → FeatureEnricher → PriorityRanker
 
 Each agent's reasoning and content is streamed as events for the frontend to display.
 """
@@ -14,9 +14,13 @@ import json
 import logging
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
+import ijson
 from pydantic import BaseModel, Field, ValidationError
 
 from app.config import settings
+from app.core.ai.client import get_openai_client
+from app.core.ai.feature_discovery.agents.priority_ranker import RankedFeaturesResponse
+from app.core.ai.feature_discovery.dedup import dedupe_features, dedupe_similar_features
 from app.core.ai.feature_discovery.state import (
     FeatureDiscoveryState,
     create_initial_discovery_state,
@@ -53,14 +57,13 @@ from app.core.ai.prompts.feature_discovery.priority_ranker import (
     PRIORITY_RANKER_SYSTEM,
     PRIORITY_RANKER_PROMPT,
 )
-from app.services.streaming_agent_executor import (
-    stream_with_structured_output,
-    stream_without_structured_output,
-)
+from app.core.ai.streaming.base import merge_async_generators
+from app.services.streaming_agent_executor import stream_with_structured_output
 from app.utils.repository_formatting import (
-    format_file_tree,
+    KEY_FILES_TOTAL_TOKEN_BUDGET,
+    get_formatted_sections,
     format_key_files,
-    format_dependencies,
+    select_relevant_files,
 )
 
 logger = logging.getLogger(__name__)
@@ -114,12 +117,12 @@ def format_features_for_enrichment(features: List[dict], source_type: str) -> st
     parts = []
     for f in features:
         parts.append(f"- **{f.get('temp_id', 'unknown')}**: {f.get('title', 'Untitled')}")
-        if f.get("evidence"):
-            parts.append(f"  Evidence: {f.get('evidence')[:200]}")
-        if f.get("rationale"):
-            parts.append(f"  Rationale: {f.get('rationale')[:200]}")
-        if f.get("category"):
-            parts.append(f"  Category: {f.get('category')}")
+        if evidence := f.get("evidence"):
+            parts.append(f"  Evidence: {evidence[:200]}")
+        if rationale := f.get("rationale"):
+            parts.append(f"  Rationale: {rationale[:200]}")
+        if category := f.get("category"):
+            parts.append(f"  Category: {category}")
     return "\n".join(parts)
 
 
@@ -129,47 +132,68 @@ def format_enriched_features(features: List[dict]) -> str:
         return "(none)"
     parts = []
     for f in features:
-        parts.append(f"### {f.get('temp_id', 'unknown')}: {f.get('title', 'Untitled')}")
-        parts.append(f"**Category**: {f.get('category', 'unknown')}")
-        parts.append(f"**Source**: {f.get('source', 'unknown')}")
-        parts.append(f"**Problem**: {f.get('problem', 'N/A')}")
-        parts.append(f"**Solution**: {f.get('solution', 'N/A')}")
-        parts.append(f"**Target Users**: {f.get('target_users', 'N/A')}")
-        parts.append(f"**Success Metrics**: {f.get('success_metrics', 'N/A')}")
-        if f.get("technical_notes"):
-            parts.append(f"**Technical Notes**: {f.get('technical_notes')}")
-        parts.append("")
+        notes = f.get("technical_notes")
+        parts.append(
+            f"### {f.get('temp_id', 'unknown')}: {f.get('title', 'Untitled')}\n"
+            f"**Category**: {f.get('category', 'unknown')}\n"
+            f"**Source**: {f.get('source', 'unknown')}\n"
+            f"**Problem**: {f.get('problem', 'N/A')}\n"
+            f"**Solution**: {f.get('solution', 'N/A')}\n"
+            f"**Target Users**: {f.get('target_users', 'N/A')}\n"
+            f"**Success Metrics**: {f.get('success_metrics', 'N/A')}\n"
+            + (f"**Technical Notes**: {notes}\n" if notes else "")
+        )
     return "\n".join(parts)
 
 
+def build_candidate(f: dict, ranking: dict) -> dict:
+    """Combine one enriched feature with its ranking (defaults if unranked)."""
+    return CandidateFeature(
+        temp_id=f.get("temp_id") or "unknown",
+        title=f.get("title", "Untitled"),
+        problem=f.get("problem", ""),
+        solution=f.get("solution", ""),
+        target_users=f.get("target_users", ""),
+        success_metrics=f.get("success_metrics", ""),
+        technical_notes=f.get("technical_notes"),
+        priority=ranking.get("priority", "medium"),
+        priority_score=ranking.get("priority_score", 50),
+        effort_estimate=ranking.get("effort_estimate", "medium"),
+        impact_estimate=ranking.get("impact_estimate", "medium"),
+        tags=f.get("tags", []),
+        category=str(f.get("category", "user_facing")),
+        source=str(f.get("source", "code_pattern")),
+    ).model_dump()
+
+
 def merge_ranking_with_enriched(enriched: List[dict], rankings: List[dict]) -> List[dict]:
     """Merge ranking data with enriched features to create candidates."""
     ranking_by_id = {r["temp_id"]: r for r in rankings}
-    candidates = []
-    for f in enriched:
-        temp_id = f.get("temp_id")
-        ranking = ranking_by_id.get(temp_id, {})
-        candidate = CandidateFeature(
-            temp_id=temp_id or "unknown",
-            title=f.get("title", "Untitled"),
-            problem=f.get("problem", ""),
-            solution=f.get("solution", ""),
-            target_users=f.get("target_users", ""),
-            success_metrics=f.get("success_metrics", ""),
-            technical_notes=f.get("technical_notes"),
-            priority=ranking.get("priority", "medium"),
-            priority_score=ranking.get("priority_score", 50),
-            effort_estimate=ranking.get("effort_estimate", "medium"),
-            impact_estimate=ranking.get("impact_estimate", "medium"),
-            tags=f.get("tags", []),
-            category=str(f.get("category", "user_facing")),
-            source=str(f.get("source", "code_pattern")),
-        )
-        candidates.append(candidate.model_dump())
+    candidates = [build_candidate(f, ranking_by_id.get(f.get("temp_id"), {})) for f in enriched]
     candidates.sort(key=lambda x: x["priority_score"], reverse=True)
     return candidates
 
 
+class _RankingParser:
+    """
+    Incremental parser for the streamed ranker output.
+
+    Returns each object of the "rankings" array as soon as it is complete,
+    before the rest of the document has arrived.
+    """
+
+    def __init__(self):
+        self._rankings = ijson.sendable_list()
+        self._coro = ijson.items_coro(self._rankings, "rankings.item")
+
+    def feed(self, text: str) -> List[dict]:
+        """Feed a chunk of output, returning newly completed rankings."""
+        self._coro.send(text.encode())
+        rankings = list(self._rankings)
+        del self._rankings[:]
+        return rankings
+
+
 async def execute_feature_discovery_with_streaming(
     repo_analysis: dict,
     project_id: str,
@@ -177,6 +201,7 @@ async def execute_feature_discovery_with_streaming(
     user_context: Optional[str] = None,
     max_features: int = 15,
     include_tech_debt: bool = True,
+    use_cache: bool = True,
 ) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Execute the feature discovery pipeline with real-time streaming.
@@ -187,6 +212,7 @@ async def execute_feature_discovery_with_streaming(
     - content: Response content tokens
     - agent_complete: When an agent finishes
     - feature_preview: Preview of discovered feature
+    - feature_ranked: A candidate feature as soon as its ranking is streamed
     - progress: Progress update (0-100)
     - complete: Final candidate features
     - error: If something fails
@@ -198,6 +224,7 @@ async def execute_feature_discovery_with_streaming(
         user_context: Optional user guidance
         max_features: Maximum features to discover
         include_tech_debt: Whether to include tech debt features
+        use_cache: False re-runs every agent instead of reusing cached results
 
     Yields:
         Streaming events for the frontend
@@ -212,7 +239,9 @@ async def execute_feature_discovery_with_streaming(
         "user_context": user_context,
         "max_features": max_features,
         "include_tech_debt": include_tech_debt,
+        "use_cache": use_cache,
         "code_analysis": None,
+        "code_analysis_json": None,
         "discovered_features": [],
         "gap_features": [],
         "tech_debt_features": [],
@@ -237,6 +266,7 @@ async def execute_feature_discovery_with_streaming(
 
         user_context_section = f"\n## User Guidance\n{user_context}\n" if user_context else ""
 
+        sections = get_formatted_sections(repo_analysis)
         code_analyzer_prompt = CODE_ANALYZER_PROMPT.format(
             owner=repo_analysis.get("owner", "unknown"),
             repo_name=repo_analysis.get("repo_name", "unknown"),
@@ -244,10 +274,13 @@ async def execute_feature_discovery_with_streaming(
             language=repo_analysis.get("language", "unknown"),
             description=repo_analysis.get("description", "(no description)"),
             topics=", ".join(repo_analysis.get("topics", [])) or "(none)",
-            file_tree=format_file_tree(repo_analysis.get("file_tree", [])),
+            file_tree=sections["file_tree"],
             readme_content=repo_analysis.get("readme_content", "(no README)") or "(no README)",
-            key_files_content=format_key_files(repo_analysis.get("key_files", [])),
-            dependencies=format_dependencies(repo_analysis),
+            key_files_content=format_key_files(select_relevant_files(
+                repo_analysis.get("key_files", []),
+                user_context or repo_analysis.get("description"),
+            ), total_tokens=KEY_FILES_TOTAL_TOKEN_BUDGET),
+            dependencies=sections["dependencies"],
             user_context_section=user_context_section,
         )
 
@@ -260,6 +293,7 @@ async def execute_feature_discovery_with_streaming(
             model=settings.MODEL_FEATURE_CODE_ANALYZER,
             response_model=CodeAnalysisResult,
             agent_name="code_analyzer",
+            use_cache=use_cache,
         ):
             if event["type"] == "reasoning":
                 yield {"type": "reasoning", "agent": "code_analyzer", "token": event.get("token", "")}
@@ -272,6 +306,8 @@ async def execute_feature_discovery_with_streaming(
             raise ValueError("Code analyzer failed to produce result")
 
         state["code_analysis"] = code_analysis.model_dump() if hasattr(code_analysis, "model_dump") else code_analysis
+        # Serialized once for the three parallel agents; sorted keys keep the prompt bytes stable
+        state["code_analysis_json"] = json.dumps(state["code_analysis"], indent=2, sort_keys=True)
 
         yield {
             "type": "agent_complete",
@@ -280,68 +316,73 @@ async def execute_feature_discovery_with_streaming(
             "progress": update_progress("code_analyzer"),
         }
 
-        # ===== FEATURE DISCOVERER AGENT =====
-        yield {
-            "type": "agent_start",
-            "agent": "feature_discoverer",
-            "description": AGENT_DESCRIPTIONS["feature_discoverer"]
-        }
+        # ===== FEATURE DISCOVERER ∥ GAP ANALYST ∥ TECH DEBT ANALYST =====
+        # All three only need the code analysis, so their LLM calls run
+        # concurrently and the step takes as long as the slowest one
+        discovered_features = []
+        gap_features = []
+        tech_debt_features = []
 
-        existing_features_str = "\n".join([
-            f"- {f.get('title', 'Untitled')}"
-            for f in (existing_features or [])
-        ]) or "(none)"
+        async def run_feature_discoverer():
+            nonlocal discovered_features
+            yield {
+                "type": "agent_start",
+                "agent": "feature_discoverer",
+                "description": AGENT_DESCRIPTIONS["feature_discoverer"]
+            }
 
-        discoverer_prompt = FEATURE_DISCOVERER_PROMPT.format(
-            code_analysis=json.dumps(state["code_analysis"], indent=2),
-            owner=repo_analysis.get("owner", "unknown"),
-            repo_name=repo_analysis.get("repo_name", "unknown"),
-            primary_domain=code_analysis.primary_domain,
-            architecture_type=code_analysis.architecture_type,
-            existing_features=existing_features_str,
-            user_context_section=user_context_section,
-            max_features=max_features,
-        )
+            existing_features_str = "\n".join([
+                f"- {f.get('title', 'Untitled')}"
+                for f in (existing_features or [])
+            ]) or "(none)"
 
-        discovered_features = []
-        async for event in stream_with_structured_output(
-            messages=[
-                {"role": "system", "content": FEATURE_DISCOVERER_SYSTEM},
-                {"role": "user", "content": discoverer_prompt}
-            ],
-            model=settings.MODEL_FEATURE_DISCOVERER,
-            response_model=DiscoveredFeaturesResponse,
-            agent_name="feature_discoverer",
-        ):
-            if event["type"] == "reasoning":
-                yield {"type": "reasoning", "agent": "feature_discoverer", "token": event.get("token", "")}
-            elif event["type"] == "content":
-                yield {"type": "content", "agent": "feature_discoverer", "token": event.get("token", "")}
-            elif event["type"] == "parsed":
-                discovered_features = [f.model_dump() for f in event["data"].features]
+            discoverer_prompt = FEATURE_DISCOVERER_PROMPT.format(
+                code_analysis=state["code_analysis_json"],
+                owner=repo_analysis.get("owner", "unknown"),
+                repo_name=repo_analysis.get("repo_name", "unknown"),
+                primary_domain=code_analysis.primary_domain,
+                architecture_type=code_analysis.architecture_type,
+                existing_features=existing_features_str,
+                user_context_section=user_context_section,
+                max_features=max_features,
+            )
 
-        state["discovered_features"] = discovered_features
+            async for event in stream_with_structured_output(
+                messages=[
+                    {"role": "system", "content": FEATURE_DISCOVERER_SYSTEM},
+                    {"role": "user", "content": discoverer_prompt}
+                ],
+                model=settings.MODEL_FEATURE_DISCOVERER,
+                response_model=DiscoveredFeaturesResponse,
+                agent_name="feature_discoverer",
+                prompt_cache_key="feature-discoverer",
+                use_cache=use_cache,
+            ):
+                if event["type"] == "reasoning":
+                    yield {"type": "reasoning", "agent": "feature_discoverer", "token": event.get("token", "")}
+                elif event["type"] == "content":
+                    yield {"type": "content", "agent": "feature_discoverer", "token": event.get("token", "")}
+                elif event["type"] == "parsed":
+                    discovered_features = [f.model_dump() for f in event["data"].features]
 
-        # Yield previews
-        for f in discovered_features:
-            yield {
-                "type": "feature_preview",
-                "temp_id": f.get("temp_id"),
-                "title": f.get("title"),
-                "category": f.get("category"),
-            }
+            state["discovered_features"] = discovered_features
 
-        yield {
-            "type": "agent_complete",
-            "agent": "feature_discoverer",
-            "summary": f"Discovered {len(discovered_features)} potential features",
-            "count": len(discovered_features),
-            "progress": update_progress("feature_discoverer"),
-        }
+            # Yield previews
+            for f in discovered_features:
+                yield {
+                    "type": "feature_preview",
+                    "temp_id": f.get("temp_id"),
+                    "title": f.get("title"),
+                    "category": f.get("category"),
+                }
 
-        # ===== PARALLEL: GAP ANALYST & TECH DEBT ANALYST =====
-        gap_features = []
-        tech_debt_features = []
+            yield {
+                "type": "agent_complete",
+                "agent": "feature_discoverer",
+                "summary": f"Discovered {len(discovered_features)} potential features",
+                "count": len(discovered_features),
+                "progress": update_progress("feature_discoverer"),
+            }
 
         async def run_gap_analyst():
             nonlocal gap_features
@@ -351,15 +392,16 @@ async def execute_feature_discovery_with_streaming(
                 "description": AGENT_DESCRIPTIONS["gap_analyst"]
             }
 
-            discovered_str = "\n".join([
-                f"- {f.get('title', 'Untitled')}: {f.get('evidence', '')[:100]}"
-                for f in discovered_features
-            ]) or "(none)"
+            # Runs alongside the discoverer, so compare against the features
+            # the code analyzer already found in the code
+            discovered_str = "\n".join(
+                f"- {title}" for title in code_analysis.existing_features
+            ) or "(none)"
 
             max_gap_features = max(3, max_features // 3)
 
             gap_prompt = GAP_ANALYST_PROMPT.format(
-                code_analysis=json.dumps(state["code_analysis"], indent=2),
+                code_analysis=state["code_analysis_json"],
                 discovered_features=discovered_str,
                 primary_domain=code_analysis.primary_domain,
                 architecture_type=code_analysis.architecture_type,
@@ -376,6 +418,8 @@ async def execute_feature_discovery_with_streaming(
                 model=settings.MODEL_FEATURE_GAP_ANALYST,
                 response_model=GapFeaturesResponse,
                 agent_name="gap_analyst",
+                prompt_cache_key="feature-gap-analyst",
+                use_cache=use_cache,
             ):
                 if event["type"] == "reasoning":
                     yield {"type": "reasoning", "agent": "gap_analyst", "token": event.get("token", "")}
@@ -420,7 +464,7 @@ async def execute_feature_discovery_with_streaming(
             max_debt_features = max(2, max_features // 5)
 
             tech_debt_prompt = TECH_DEBT_ANALYST_PROMPT.format(
-                code_analysis=json.dumps(state["code_analysis"], indent=2),
+                code_analysis=state["code_analysis_json"],
                 pain_points=pain_points_str,
                 architecture_type=code_analysis.architecture_type,
                 tech_stack_summary=code_analysis.tech_stack_summary,
@@ -437,6 +481,8 @@ async def execute_feature_discovery_with_streaming(
                 model=settings.MODEL_FEATURE_TECH_DEBT,
                 response_model=TechDebtFeaturesResponse,
                 agent_name="tech_debt_analyst",
+                prompt_cache_key="feature-tech-debt",
+                use_cache=use_cache,
             ):
                 if event["type"] == "reasoning":
                     yield {"type": "reasoning", "agent": "tech_debt_analyst", "token": event.get("token", "")}
@@ -451,11 +497,11 @@ async def execute_feature_discovery_with_streaming(
                 "progress": update_progress("tech_debt_analyst"),
             }
 
-        # Run gap and tech debt in parallel
-        async for event in run_gap_analyst():
-            yield event
-
-        async for event in run_tech_debt_analyst():
+        async for event in merge_async_generators(
+            run_feature_discoverer(),
+            run_gap_analyst(),
+            run_tech_debt_analyst(),
+        ):
             yield event
 
         state["gap_features"] = gap_features
@@ -485,6 +531,10 @@ async def execute_feature_discovery_with_streaming(
             }
             return
 
+        discovered_features, gap_features, tech_debt_features = await dedupe_similar_features(
+            get_openai_client(), [discovered_features, gap_features, tech_debt_features]
+        )
+
         enricher_prompt = FEATURE_ENRICHER_PROMPT.format(
             primary_domain=code_analysis.primary_domain,
             architecture_type=code_analysis.architecture_type,
@@ -504,6 +554,8 @@ async def execute_feature_discovery_with_streaming(
             model=settings.MODEL_FEATURE_ENRICHER,
             response_model=EnrichedFeaturesResponse,
             agent_name="feature_enricher",
+            prompt_cache_key="feature-enricher",
+            use_cache=use_cache,
         ):
             if event["type"] == "reasoning":
                 yield {"type": "reasoning", "agent": "feature_enricher", "token": event.get("token", "")}
@@ -512,6 +564,7 @@ async def execute_feature_discovery_with_streaming(
             elif event["type"] == "parsed":
                 enriched_features = [f.model_dump() for f in event["data"].features]
 
+        enriched_features = dedupe_features(enriched_features)
         state["enriched_features"] = enriched_features
 
         yield {
@@ -537,23 +590,42 @@ async def execute_feature_discovery_with_streaming(
         )
 
         rankings = []
-        async for event in stream_without_structured_output(
+        enriched_by_id = {f.get("temp_id"): f for f in enriched_features}
+        ranking_parser = _RankingParser()
+        async for event in stream_with_structured_output(
             messages=[
                 {"role": "system", "content": PRIORITY_RANKER_SYSTEM},
                 {"role": "user", "content": ranker_prompt}
             ],
             model=settings.MODEL_FEATURE_RANKER,
+            response_model=RankedFeaturesResponse,
             agent_name="priority_ranker",
+            prompt_cache_key="feature-priority-ranker",
         ):
             if event["type"] == "content":
                 yield {"type": "content", "agent": "priority_ranker", "token": event.get("token", "")}
-            elif event["type"] == "complete":
+                if ranking_parser is None:
+                    continue
                 try:
-                    result = json.loads(event["content"])
-                    rankings = result.get("rankings", [])
-                except json.JSONDecodeError:
-                    logger.error("[PriorityRanker] Failed to parse rankings")
-                    rankings = []
+                    partial_rankings = ranking_parser.feed(event.get("token", ""))
+                except ijson.JSONError as e:
+                    # The complete event below still carries every candidate
+                    logger.warning(f"[PriorityRanker] Incremental parse failed: {e}")
+                    ranking_parser = None
+                    continue
+                for ranking in partial_rankings:
+                    feature = enriched_by_id.get(ranking.get("temp_id"))
+                    if feature is None:
+                        continue
+                    try:
+                        candidate = build_candidate(feature, ranking)
+                    except ValidationError:
+                        continue
+                    yield {"type": "feature_ranked", "agent": "priority_ranker", "feature": candidate}
+            elif event["type"] == "parsed":
+                rankings = [r.model_dump() for r in event["data"].rankings]
+            elif event["type"] == "error":
+                logger.error(f"[PriorityRanker] Failed to parse rankings: {event['message']}")
 
         # Merge rankings with enriched features
         candidates = merge_ranking_with_enriched(enriched_features, rankings)
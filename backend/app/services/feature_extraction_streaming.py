@@ -33,11 +33,7 @@ from app.core.ai.prompts.feature_extraction.feature_enricher import (
     FEATURE_ENRICHER_PROMPT,
 )
 from app.services.streaming_agent_executor import stream_with_structured_output
-from app.utils.repository_formatting import (
-    format_file_tree,
-    format_key_files,
-    format_dependencies,
-)
+from app.utils.repository_formatting import get_formatted_sections
 
 logger = logging.getLogger(__name__)
 
@@ -141,6 +137,7 @@ async def execute_feature_extraction_with_streaming(
         if focus_areas:
             user_context_section += f"\n## Focus Areas\n- " + "\n- ".join(focus_areas) + "\n"
 
+        sections = get_formatted_sections(repo_analysis)
         code_analyzer_prompt = CODE_ANALYZER_PROMPT.format(
             owner=repo_analysis.get("owner", "unknown"),
             repo_name=repo_analysis.get("repo_name", "unknown"),
@@ -148,10 +145,10 @@ async def execute_feature_extraction_with_streaming(
             language=repo_analysis.get("language", "unknown"),
             description=repo_analysis.get("description", "(no description)"),
             topics=", ".join(repo_analysis.get("topics", [])) or "(none)",
-            file_tree=format_file_tree(repo_analysis.get("file_tree", [])),
+            file_tree=sections["file_tree"],
             readme_content=repo_analysis.get("readme_content", "(no README)") or "(no README)",
-            key_files_content=format_key_files(repo_analysis.get("key_files", [])),
-            dependencies=format_dependencies(repo_analysis),
+            key_files_content=sections["key_files"],
+            dependencies=sections["dependencies"],
             user_context_section=user_context_section,
         )
 
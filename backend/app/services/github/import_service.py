@@ -17,7 +17,11 @@ from openai import AsyncOpenAI
 
 from app.config import settings
 from app.services.common_operation_handler import get_openai_client
-from app.core.ai.prompts import get_code_analyzer_prompt, get_diagram_planner_prompt
+from app.core.ai.prompts import (
+    CODE_ANALYZER_PROMPT,
+    get_code_analyzer_context,
+    get_diagram_planner_prompt,
+)
 
 from .client import GitHubClient
 from .analyzer import RepositoryAnalyzer
@@ -157,20 +161,22 @@ class GitHubImportService:
         Returns:
             AI analysis result dict
         """
-        # Build prompt with repository context
-        prompt = get_code_analyzer_prompt(repo_analysis.model_dump())
+        # Static instructions as the system message (cacheable prefix),
+        # repository context in the user message
+        context = get_code_analyzer_context(repo_analysis.model_dump())
 
         try:
             response = await self.openai_client.chat.completions.create(
                 model=settings.MODEL_CODE_ANALYZER,
                 messages=[
-                    {"role": "system", "content": prompt},
+                    {"role": "system", "content": CODE_ANALYZER_PROMPT},
                     {
                         "role": "user",
-                        "content": "Analyze this repository and return your analysis as JSON.",
+                        "content": f"{context}\n\nAnalyze this repository and return your analysis as JSON.",
                     },
                 ],
                 response_format={"type": "json_object"},
+                extra_body={"prompt_cache_key": "github-code-analyzer"},
             )
 
             content = response.choices[0].message.content
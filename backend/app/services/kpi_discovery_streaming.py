@@ -45,11 +45,7 @@ from app.services.streaming_agent_executor import (
     stream_with_structured_output,
     stream_without_structured_output,
 )
-from app.utils.repository_formatting import (
-    format_file_tree,
-    format_key_files,
-    format_dependencies,
-)
+from app.utils.repository_formatting import get_formatted_sections
 
 logger = logging.getLogger(__name__)
 
@@ -202,6 +198,7 @@ async def execute_kpi_discovery_with_streaming(
 
         user_context_section = f"\n## User Guidance\n{user_context}\n" if user_context else ""
 
+        sections = get_formatted_sections(repo_analysis)
         domain_analyzer_prompt = DOMAIN_ANALYZER_PROMPT.format(
             owner=repo_analysis.get("owner", "unknown"),
             repo_name=repo_analysis.get("repo_name", "unknown"),
@@ -209,8 +206,8 @@ async def execute_kpi_discovery_with_streaming(
             language=repo_analysis.get("language", "unknown"),
             topics=", ".join(repo_analysis.get("topics", [])) or "(none)",
             readme_content=repo_analysis.get("readme_content", "(no README)") or "(no README)",
-            key_files_content=format_key_files(repo_analysis.get("key_files", [])),
-            dependencies=format_dependencies(repo_analysis),
+            key_files_content=sections["key_files"],
+            dependencies=sections["dependencies"],
             user_context_section=user_context_section,
         )
 
@@ -329,7 +326,7 @@ async def execute_kpi_discovery_with_streaming(
             owner=repo_analysis.get("owner", "unknown"),
             repo_name=repo_analysis.get("repo_name", "unknown"),
             language=repo_analysis.get("language", "unknown"),
-            file_tree_summary=format_file_tree(repo_analysis.get("file_tree", [])),
+            file_tree_summary=get_formatted_sections(repo_analysis)["file_tree"],
             discovered_kpis=format_discovered_kpis(discovered_kpis),
         )
 
@@ -9,7 +9,6 @@ The pipeline flows: Architect → Component → [Connection ∥ Grouping] → La
 Each agent's reasoning and content is streamed as events for the frontend to display.
 """
 
-import asyncio
 import logging
 from typing import Any, AsyncGenerator, Dict, List, Literal, Optional
 
@@ -26,14 +25,15 @@ from app.core.ai.agent_state import (
     MultiAgentState,
     create_initial_multi_agent_state,
 )
-from app.core.ai.prompts.architect_prompt import get_architect_prompt
-from app.core.ai.prompts.component_prompt import get_component_prompt
+from app.core.ai.prompts.architect_prompt import ARCHITECT_PROMPT, get_architect_context
+from app.core.ai.prompts.component_prompt import COMPONENT_PROMPT, get_component_context
 from app.core.ai.prompts.connection_prompt import get_connection_prompt
 from app.core.ai.prompts.grouping_prompt import get_grouping_prompt
 from app.core.ai.prompts.layout_prompt import get_layout_prompt
 from app.core.ai.prompts.reviewer_prompt import get_reviewer_prompt
 from app.core.ai.prompts.finalizer_prompt import get_finalizer_prompt
-from app.models.operations import DiagramContext
+from app.core.ai.streaming.base import merge_async_generators
+from app.models.operations import parse_diagram_context
 from app.services.streaming_agent_executor import (
     stream_with_structured_output,
     stream_without_structured_output,
@@ -108,13 +108,11 @@ async def execute_multi_agent_with_streaming(
     """
     logger.info(f"[MultiAgentStream] Starting {module_type} pipeline")
 
-    # Build diagram context
-    diagram_context = None
-    if context:
-        try:
-            diagram_context = DiagramContext(**context)
-        except Exception as e:
-            logger.warning(f"[MultiAgentStream] Failed to parse context: {e}")
+    # Build diagram context. The architect prompt only reads node/edge
+    # counts, so skip re-validating every node
+    diagram_context = parse_diagram_context(context, validate=False)
+    if context and diagram_context is None:
+        logger.warning("[MultiAgentStream] Failed to parse context")
 
     # Initialize state
     state: Dict[str, Any] = {
@@ -135,20 +133,23 @@ async def execute_multi_agent_with_streaming(
         # ===== ARCHITECT AGENT =====
         yield {"type": "agent_start", "agent": "architect", "description": AGENT_DESCRIPTIONS["architect"]}
 
-        architect_prompt = get_architect_prompt(
+        # Static prompt first so it stays a cacheable prefix
+        architect_messages = [{"role": "system", "content": ARCHITECT_PROMPT}]
+        architect_context = get_architect_context(
             context=diagram_context,
             conversation_history=conversation_history or []
         )
+        if architect_context:
+            architect_messages.append({"role": "system", "content": architect_context})
+        architect_messages.append({"role": "user", "content": description})
 
         async for event in stream_with_structured_output(
-            messages=[
-                {"role": "system", "content": architect_prompt},
-                {"role": "user", "content": description}
-            ],
+            messages=architect_messages,
             model=settings.MODEL_ARCHITECT,
             response_model=ArchitecturePlan,
             agent_name="architect",
-            reasoning_effort="medium"
+            reasoning_effort="medium",
+            prompt_cache_key="diagram-architect",
         ):
             if event["type"] == "reasoning":
                 yield event
@@ -171,19 +172,21 @@ async def execute_multi_agent_with_streaming(
         # ===== COMPONENT AGENT =====
         yield {"type": "agent_start", "agent": "component", "description": AGENT_DESCRIPTIONS["component"]}
 
-        component_prompt = get_component_prompt(
+        component_context = get_component_context(
             architecture_plan=state["architecture_plan"]
         )
 
         async for event in stream_with_structured_output(
             messages=[
-                {"role": "system", "content": component_prompt},
+                {"role": "system", "content": COMPONENT_PROMPT},
+                {"role": "system", "content": component_context},
                 {"role": "user", "content": description}
             ],
             model=settings.MODEL_COMPONENT,
             response_model=ComponentListWrapper,
             agent_name="component",
-            reasoning_effort="medium"
+            reasoning_effort="medium",
+            prompt_cache_key="diagram-component",
         ):
             if event["type"] == "reasoning":
                 yield event
@@ -273,7 +276,7 @@ async def execute_multi_agent_with_streaming(
             }
 
         # Run both agents and interleave their outputs
-        async for event in _merge_async_generators(
+        async for event in merge_async_generators(
             run_connection_agent(),
             run_grouping_agent()
         ):
@@ -480,24 +483,3 @@ def build_final_diagram(
         "nodes": nodes + group_nodes,
         "edges": edges
     }
-
-
-async def _merge_async_generators(*generators) -> AsyncGenerator[Dict[str, Any], None]:
-    """Merge multiple async generators, yielding from each as events arrive."""
-    tasks = {}
-    pending = set()
-
-    async def wrap_gen(gen, idx):
-        async for item in gen:
-            yield (idx, item)
-
-    for i, gen in enumerate(generators):
-        task = asyncio.create_task(wrap_gen(gen, i).__anext__())
-        tasks[i] = (gen, wrap_gen(gen, i))
-        pending.add(task)
-
-    # Simplified: just run them sequentially for now
-    # True interleaving requires more complex async handling
-    for gen in generators:
-        async for event in gen:
-            yield event
@@ -26,6 +26,7 @@ from openai.types.responses import (
 from pydantic import BaseModel, ValidationError
 
 from app.core.ai.client import get_openai_client
+from app.core.ai.response_cache import get_response_cache, make_completion_key
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +92,7 @@ async def _stream_with_responses_api(
     model: str,
     agent_name: str,
     reasoning_effort: str,
+    prompt_cache_key: Optional[str] = None,
 ) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Stream using the Responses API (for reasoning models like GPT-5, o1, o3).
@@ -107,6 +109,7 @@ async def _stream_with_responses_api(
 
     reasoning_tokens = 0
     content_tokens = 0
+    extra_body = {"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None
 
     try:
         # Try with reasoning summary enabled
@@ -114,7 +117,8 @@ async def _stream_with_responses_api(
             model=model,
             input=input_text,
             stream=True,
-            reasoning={"effort": reasoning_effort, "summary": "concise"}
+            reasoning={"effort": reasoning_effort, "summary": "concise"},
+            extra_body=extra_body,
         )
     except Exception as e:
         # If summary fails (org not verified), try without summary
@@ -125,7 +129,8 @@ async def _stream_with_responses_api(
                 model=model,
                 input=input_text,
                 stream=True,
-                reasoning={"effort": reasoning_effort}
+                reasoning={"effort": reasoning_effort},
+                extra_body=extra_body,
             )
         else:
             raise
@@ -173,6 +178,7 @@ async def _stream_with_chat_api(
     messages: List[Dict[str, str]],
     model: str,
     agent_name: str,
+    prompt_cache_key: Optional[str] = None,
 ) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Stream using the Chat Completions API (for non-reasoning models like GPT-4o).
@@ -183,7 +189,8 @@ async def _stream_with_chat_api(
         model=model,
         messages=messages,
         stream=True,
-        response_format={"type": "json_object"}
+        response_format={"type": "json_object"},
+        extra_body={"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None,
     )
 
     async for chunk in stream:
@@ -209,6 +216,8 @@ async def stream_with_structured_output(
     response_model: Type[BaseModel],
     agent_name: str = "agent",
     reasoning_effort: str = "medium",
+    prompt_cache_key: Optional[str] = None,
+    use_cache: bool = False,
 ) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Stream an OpenAI completion with reasoning summaries and parse structured output.
@@ -222,6 +231,11 @@ async def stream_with_structured_output(
         response_model: Pydantic model class for parsing the response
         agent_name: Name of the agent for event identification
         reasoning_effort: Reasoning effort level for GPT-5.2 ("low", "medium", "high")
+        prompt_cache_key: Optional OpenAI prompt cache key for requests that
+            share a static prompt prefix
+        use_cache: Reuse the parsed result of an identical earlier request
+            (same model, response model, effort and messages) from the
+            response cache; a hit yields only the "parsed" event
 
     Yields:
         Events with types:
@@ -230,6 +244,19 @@ async def stream_with_structured_output(
         - {"type": "parsed", "agent": str, "data": BaseModel}
         - {"type": "error", "agent": str, "message": str}
     """
+    cache = get_response_cache() if use_cache else None
+    if cache is not None:
+        cache_key = make_completion_key(model, response_model.__name__, reasoning_effort, messages)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"[StreamExecutor] Reusing cached {agent_name} output")
+            yield {
+                "type": "parsed",
+                "agent": agent_name,
+                "data": response_model.model_validate_json(cached)
+            }
+            return
+
     client = get_openai_client()
     content_buffer = ""
     has_reasoning = is_reasoning_model(model)
@@ -245,6 +272,7 @@ async def stream_with_structured_output(
                 model=model,
                 agent_name=agent_name,
                 reasoning_effort=reasoning_effort,
+                prompt_cache_key=prompt_cache_key,
             ):
                 if event["type"] == "content":
                     content_buffer += event["token"]
@@ -256,6 +284,7 @@ async def stream_with_structured_output(
                 messages=messages,
                 model=model,
                 agent_name=agent_name,
+                prompt_cache_key=prompt_cache_key,
             ):
                 if event["type"] == "content":
                     content_buffer += event["token"]
@@ -265,6 +294,8 @@ async def stream_with_structured_output(
         if content_buffer:
             try:
                 parsed = smart_parse_model(content_buffer, response_model, agent_name)
+                if cache is not None:
+                    await cache.set(cache_key, parsed.model_dump_json())
                 yield {
                     "type": "parsed",
                     "agent": agent_name,
@@ -309,6 +340,7 @@ async def stream_without_structured_output(
     model: str,
     agent_name: str = "agent",
     reasoning_effort: str = "medium",
+    prompt_cache_key: Optional[str] = None,
 ) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Stream an OpenAI completion without structured output parsing.
@@ -320,6 +352,8 @@ async def stream_without_structured_output(
         model: Model ID
         agent_name: Name of the agent for event identification
         reasoning_effort: Reasoning effort level for GPT-5
+        prompt_cache_key: Optional OpenAI prompt cache key (see
+            stream_with_structured_output)
 
     Yields:
         Events with types:
@@ -341,6 +375,8 @@ async def stream_without_structured_output(
 
         if has_reasoning:
             request_params["reasoning_effort"] = reasoning_effort
+        if prompt_cache_key:
+            request_params["extra_body"] = {"prompt_cache_key": prompt_cache_key}
 
         stream = await client.chat.completions.create(**request_params)
 
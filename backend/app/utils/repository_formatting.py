@@ -5,14 +5,49 @@ Shared functions for formatting repository analysis data for AI prompts.
 Used by feature_discovery_streaming, feature_extraction_streaming, and kpi_discovery_streaming.
 """
 
-import json
+import re
 from typing import List, Optional
 
+import orjson
+
+from app.utils.token_counter import get_encoding
+
+# Paths that say little about what a project does: tests, lockfiles,
+# vendored and generated output
+NOISE_PATH_PATTERN = re.compile(
+    r"(^|/)(tests?|__tests__|spec|fixtures|node_modules|vendor|dist|build|migrations)/"
+    r"|\.(test|spec)\.[jt]sx?$"
+    r"|\.(lock|map|snap|min\.js)$"
+    r"|(^|/)(package-lock\.json|yarn\.lock|pnpm-lock\.yaml|poetry\.lock)$",
+    re.IGNORECASE,
+)
+
+# Files always kept regardless of relevance: docs, manifests, entry points
+ANCHOR_PATH_PATTERN = re.compile(
+    r"(^|/)(readme\.md|package\.json|requirements\.txt|pyproject\.toml|go\.mod|cargo\.toml"
+    r"|docker-compose\.ya?ml|(main|app|index|server)\.(py|ts|js|go))$",
+    re.IGNORECASE,
+)
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]{3,}")
+
+# Key file contents are cut by tokens, which is what the prompt is billed in.
+# o200k_base (gpt-4o) is the tokenizer of the GPT-5 family too.
+TOKENIZER_MODEL = "gpt-4o"
+KEY_FILE_TOKEN_BUDGET = 500  # Per file, about the old 2000-character cut
+KEY_FILES_TOTAL_TOKEN_BUDGET = 8000  # Whole section, for callers that cap it
+# Characters encoded per budgeted token; no need to tokenize a whole large file
+_CHARS_PER_TOKEN_BOUND = 10
+
 
 def format_file_tree(file_list: List[str], max_items: int = 100) -> str:
     """
     Format file tree for display in AI prompts.
 
+    Noise paths (tests, lockfiles, vendored and generated output) are left
+    out of every prompt that uses the tree, extraction and KPIs included,
+    and counted in a trailing note.
+
     Args:
         file_list: List of file paths
         max_items: Maximum number of files to include
@@ -22,33 +57,103 @@ def format_file_tree(file_list: List[str], max_items: int = 100) -> str:
     """
     if not file_list:
         return "(empty)"
-    files = file_list[:max_items]
+    # Spend the item budget on source paths, not tests/lockfiles/build output
+    relevant = [path for path in file_list if not NOISE_PATH_PATTERN.search(path)]
+    files = relevant[:max_items]
     tree = "\n".join(files)
-    if len(file_list) > max_items:
-        tree += f"\n... and {len(file_list) - max_items} more files"
+    if len(relevant) > max_items:
+        tree += f"\n... and {len(relevant) - max_items} more files"
+    skipped = len(file_list) - len(relevant)
+    if skipped:
+        tree += f"\n({skipped} test, lock and generated files omitted)"
     return tree
 
 
-def format_key_files(key_files: List[dict], max_content_length: int = 2000) -> str:
+def select_relevant_files(
+    key_files: List[dict],
+    query: Optional[str],
+    max_files: int = 20,
+) -> List[dict]:
+    """
+    Pick the key files most worth sending to the model.
+
+    Drops noise (tests, lockfiles, vendored and generated output), always
+    keeps anchors (README, manifests, entry points) outside those paths, then
+    ranks the rest by how many query words appear in the path or the start
+    of the content.
+
+    Args:
+        key_files: List of dicts with 'path' and 'content' keys
+        query: User guidance or repository description to rank against
+        max_files: Maximum number of files to keep
+
+    Returns:
+        Selected files: anchors in their original order, then the rest by
+        relevance (ties keep their original order)
+    """
+    anchors = []
+    candidates = []
+    for f in key_files:
+        path = f.get("path", "")
+        if NOISE_PATH_PATTERN.search(path):
+            continue
+        if ANCHOR_PATH_PATTERN.search(path):
+            anchors.append(f)
+        else:
+            candidates.append(f)
+
+    terms = set(_WORD_PATTERN.findall(query.lower())) if query else set()
+
+    def relevance(f: dict) -> int:
+        text = f"{f.get('path', '')} {(f.get('content') or '')[:2000]}".lower()
+        return len(terms.intersection(_WORD_PATTERN.findall(text)))
+
+    if terms:
+        candidates.sort(key=relevance, reverse=True)  # Stable: ties keep order
+    return (anchors + candidates)[:max_files]
+
+
+def format_key_files(
+    key_files: List[dict],
+    max_tokens: int = KEY_FILE_TOKEN_BUDGET,
+    total_tokens: Optional[int] = None,
+) -> str:
     """
     Format key files content for AI prompts.
 
+    With a section budget, files are taken in the given order (most relevant
+    first) until it is spent and the rest are listed as omitted. Without one,
+    every file is included.
+
     Args:
         key_files: List of dicts with 'path' and 'content' keys
-        max_content_length: Maximum content length per file
+        max_tokens: Maximum content tokens per file
+        total_tokens: Maximum content tokens for all files together (None for no limit)
 
     Returns:
         Formatted key files string
     """
     if not key_files:
         return "(no key files available)"
+    encoding = get_encoding(TOKENIZER_MODEL)
     parts = []
-    for f in key_files:
+    spent = 0
+    for index, f in enumerate(key_files):
         path = f.get("path", "unknown")
         content = f.get("content", "")
         if content:
-            if len(content) > max_content_length:
-                content = content[:max_content_length] + "\n... (truncated)"
+            budget = max_tokens
+            if total_tokens is not None:
+                if spent >= total_tokens:
+                    parts.append(f"({len(key_files) - index} more files omitted)")
+                    break
+                budget = min(budget, total_tokens - spent)
+            head = content[:budget * _CHARS_PER_TOKEN_BOUND]
+            tokens = encoding.encode(head, disallowed_special=())
+            if len(tokens) > budget or len(head) < len(content):
+                tokens = tokens[:budget]
+                content = encoding.decode(tokens) + "\n... (truncated)"
+            spent += len(tokens)
             parts.append(f"### {path}\n```\n{content}\n```")
         else:
             parts.append(f"### {path}\n(content not available)")
@@ -77,10 +182,10 @@ def format_dependencies(
         dev_deps = package_json.get("devDependencies", {})
         if deps:
             parts.append("### package.json dependencies")
-            parts.append(json.dumps(deps, indent=2))
+            parts.append(orjson.dumps(deps, option=orjson.OPT_INDENT_2).decode())
         if include_dev_deps and dev_deps:
             parts.append("### package.json devDependencies")
-            parts.append(json.dumps(dev_deps, indent=2))
+            parts.append(orjson.dumps(dev_deps, option=orjson.OPT_INDENT_2).decode())
 
     requirements = repo_analysis.get("requirements_txt")
     if requirements:
@@ -109,10 +214,35 @@ def format_readme(repo_analysis: dict, max_length: int = 3000) -> str:
     return readme
 
 
+def get_formatted_sections(repo_analysis: dict) -> dict:
+    """
+    Get the formatted file tree, key files and dependencies for a repository.
+
+    Formatting is done once and stored on repo_analysis under "_formatted",
+    so every agent prompt built from the same analysis reuses the strings.
+    Call it where repo_analysis is built to pay the cost at ingest time.
+
+    Args:
+        repo_analysis: Repository analysis dict (updated in place)
+
+    Returns:
+        Dict with formatted strings for file_tree, key_files, dependencies
+    """
+    formatted = repo_analysis.get("_formatted")
+    if formatted is None:
+        formatted = {
+            "file_tree": format_file_tree(repo_analysis.get("file_tree", [])),
+            "key_files": format_key_files(repo_analysis.get("key_files", [])),
+            "dependencies": format_dependencies(repo_analysis),
+        }
+        repo_analysis["_formatted"] = formatted
+    return formatted
+
+
 def format_repo_context(
     repo_analysis: dict,
     max_files: int = 100,
-    max_file_content: int = 2000,
+    max_file_tokens: int = KEY_FILE_TOKEN_BUDGET,
     include_dev_deps: bool = True,
 ) -> dict:
     """
@@ -121,7 +251,7 @@ def format_repo_context(
     Args:
         repo_analysis: Full repository analysis dict
         max_files: Maximum number of files in tree
-        max_file_content: Maximum content length per file
+        max_file_tokens: Maximum content tokens per file
         include_dev_deps: Whether to include devDependencies
 
     Returns:
@@ -134,7 +264,7 @@ def format_repo_context(
         ),
         "key_files": format_key_files(
             repo_analysis.get("key_files", []),
-            max_content_length=max_file_content
+            max_tokens=max_file_tokens
         ),
         "dependencies": format_dependencies(
             repo_analysis,
@@ -0,0 +1,12 @@
+"""
+Shared pytest setup for the backend tests.
+
+Puts the backend root on sys.path so `app` imports resolve, and gives
+Settings the one value it requires so no real key is needed.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
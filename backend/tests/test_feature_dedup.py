@@ -0,0 +1,84 @@
+"""Tests for embedding-based feature deduplication."""
+
+import asyncio
+import math
+import random
+from types import SimpleNamespace
+
+from app.core.ai.feature_discovery.dedup import dedupe_similar_features, find_cluster_leaders
+
+DIMENSIONS = 1536  # text-embedding-3-small
+
+
+def _unit(vector):
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector]
+
+
+def _near_copy(vector, rng):
+    return _unit([x + rng.gauss(0, 0.002) for x in vector])
+
+
+def _feature_lists(rng):
+    """15 discovered, 15 gap and 15 tech debt features; 5 gap and 3 tech debt repeat a discovered one."""
+    discovered = [(f"Discovered {i}", _unit([rng.gauss(0, 1) for _ in range(DIMENSIONS)])) for i in range(15)]
+    gap = [(f"Gap {i}", _near_copy(discovered[i][1], rng)) for i in range(5)]
+    gap += [(f"Gap {i}", _unit([rng.gauss(0, 1) for _ in range(DIMENSIONS)])) for i in range(5, 15)]
+    tech_debt = [(f"Debt {i}", _near_copy(discovered[10 + i][1], rng)) for i in range(3)]
+    tech_debt += [(f"Debt {i}", _unit([rng.gauss(0, 1) for _ in range(DIMENSIONS)])) for i in range(3, 15)]
+    return discovered, gap, tech_debt
+
+
+def _client(vectors):
+    async def create(model, input):
+        assert len(input) == len(vectors)
+        # Returned out of order; dedupe must sort by index
+        data = [SimpleNamespace(index=i, embedding=v) for i, v in enumerate(vectors)]
+        return SimpleNamespace(data=list(reversed(data)))
+
+    return SimpleNamespace(embeddings=SimpleNamespace(create=create))
+
+
+def test_find_cluster_leaders_keeps_first_member():
+    a = _unit([1.0, 0.0, 0.0])
+    b = _unit([0.0, 1.0, 0.0])
+    assert find_cluster_leaders([a, b, a, _unit([1.0, 0.01, 0.0])], 0.95) == [True, True, False, False]
+
+
+def test_dedupe_merges_repeats_across_45_features():
+    lists = _feature_lists(random.Random(7))
+    vectors = [v for group in lists for _, v in group]
+    feature_lists = [[{"title": title} for title, _ in group] for group in lists]
+
+    discovered, gap, tech_debt = asyncio.run(
+        dedupe_similar_features(_client(vectors), feature_lists, threshold=0.85)
+    )
+
+    assert len(discovered) == 15
+    assert [f["title"] for f in gap] == [f"Gap {i}" for i in range(5, 15)]
+    assert [f["title"] for f in tech_debt] == [f"Debt {i}" for i in range(3, 15)]
+
+
+def test_dedupe_leaves_the_event_loop_free():
+    lists = _feature_lists(random.Random(11))
+    vectors = [v for group in lists for _, v in group]
+    feature_lists = [[{"title": title} for title, _ in group] for group in lists]
+
+    async def main():
+        done = False
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticking = asyncio.create_task(ticker())
+        await dedupe_similar_features(_client(vectors), feature_lists, threshold=0.85)
+        done = True
+        await ticking
+        return ticks
+
+    # The similarity pass runs in a thread, so other tasks keep running meanwhile
+    assert asyncio.run(main()) > 0
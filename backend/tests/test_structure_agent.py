@@ -0,0 +1,82 @@
+"""Tests for the combined connection and grouping structure agent."""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.core.ai.agent_state import ComponentSpec, ConnectionSpec
+from app.core.ai.agents import structure
+from app.core.ai.agents.grouping import get_grouping_effort
+
+
+class _NoCache:
+    """Response cache stand-in that never hits."""
+
+    async def get(self, key):
+        return None
+
+    async def set(self, key, value, ttl_seconds=None):
+        pass
+
+
+def _components(count):
+    return [
+        ComponentSpec(
+            id=f"node_{i}",
+            nodeType="service",
+            label=f"Service {i}",
+            tags=["FastAPI"],
+            description="Handles one slice of the domain",
+            suggested_layer=3,
+        )
+        for i in range(count)
+    ]
+
+
+def _run(monkeypatch, components, complete):
+    monkeypatch.setattr(structure, "get_response_cache", lambda: _NoCache())
+    monkeypatch.setattr(structure, "get_openai_client", lambda: object())
+    monkeypatch.setattr(structure, "stream_structured_completion", complete)
+    state = {"components": components, "architecture_plan": None, "review_iterations": 0}
+    return asyncio.run(structure.structure_agent(state))
+
+
+def test_minimal_effort_structure_call_has_no_token_cap(monkeypatch):
+    # 9 components: the largest diagram in the "minimal" effort band
+    components = _components(9)
+    assert get_grouping_effort(len(components)) == "minimal"
+
+    connections = [
+        ConnectionSpec(
+            id=f"edge_{i}",
+            source=f"node_{i}",
+            target=f"node_{(i + 1) % 9}",
+            label="REST",
+            rationale="Synchronous request/response call between the two services " * 4,
+        )
+        for i in range(9)
+    ]
+    calls = []
+
+    async def complete(client, **kwargs):
+        calls.append(kwargs)
+        parsed = structure.ConnectionsAndGroupsResponse(connections=connections, groups=[])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(parsed=parsed))])
+
+    result = _run(monkeypatch, components, complete)
+
+    assert calls[0]["reasoning_effort"] == "minimal"
+    assert "max_completion_tokens" not in calls[0]
+    assert result["connections"] == connections
+    assert "warnings" not in result
+
+
+def test_fallback_reports_the_same_agent_keys(monkeypatch):
+    async def complete(client, **kwargs):
+        raise RuntimeError("model unavailable")
+
+    result = _run(monkeypatch, _components(6), complete)
+
+    assert result["current_agent"] == "structure"
+    assert result["agent_history"] == ["connection", "grouping"]
+    assert result["groups"] == []
+    assert result["warnings"] == ["Structure fallback used: model unavailable"]
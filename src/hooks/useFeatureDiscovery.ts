@@ -137,6 +137,18 @@ export function useFeatureDiscovery(): UseFeatureDiscoveryResult {
         // Could be used for real-time preview, but we'll wait for complete
         break
 
+      case 'feature_ranked': {
+        // Ranked candidates arrive one by one; 'complete' replaces the list
+        const feature = event.feature
+        if (!feature) break
+        setState(prev => ({
+          ...prev,
+          candidates: [...prev.candidates, { ...feature, selected: true }]
+            .sort((a, b) => b.priority_score - a.priority_score),
+        }))
+        break
+      }
+
       case 'complete': {
         // Select all features by default
         const candidatesWithSelection = (event.features || []).map(f => ({
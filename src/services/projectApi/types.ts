@@ -372,7 +372,7 @@ export interface CandidateFeature {
 }
 
 export interface FeatureDiscoveryEvent {
-  type: 'agent_start' | 'reasoning' | 'content' | 'agent_complete' | 'feature_preview' | 'progress' | 'complete' | 'error'
+  type: 'agent_start' | 'reasoning' | 'content' | 'agent_complete' | 'feature_preview' | 'feature_ranked' | 'progress' | 'complete' | 'error'
   agent?: string
   description?: string
   token?: string
@@ -382,6 +382,7 @@ export interface FeatureDiscoveryEvent {
   temp_id?: string
   title?: string
   category?: string
+  feature?: CandidateFeature
   features?: CandidateFeature[]
   total?: number
   message?: string